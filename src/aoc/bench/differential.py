@@ -0,0 +1,200 @@
+import tempfile
+from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from aoc.bench import generators
+from aoc.runner import Day
+
+
+def keep_lines(text: str) -> list[str]:
+    return text.splitlines(keepends=True)
+
+
+def join_lines(pieces: list[str]) -> str:
+    return "".join(pieces)
+
+
+@dataclass(frozen=True)
+class Pair:
+    """A reference implementation and a candidate that must agree with it.
+
+    Both are named by their attribute in the day's solution module, and are called
+    with the parsed input. With a `part`, they are instead the names of two variants
+    of the day's solvers (see `Solution.variants`), which solve that part. Shrinking
+    drops the pieces `split` cuts an input into (by default, its lines) and puts the
+    rest back together with `join`.
+    """
+
+    day: Day
+    reference: str
+    candidate: str
+    part: int | None = None
+    split: Callable[[str], list] = keep_lines
+    join: Callable[[list], str] = join_lines
+
+    def __str__(self) -> str:
+        part = "" if self.part is None else f" part{self.part}"
+        return f"{self.day}{part} {self.reference} vs {self.candidate}"
+
+
+PAIRS: list[Pair] = []
+
+
+def pair(year: int, day: int, reference: str, candidate: str, **kwargs) -> Pair:
+    """Register `candidate` to be checked against `reference` on a day's inputs."""
+    registered = Pair(Day(year, day), reference, candidate, **kwargs)
+    PAIRS.append(registered)
+
+    return registered
+
+
+def outcome(func: Callable, data: Any) -> tuple[str, Any]:
+    """Return what calling `func` on `data` came to: a value, or a type of error.
+
+    A generator is run to the end, so that lazy implementations can be compared.
+    """
+    try:
+        value = func(data)
+        if isinstance(value, Iterator):
+            value = list(value)
+        return ("value", value)
+    except Exception as e:
+        return ("error", type(e).__name__)
+
+
+@dataclass
+class Mismatch:
+    """The first input on which a pair disagreed, and that input shrunk."""
+
+    pair: Pair
+    seed: int
+    text: str
+    shrunk: str
+    outcomes: tuple[tuple[str, Any], tuple[str, Any]] = field(repr=False)
+
+    def __str__(self) -> str:
+        reference, candidate = self.outcomes
+        return "\n".join(
+            [
+                f"{self.pair}: MISMATCH on seed {self.seed}, shrunk from "
+                f"{len(self.text)} to {len(self.shrunk)} characters:",
+                self.shrunk.rstrip("\n"),
+                f"{self.pair.reference}: {reference[1]!r}",
+                f"{self.pair.candidate}: {candidate[1]!r}",
+            ]
+        )
+
+
+def compare(pair: Pair, text: str) -> tuple[tuple[str, Any], tuple[str, Any]]:
+    """Return the outcomes of the reference and the candidate of `pair` on `text`.
+
+    An input that doesn't parse has the same outcome, the parse error, for both.
+    """
+    solution = pair.day.solution()
+    module = pair.day.load()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.write(text)
+        file.flush()
+        parsed = outcome(solution.parse, Path(file.name))
+    if parsed[0] == "error":
+        return parsed, parsed
+
+    def implementation(name: str) -> Callable:
+        if pair.part is None:
+            return getattr(module, name)
+        return partial(solution.using(name).solve, pair.part)
+
+    data = parsed[1]
+    return tuple(
+        outcome(implementation(name), deepcopy(data) if solution.mutates else data)
+        for name in (pair.reference, pair.candidate)
+    )
+
+
+def differs(pair: Pair, text: str) -> bool:
+    reference, candidate = compare(pair, text)
+    return reference != candidate
+
+
+def ddmin(pieces: list, fails: Callable[[list], bool]) -> list:
+    """Shrink the failing `pieces` to a subset that still fails, by delta debugging.
+
+    Tries ever smaller chunks of the pieces, and what's left without each chunk, and
+    carries on from the first that still fails. The result is 1-minimal: removing any
+    single piece from it makes it pass.
+
+    Args:
+        pieces (list): the pieces of a failing input
+        fails (Callable[[list], bool]): whether some of the pieces still fail
+
+    Returns:
+        list: the pieces that are left
+    """
+    n = 2
+    while len(pieces) >= 2:
+        size = -(-len(pieces) // n)
+        starts = range(0, len(pieces), size)
+        chunks = [pieces[i : i + size] for i in starts]
+        rests = [pieces[:i] + pieces[i + size :] for i in starts]
+
+        if found := next((c for c in chunks if fails(c)), None):
+            pieces, n = found, 2
+        elif found := next((r for r in rests if n > 2 and fails(r)), None):
+            pieces, n = found, max(n - 1, 2)
+        elif n < len(pieces):
+            n = min(2 * n, len(pieces))
+        else:
+            break
+
+    return pieces
+
+
+def shrink(pair: Pair, text: str) -> str:
+    """Return the smallest input `ddmin` finds on which `pair` still disagrees."""
+    pieces = ddmin(pair.split(text), lambda pieces: differs(pair, pair.join(pieces)))
+
+    return pair.join(pieces)
+
+
+def check(
+    pair: Pair, trials: int = 100, scale: int = 1, seed: int = 0
+) -> Mismatch | None:
+    """Feed the reference and candidate of `pair` the same synthetic inputs.
+
+    Args:
+        pair (Pair): the implementations to compare
+        trials (int): the number of inputs, with seeds from `seed` up
+        scale (int): the scale of the inputs (see `generators.generate`)
+        seed (int): the first seed
+
+    Returns:
+        Mismatch | None: the first input they disagreed on, shrunk, or None
+    """
+    for s in range(seed, seed + trials):
+        text = generators.generate(pair.day, scale, s)
+        outcomes = compare(pair, text)
+        if outcomes[0] != outcomes[1]:
+            shrunk = shrink(pair, text)
+            return Mismatch(pair, s, text, shrunk, compare(pair, shrunk))
+
+    return None
+
+
+def races(text: str) -> list[tuple[str, str]]:
+    times, dists = (line.split()[1:] for line in text.splitlines())
+    return list(zip(times, dists))
+
+
+def join_races(pieces: list[tuple[str, str]]) -> str:
+    times = " ".join(time for time, _ in pieces)
+    dists = " ".join(dist for _, dist in pieces)
+    return f"Time: {times}\nDistance: {dists}\n"
+
+
+pair(2023, 6, "wins_slow", "wins_fast", split=races, join=join_races)
+pair(2023, 17, "heap", "bucket", part=1)
+pair(2023, 17, "heap", "bucket", part=2)
@@ -0,0 +1,641 @@
+import random
+import string
+from itertools import accumulate, product
+from pathlib import Path
+from typing import Callable
+
+from aoc.runner import Day
+
+# A generator returns the text of a valid input for its day, given a seeded random
+# number generator and a scale factor (see `generate`).
+Generator = Callable[[random.Random, int], str]
+
+GENERATORS: dict[Day, Generator] = {}
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    """Register the decorated function as the input generator for a day."""
+
+    def register(func: Generator) -> Generator:
+        GENERATORS[Day(year, day)] = func
+        return func
+
+    return register
+
+
+def generate(day: Day, scale: int = 1, seed: int = 0) -> str:
+    """Return a synthetic input for `day`.
+
+    At scale 1, an input is about the size of the day's examples; each size the
+    generator varies (such as the side of a grid or the number of lines) grows in
+    proportion to `scale`. The same day, scale and seed always give the same input.
+
+    Args:
+        day (Day): the day to generate an input for
+        scale (int): the scale factor, at least 1
+        seed (int): the seed for the random number generator
+
+    Returns:
+        str: the input text
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"no input generator for {day}")
+    if scale < 1:
+        raise ValueError(f"scale must be at least 1: {scale}")
+
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+def write(day: Day, path: Path, scale: int = 1, seed: int = 0) -> Path:
+    """Write a synthetic input for `day` to `path` (see `generate`)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate(day, scale, seed))
+
+    return path
+
+
+def lines(rows) -> str:
+    return "".join(f"{row}\n" for row in rows)
+
+
+def grid(rng: random.Random, rows: int, cols: int, weights: dict[str, float]) -> list:
+    """Return a grid of random characters drawn with the given weights."""
+    chars, cum = list(weights), list(accumulate(weights.values()))
+    return ["".join(rng.choices(chars, cum_weights=cum, k=cols)) for _ in range(rows)]
+
+
+def names(rng: random.Random, count: int, length: int, alphabet: str) -> list[str]:
+    """Return `count` distinct random names of `length` characters from `alphabet`."""
+    if count > len(alphabet) ** length:
+        raise ValueError(f"too many names of length {length}: {count}")
+
+    found = set()
+    while len(found) < count:
+        found.add("".join(rng.choices(alphabet, k=length)))
+
+    return rng.sample(sorted(found), count)
+
+
+def skyline(
+    rng: random.Random, columns: int, width: int, height: int
+) -> list[tuple[str, int]]:
+    """Return the edges of a random, simple, clockwise rectilinear loop.
+
+    The loop encloses a "skyline" of `columns` columns hanging from a flat top edge,
+    each 1 to `width` wide and 1 to `height` tall, with adjacent columns of different
+    heights. So every corner is distinct and there are always 2 * columns + 2 edges.
+
+    Returns:
+        list[tuple[str, int]]: the (direction, length) of each edge, starting
+            eastward from the top-left corner, where direction is one of "URDL"
+    """
+    if height < 2:
+        raise ValueError(f"height must be at least 2: {height}")
+
+    widths = [rng.randint(1, width) for _ in range(columns)]
+    heights = [rng.randint(1, height)]
+    while len(heights) < columns:
+        h = rng.randint(1, height)
+        if h != heights[-1]:
+            heights.append(h)
+
+    edges = [("R", sum(widths)), ("D", heights[-1])]
+    for j in reversed(range(columns)):
+        edges.append(("L", widths[j]))
+        if j > 0:
+            dy = heights[j - 1] - heights[j]
+            edges.append(("D" if dy > 0 else "U", abs(dy)))
+    edges.append(("U", heights[0]))
+
+    return edges
+
+
+STEPS = {"U": (-1, 0), "R": (0, 1), "D": (1, 0), "L": (0, -1)}
+
+
+@generator(2023, 1)
+def d01(rng: random.Random, scale: int) -> str:
+    """Lines of letters, digits and spelled-out digits (4 * scale lines)."""
+    words = "one two three four five six seven eight nine".split()
+
+    def line():
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(2, 8)):
+            match rng.random():
+                case r if r < 0.3:
+                    tokens.append(str(rng.randint(1, 9)))
+                case r if r < 0.6:
+                    tokens.append(rng.choice(words))
+                case _:
+                    tokens.append("".join(rng.choices(string.ascii_lowercase, k=2)))
+        rng.shuffle(tokens)
+        return "".join(tokens)
+
+    return lines(line() for _ in range(4 * scale))
+
+
+@generator(2023, 2)
+def d02(rng: random.Random, scale: int) -> str:
+    """Games of up to 10 rounds of cube draws (5 * scale games)."""
+    colors = ["red", "green", "blue"]
+
+    def game():
+        rounds = []
+        for _ in range(rng.randint(1, 10)):
+            drawn = rng.sample(colors, rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 15)} {c}" for c in drawn))
+        return "; ".join(rounds)
+
+    return lines(f"Game {g}: {game()}" for g in range(1, 5 * scale + 1))
+
+
+@generator(2023, 3)
+def d03(rng: random.Random, scale: int) -> str:
+    """A schematic of part numbers and symbols (a 10 * scale square)."""
+    size = 10 * scale
+    symbols = "*#+$/@=%&-"
+
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            if rng.random() < 0.25:
+                row += str(rng.randint(1, 999)) + "."
+            elif rng.random() < 0.15:
+                row += rng.choice(symbols)
+            else:
+                row += "."
+        rows.append(row[:size])
+
+    return lines(rows)
+
+
+@generator(2023, 4)
+def d04(rng: random.Random, scale: int) -> str:
+    """Scratchcards of 5 winning and 8 held numbers (6 * scale cards)."""
+    cards = 6 * scale
+
+    def numbers(values):
+        return " ".join(f"{v:>2}" for v in values)
+
+    rows = []
+    for card in range(1, cards + 1):
+        want = rng.sample(range(1, 100), 5)
+        rest = rng.sample(sorted(set(range(1, 100)) - set(want)), 8)
+        wins = rng.randint(0, 5)
+        have = want[:wins] + rest[: 8 - wins]
+        rng.shuffle(have)
+        rows.append(
+            f"Card {card:>{len(str(cards))}}: {numbers(want)} | {numbers(have)}"
+        )
+
+    return lines(rows)
+
+
+@generator(2023, 5)
+def d05(rng: random.Random, scale: int) -> str:
+    """An almanac of 2 * scale seed ranges and 7 maps of 3 * scale ranges each."""
+    limit = 2**32
+    kinds = "seed soil fertilizer water light temperature humidity location".split()
+
+    seeds = []
+    for _ in range(2 * scale):
+        start = rng.randrange(limit // 2)
+        seeds += [start, rng.randint(1, limit // 64)]
+
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    for src, dst in zip(kinds, kinds[1:]):
+        # cut the value space into non-overlapping source ranges
+        cuts = sorted(rng.sample(range(limit), 6 * scale))
+        ranges = []
+        for lo, hi in zip(cuts[::2], cuts[1::2]):
+            ranges.append(f"{rng.randrange(limit - (hi - lo))} {lo} {hi - lo}")
+        rng.shuffle(ranges)
+        sections.append("\n".join([f"{src}-to-{dst} map:", *ranges]))
+
+    return "\n\n".join(sections) + "\n"
+
+
+@generator(2023, 6)
+def d06(rng: random.Random, scale: int) -> str:
+    """Four races of up to 100 * scale milliseconds."""
+    while True:
+        times, dists = [], []
+        for _ in range(4):
+            time = rng.randint(7, 100 * scale)
+            hold = rng.randint(1, time // 2 - 1)
+            times.append(time)
+            dists.append(hold * (time - hold))
+
+        # the concatenated race of part 2 must be winnable, too
+        time = int("".join(map(str, times)))
+        dist = int("".join(map(str, dists)))
+        if 4 * dist < time * time - 4 * time:
+            break
+
+    width = max(len(str(v)) for v in times + dists) + 1
+    return lines(
+        [
+            f"{'Time:':<9}" + "".join(f"{t:>{width}}" for t in times),
+            f"{'Distance:':<9}" + "".join(f"{d:>{width}}" for d in dists),
+        ]
+    )
+
+
+@generator(2023, 7)
+def d07(rng: random.Random, scale: int) -> str:
+    """Camel Cards hands and bids (5 * scale hands)."""
+    cards = "23456789TJQKA"
+    return lines(
+        f"{''.join(rng.choices(cards, k=5))} {rng.randint(1, 1000)}"
+        for _ in range(5 * scale)
+    )
+
+
+@generator(2023, 8)
+def d08(rng: random.Random, scale: int) -> str:
+    """A network of 6 looping paths and 5 * scale turns.
+
+    Each path from a node ending in A reaches a node ending in Z after some multiple
+    of the number of turns, then loops back to the same Z node after the same number
+    of steps, so that part 2's least common multiple is the answer.
+    """
+    turns = "".join(rng.choices("LR", k=5 * scale))
+    primes = [p for p in range(3, 60) if all(p % q for q in range(2, p))]
+    lengths = [len(turns) * p for p in rng.sample(primes, 6)]
+
+    alphabet = string.digits + string.ascii_uppercase
+    middle = alphabet.replace("A", "").replace("Z", "")
+    pool = [a + b + c for a, b, c in product(alphabet, alphabet, middle)]
+    if sum(lengths) > len(pool):
+        raise ValueError(f"scale too large for 3-character node names: {scale}")
+    inner = iter(rng.sample(pool, sum(lengths)))
+
+    ends = ["AA", *names(rng, 5, 2, middle)]
+    nodes = {}
+    for end, length in zip(ends, lengths):
+        first, last = f"{end}A", "ZZZ" if end == "AA" else f"{end}Z"
+        path = [next(inner) for _ in range(length - 1)]
+        # left and right lead the same way, so every turn follows the path
+        for lhs, rhs in zip([first, *path, last], [*path, last, path[0]]):
+            nodes[lhs] = rhs
+
+    rows = [f"{k} = ({v}, {v})" for k, v in nodes.items()]
+    rng.shuffle(rows)
+
+    return f"{turns}\n\n" + lines(rows)
+
+
+@generator(2023, 9)
+def d09(rng: random.Random, scale: int) -> str:
+    """Polynomial sequences of 21 values (10 * scale sequences)."""
+
+    def sequence():
+        # build up from a constant difference, one level at a time
+        values = [rng.randint(-5, 5)] * 21
+        for _ in range(rng.randint(0, 5)):
+            values = list(accumulate(values, initial=rng.randint(-20, 20)))[:21]
+        return " ".join(map(str, values))
+
+    return lines(sequence() for _ in range(10 * scale))
+
+
+@generator(2023, 10)
+def d10(rng: random.Random, scale: int) -> str:
+    """A loop of pipes among junk pipes (a skyline of 4 * scale columns)."""
+    pipes = {
+        frozenset("UD"): "|",
+        frozenset("LR"): "-",
+        frozenset("UR"): "L",
+        frozenset("UL"): "J",
+        frozenset("DL"): "7",
+        frozenset("DR"): "F",
+    }
+    opposite = {"U": "D", "D": "U", "L": "R", "R": "L"}
+
+    # walk the loop one tile at a time, noting the direction of each step
+    loop, steps = [(0, 0)], []
+    for d, n in skyline(rng, 4 * scale, 3, 4 * scale):
+        for _ in range(n):
+            dy, dx = STEPS[d]
+            loop.append((loop[-1][0] + dy, loop[-1][1] + dx))
+            steps.append(d)
+    loop.pop()
+
+    rows = max(y for y, _ in loop) + 3
+    cols = max(x for _, x in loop) + 3
+    tiles = [list(row) for row in grid(rng, rows, cols, dict.fromkeys("|-LJ7F.", 1))]
+
+    # a tile connects back to where it came from and on to where it goes next
+    for i, (y, x) in enumerate(loop):
+        tiles[y + 1][x + 1] = pipes[frozenset([opposite[steps[i - 1]], steps[i]])]
+
+    # junk next to the start could look like part of the loop, so clear it
+    y, x = rng.choice(loop)
+    tiles[y + 1][x + 1] = "S"
+    for dy, dx in STEPS.values():
+        if (y + dy, x + dx) not in loop:
+            tiles[y + dy + 1][x + dx + 1] = "."
+
+    return lines("".join(row) for row in tiles)
+
+
+@generator(2023, 11)
+def d11(rng: random.Random, scale: int) -> str:
+    """An image of galaxies with some empty rows and columns (a 10 * scale square)."""
+    size = 10 * scale
+    image = [list(row) for row in grid(rng, size, size, {".": 0.9, "#": 0.1})]
+
+    for y in rng.sample(range(size), size // 5):
+        image[y] = ["."] * size
+    for x in rng.sample(range(size), size // 5):
+        for row in image:
+            row[x] = "."
+
+    return lines("".join(row) for row in image)
+
+
+@generator(2023, 12)
+def d12(rng: random.Random, scale: int) -> str:
+    """Rows of springs with runs of unknowns (6 * scale rows of up to 10 + 2 * scale).
+
+    Rows are capped at 150 springs, since part 2 recurses once per spring of the
+    unfolded row.
+    """
+    longest = min(10 + 2 * scale, 150)
+
+    def row():
+        springs = "." * rng.randint(0, 2)
+        groups = []
+        while len(springs) < longest - 2:
+            groups.append(rng.randint(1, min(6, longest - len(springs) - 1)))
+            springs += "#" * groups[-1] + "." * rng.randint(1, 3)
+        springs = list(springs[:longest])
+
+        # hide a few runs of springs, long and short, behind unknowns
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(len(springs))
+            j = min(len(springs), i + rng.randint(1, len(springs) // 2 + 1))
+            springs[i:j] = "?" * (j - i)
+
+        return f"{''.join(springs)} {','.join(map(str, groups))}"
+
+    return lines(row() for _ in range(6 * scale))
+
+
+def mirror_errors(pattern: list[str], i: int) -> int:
+    """Return the number of tiles that differ when reflecting across column `i`."""
+    count = 0
+    for row in pattern:
+        lhs, rhs = row[:i][::-1], row[i:]
+        count += sum(a != b for a, b in zip(lhs, rhs))
+    return count
+
+
+def reflections(pattern: list[str], errors: int) -> list[int]:
+    """Return the lines of reflection (as in part 1's summary) with `errors` errors."""
+    transposed = ["".join(col) for col in zip(*pattern)]
+    found = [
+        i for i in range(1, len(pattern[0])) if mirror_errors(pattern, i) == errors
+    ]
+    for i in range(1, len(pattern)):
+        if mirror_errors(transposed, i) == errors:
+            found.append(100 * i)
+    return found
+
+
+@generator(2023, 13)
+def d13(rng: random.Random, scale: int) -> str:
+    """Patterns of ash and rocks (2 * scale patterns of up to 6 + 2 * scale square).
+
+    Each pattern has exactly one perfect line of reflection and, with one smudge
+    fixed, exactly one other.
+    """
+
+    def pattern():
+        half = rng.randint(2, 3 + scale)
+        extra = rng.randint(0, half - 1)
+        width = rng.randint(5, 6 + 2 * scale)
+        line = rng.choice([i for i in range(1, width) if 2 * i != width])
+        reach = min(line, width - line)
+
+        # every row is reflected across the vertical line...
+        rows = []
+        for _ in range(2 * half + extra):
+            row = rng.choices(".#", k=width)
+            row[line : line + reach] = row[line - reach : line][::-1]
+            rows.append(row)
+
+        # ...and the first 2 * half rows across a horizontal line, too
+        rows[half : 2 * half] = [row[:] for row in rows[:half][::-1]]
+        if rng.random() < 0.5:
+            rows.reverse()
+            mirrored = range(extra, len(rows))
+        else:
+            mirrored = range(2 * half)
+
+        # a smudge outside the reach of the vertical line only spoils the other one
+        y = rng.choice(mirrored)
+        x = rng.choice(
+            [x for x in range(width) if not line - reach <= x < line + reach]
+        )
+        rows[y][x] = "#" if rows[y][x] == "." else "."
+
+        rows = ["".join(row) for row in rows]
+        if rng.random() < 0.5:
+            rows = ["".join(col) for col in zip(*rows)]
+
+        return rows
+
+    patterns = []
+    while len(patterns) < 2 * scale:
+        p = pattern()
+        if len(reflections(p, 0)) == 1 and len(reflections(p, 1)) == 1:
+            patterns.append("\n".join(p))
+
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator(2023, 14)
+def d14(rng: random.Random, scale: int) -> str:
+    """A platform of round and cube rocks (a 10 * scale square)."""
+    size = 10 * scale
+    return lines(grid(rng, size, size, {".": 0.65, "O": 0.2, "#": 0.15}))
+
+
+@generator(2023, 15)
+def d15(rng: random.Random, scale: int) -> str:
+    """An initialization sequence of 11 * scale steps over 4 * scale labels."""
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(4 * scale)
+    ]
+
+    steps = []
+    for _ in range(11 * scale):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+
+    return ",".join(steps) + "\n"
+
+
+@generator(2023, 16)
+def d16(rng: random.Random, scale: int) -> str:
+    """A contraption of mirrors and splitters (a 10 * scale square)."""
+    size = 10 * scale
+    weights = {".": 0.85, "/": 0.0375, "\\": 0.0375, "|": 0.0375, "-": 0.0375}
+    return lines(grid(rng, size, size, weights))
+
+
+@generator(2023, 17)
+def d17(rng: random.Random, scale: int) -> str:
+    """A map of heat loss digits (a 13 * scale square)."""
+    size = 13 * scale
+    return lines(grid(rng, size, size, dict.fromkeys("123456789", 1)))
+
+
+@generator(2023, 18)
+def d18(rng: random.Random, scale: int) -> str:
+    """A dig plan of 14 * scale + 2 edges (for both parts).
+
+    Part 1's loop has edges of up to 10 meters; part 2's, encoded in the colors, up to
+    hundreds of thousands.
+    """
+    columns = 7 * scale
+    small = skyline(rng, columns, 6, 10)
+    large = skyline(rng, columns, 0xFFFFF // columns, 0xFFFFF)
+    codes = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+    return lines(
+        f"{d} {n} (#{m:05x}{codes[e]})" for (d, n), (e, m) in zip(small, large)
+    )
+
+
+@generator(2023, 19)
+def d19(rng: random.Random, scale: int) -> str:
+    """A tree of 11 * scale workflows and 5 * scale parts.
+
+    Every condition splits the ratings that reach it in two non-empty ranges, since
+    part 2 can't count an empty range.
+    """
+    count = 11 * scale
+    alphabet = string.ascii_lowercase
+    pool = iter(n for n in names(rng, count + 1, 3, alphabet) if n != "in")
+
+    workflows = {}
+    queue = [("in", {k: (1, 4000) for k in "xmas"})]
+    made = 1
+
+    def target(blocks):
+        nonlocal made
+        # branch to a new workflow at random, or whenever the tree would stop short
+        if made < count and (not queue or rng.random() < 0.6):
+            made += 1
+            queue.append((next(pool), blocks))
+            return queue[-1][0]
+        return rng.choice("AR")
+
+    while queue:
+        name, blocks = queue.pop(rng.randrange(len(queue)))
+
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            keys = [k for k, (lo, hi) in blocks.items() if lo < hi]
+            if not keys:
+                break
+
+            key = rng.choice(keys)
+            lo, hi = blocks[key]
+            if rng.random() < 0.5:
+                value = rng.randint(lo + 1, hi)
+                match, rest = (lo, value - 1), (value, hi)
+                cond = f"{key}<{value}"
+            else:
+                value = rng.randint(lo, hi - 1)
+                match, rest = (value + 1, hi), (lo, value)
+                cond = f"{key}>{value}"
+
+            rules.append(f"{cond}:{target(blocks | {key: match})}")
+            blocks = blocks | {key: rest}
+
+        rules.append(target(blocks))
+        workflows[name] = f"{name}{{{','.join(rules)}}}"
+
+    parts = [
+        "{" + ",".join(f"{k}={rng.randint(1, 4000)}" for k in "xmas") + "}"
+        for _ in range(5 * scale)
+    ]
+
+    order = list(workflows.values())
+    rng.shuffle(order)
+
+    return lines(order) + "\n" + lines(parts)
+
+
+@generator(2023, 20)
+def d20(rng: random.Random, scale: int) -> str:
+    """A circuit of 4 * scale 12-bit counters feeding `zr`, which feeds `rx`.
+
+    Each counter is a chain of flip-flops that counts button presses, with a
+    conjunction that resets it on reaching an odd number between 2**11 and 2**12,
+    sending a low pulse through an inverter to `zr`. So part 2's answer is the least
+    common multiple of the counters' periods.
+    """
+    bits = 12
+    counters = 4 * scale
+    periods = rng.sample(range(2 ** (bits - 1) + 1, 2**bits, 2), counters)
+
+    length = 2 if counters * (bits + 2) < 26**2 // 2 else 3
+    alphabet = string.ascii_lowercase
+    pool = iter(
+        n
+        for n in names(rng, counters * (bits + 2) + 2, length, alphabet)
+        if n not in ("zr", "rx")
+    )
+
+    starts, inverters, rows = [], [], []
+    for period in periods:
+        flops = [next(pool) for _ in range(bits)]
+        hub, inverter = next(pool), next(pool)
+        starts.append(flops[0])
+        inverters.append(inverter)
+
+        for i, flop in enumerate(flops):
+            targets = flops[i + 1 : i + 2]
+            if period >> i & 1:
+                targets.append(hub)
+            rng.shuffle(targets)
+            rows.append(f"%{flop} -> {', '.join(targets)}")
+
+        targets = [f for i, f in enumerate(flops) if i == 0 or not period >> i & 1]
+        targets.append(inverter)
+        rng.shuffle(targets)
+        rows.append(f"&{hub} -> {', '.join(targets)}")
+        rows.append(f"&{inverter} -> zr")
+
+    rows.append("&zr -> rx")
+    rng.shuffle(rows)
+
+    return lines([f"broadcaster -> {', '.join(starts)}", *rows])
+
+
+@generator(2023, 21)
+def d21(rng: random.Random, scale: int) -> str:
+    """A garden of plots and rocks (a 10 * scale + 1 square).
+
+    Like the puzzle input (and unlike the example), the start is in the center and
+    its row, column and the edges are clear, which part 2's extrapolation relies on.
+    """
+    size = 10 * scale + 1
+    mid = size // 2
+
+    garden = [list(row) for row in grid(rng, size, size, {".": 0.85, "#": 0.15})]
+    for i in range(size):
+        for y, x in [(mid, i), (i, mid), (0, i), (size - 1, i), (i, 0), (i, size - 1)]:
+            garden[y][x] = "."
+    garden[mid][mid] = "S"
+
+    return lines("".join(row) for row in garden)
@@ -0,0 +1,257 @@
+import statistics
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Iterable, Sequence
+
+from aoc.runner import Day
+from aoc.utils.cache import ParseCache
+from aoc.utils.hashing import hash_file
+from aoc.utils.reporting import measure, mib
+
+
+@dataclass(frozen=True)
+class Stats:
+    """Summary statistics (in seconds) over repeated timings of a single call."""
+
+    samples: tuple[float, ...]
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    @property
+    def iqr(self) -> float:
+        if len(self.samples) < 2:
+            return 0.0
+
+        q1, _, q3 = statistics.quantiles(self.samples, n=4)
+        return q3 - q1
+
+
+def benchmark(
+    func: Callable,
+    /,
+    *args,
+    warmup: int = 1,
+    repeat: int = 5,
+    copy: bool = True,
+    **kwargs,
+) -> tuple[Any, Stats]:
+    """Time repeated calls of `func`, after some untimed warmup calls.
+
+    Args:
+        func (Callable): the function to call
+        warmup (int): the number of untimed calls made first
+        repeat (int): the number of timed calls
+        copy (bool): if True, pass each call a fresh deep copy of `args` and `kwargs`
+            (made outside the timing) so that solvers that mutate their input, such
+            as d21's `solve_part2`, see the same input every time
+
+    Returns:
+        tuple[Any, Stats]: the result of the last call and the timing statistics
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, not {repeat}")
+
+    def call():
+        if copy:
+            return measure(func, *deepcopy(args), **deepcopy(kwargs))
+        else:
+            return measure(func, *args, **kwargs)
+
+    for _ in range(warmup):
+        call()
+
+    samples = [call() for _ in range(repeat)]
+
+    return samples[-1].result, Stats(tuple(m.seconds for m in samples))
+
+
+def peak_memory(func: Callable, /, *args, **kwargs) -> int | None:
+    """Return the peak bytes allocated by a single call of `func`, per tracemalloc.
+
+    The call is made on a deep copy of `args` and `kwargs`, like `benchmark`, and is
+    kept apart from the timed calls since tracing slows allocation-heavy code.
+    """
+    return measure(func, *deepcopy(args), memory=True, **deepcopy(kwargs)).peak
+
+
+@dataclass
+class BenchResult:
+    """The answers and timing statistics per stage from benchmarking a single day."""
+
+    day: Day
+    answers: dict[str, Any] = field(default_factory=dict)
+    stats: dict[str, Stats] = field(default_factory=dict)
+    memory: dict[str, int] = field(default_factory=dict)
+    input_hash: str | None = None
+    error: str | None = None
+    # the variant of the solvers timed (see `Solution.variants`), or "default" for a
+    # day without variants
+    impl: str = "default"
+
+
+def bench_day(
+    day: Day,
+    template: str | None = None,
+    parts: Sequence[int] = (1, 2),
+    warmup: int = 1,
+    repeat: int = 5,
+    memory: bool = False,
+    cache: bool = False,
+    impl: str | None = None,
+) -> BenchResult:
+    """Benchmark the parse and solve stages for `day`.
+
+    Args:
+        day (Day): the day to benchmark
+        template (str | None): the input path template (see `Day.input`)
+        parts (Sequence[int]): the parts to solve
+        warmup (int): the number of untimed calls per stage
+        repeat (int): the number of timed calls per stage
+        memory (bool): if True, also measure the peak memory of each stage
+        cache (bool): if True, load the parsed input from the parse cache (when it
+            can) rather than benchmarking parse
+        impl (str | None): the variant of the solvers to time (see
+            `Solution.using`), or None for the default
+
+    Returns:
+        BenchResult: the answers and statistics; on failure, the error and any
+            partial results
+    """
+    result = BenchResult(day)
+
+    try:
+        solution = day.solution().using(impl)
+        result.impl = solution.variant or result.impl
+        path = day.input(template)
+        result.input_hash = hash_file(path)
+
+        if cache:
+            data, _ = ParseCache().parse(solution.parse, path)
+        else:
+            data, result.stats["parse"] = benchmark(
+                solution.parse, path, warmup=warmup, repeat=repeat, copy=False
+            )
+            if memory:
+                result.memory["parse"] = peak_memory(solution.parse, path)
+
+        for part in parts:
+            solve, kwargs = solution.parts[part], solution.kwargs(part)
+            # only a solver that mutates its input needs a fresh copy for each call
+            answer, stats = benchmark(
+                solve,
+                data,
+                warmup=warmup,
+                repeat=repeat,
+                copy=solution.mutates,
+                **kwargs,
+            )
+
+            result.answers[f"part{part}"] = answer
+            result.stats[f"part{part}"] = stats
+            if memory:
+                result.memory[f"part{part}"] = peak_memory(solve, data, **kwargs)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def bench_variants(
+    day: Day,
+    template: str | None = None,
+    parts: Sequence[int] = (1, 2),
+    warmup: int = 1,
+    repeat: int = 5,
+    memory: bool = False,
+    cache: bool = False,
+) -> list[BenchResult]:
+    """Benchmark every variant of the solvers for `day` on the same input.
+
+    Returns:
+        list[BenchResult]: a result per variant (see `bench_day`), the default first,
+            or just the one for a day without variants
+    """
+    try:
+        names = list(day.solution().variants)[1:]
+    except Exception:
+        # (bench_day reports the error)
+        names = []
+
+    return [
+        bench_day(day, template, parts, warmup, repeat, memory, cache, impl)
+        for impl in [None, *names]
+    ]
+
+
+def format_stats(results: Iterable[BenchResult]) -> str:
+    """Return a plain-text table of timing statistics, one row per day and stage."""
+
+    def when(seconds: float) -> str:
+        return str(timedelta(seconds=seconds))
+
+    columns = ("min", "median", "mean", "stdev", "iqr")
+
+    lines = [
+        f"| {'day':<7} | {'stage':<5} | {'impl':<10} | "
+        + " | ".join(f"{c:>14}" for c in columns)
+        + f" | {'peak MiB':>9} | {'answer':>20} |"
+    ]
+
+    for r in results:
+        for stage, stats in r.stats.items():
+            lines.append(
+                f"| {str(r.day):<7} | {stage:<5} | {r.impl:<10} | "
+                + " | ".join(f"{when(getattr(stats, c)):>14}" for c in columns)
+                + f" | {mib(r.memory.get(stage)):>9}"
+                + f" | {str(r.answers.get(stage, '')):>20} |"
+            )
+        if r.error:
+            lines.append(f"| {str(r.day):<7} | ERROR: {r.error}")
+
+    return "\n".join(lines)
+
+
+def format_speedups(results: Iterable[BenchResult]) -> str:
+    """Return a plain-text table comparing the variants of each part, by median.
+
+    Each variant's speed-up is relative to the slowest variant of the same day and
+    part. Days with a single result are left out.
+    """
+    by_day: dict[Day, list[BenchResult]] = {}
+    for r in results:
+        by_day.setdefault(r.day, []).append(r)
+
+    lines = [f"| {'day':<7} | {'stage':<5} | {'impl':<10} | {'speed-up':>9} |"]
+
+    for day, variants in by_day.items():
+        if len(variants) < 2:
+            continue
+
+        for stage in ("part1", "part2"):
+            if not all(stage in r.stats for r in variants):
+                continue
+
+            medians = [r.stats[stage].median for r in variants]
+            for r, median in zip(variants, medians):
+                speedup = max(medians) / median if median else float("inf")
+                lines.append(
+                    f"| {str(day):<7} | {stage:<5} | {r.impl:<10} "
+                    f"| {speedup:>8.2f}x |"
+                )
+
+    return "\n".join(lines)
@@ -0,0 +1,190 @@
+import platform
+import sqlite3
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable
+
+import aoc
+from aoc.bench.harness import BenchResult
+from aoc.utils.state import state_path
+
+HISTORY = "history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    python TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    impl TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    median REAL NOT NULL,
+    memory INTEGER
+)
+"""
+
+# The most recent result for each (year, day, stage, impl, input) at a revision.
+LATEST = """
+SELECT year, day, stage, impl, input_hash, median
+FROM results
+WHERE id IN (
+    SELECT max(id) FROM results
+    WHERE revision LIKE ? || '%'
+    GROUP BY year, day, stage, impl, input_hash
+)
+"""
+
+
+@dataclass(frozen=True)
+class Change:
+    """The change in median time for one stage between two revisions."""
+
+    year: int
+    day: int
+    stage: str
+    impl: str
+    base: float
+    head: float
+
+    @property
+    def percent(self) -> float:
+        return (self.head / self.base - 1.0) * 100.0 if self.base else 0.0
+
+
+def git(*args: str) -> str | None:
+    """Return the output of a git command run in the aoc source tree, or None."""
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=Path(aoc.__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return proc.stdout.strip()
+
+
+def git_revision() -> tuple[str, bool]:
+    """Return the current git commit and whether the working tree has changes."""
+    revision = git("rev-parse", "HEAD")
+    if revision is None:
+        return "unknown", False
+
+    return revision, bool(git("status", "--porcelain", "--untracked-files=no"))
+
+
+def resolve(revision: str) -> str:
+    """Return the full commit hash for `revision` (such as `HEAD~1`), if git knows it.
+
+    Otherwise, return `revision` unchanged, to be matched as a prefix.
+    """
+    return git("rev-parse", "--verify", "--quiet", f"{revision}^{{commit}}") or revision
+
+
+def connect(path: Path | None = None) -> sqlite3.Connection:
+    """Open (creating if necessary) the benchmark history database."""
+    conn = sqlite3.connect(path or state_path(HISTORY))
+    conn.execute(SCHEMA)
+
+    return conn
+
+
+def save(conn: sqlite3.Connection, results: Iterable[BenchResult]) -> int:
+    """Record the median time (and peak memory, if measured) of each stage.
+
+    Results are tagged with the current git revision and Python version, and with
+    the variant of the solvers timed (`BenchResult.impl`).
+
+    Returns:
+        int: the number of rows recorded
+    """
+    revision, dirty = git_revision()
+    python = f"{platform.python_implementation()} {platform.python_version()}"
+    created = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    rows = [
+        (
+            created,
+            revision,
+            dirty,
+            python,
+            r.day.year,
+            r.day.day,
+            stage,
+            r.impl,
+            r.input_hash,
+            stats.median,
+            r.memory.get(stage),
+        )
+        for r in results
+        if r.input_hash is not None
+        for stage, stats in r.stats.items()
+    ]
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO results (created, revision, dirty, python, year, day, stage, "
+            "impl, input_hash, median, memory) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    return len(rows)
+
+
+def compare(conn: sqlite3.Connection, base: str, head: str) -> list[Change]:
+    """Compare the latest medians recorded at two revisions.
+
+    Only stages benchmarked at both revisions on the same input are compared.
+
+    Args:
+        conn (sqlite3.Connection): the history database
+        base (str): the baseline revision (or unique prefix)
+        head (str): the revision to compare against the baseline
+
+    Returns:
+        list[Change]: the changes, sorted by year, day, stage and impl
+    """
+
+    def latest(revision: str) -> dict[tuple, float]:
+        rows = conn.execute(LATEST, (resolve(revision),))
+        return {tuple(row[:5]): row[5] for row in rows}
+
+    lhs, rhs = latest(base), latest(head)
+
+    changes = []
+    for key in sorted(lhs.keys() & rhs.keys()):
+        year, day, stage, impl, _ = key
+        changes.append(Change(year, day, stage, impl, lhs[key], rhs[key]))
+
+    return changes
+
+
+def format_changes(changes: Iterable[Change], threshold: float) -> str:
+    """Return a plain-text table of changes, flagging those slower than `threshold`%."""
+
+    def when(seconds: float) -> str:
+        return str(timedelta(seconds=seconds))
+
+    lines = [
+        f"| {'day':<7} | {'stage':<5} | {'impl':<10} "
+        f"| {'base':>14} | {'head':>14} | {'change':>8} | {'':<6} |"
+    ]
+
+    for c in changes:
+        flag = "SLOWER" if c.percent > threshold else ""
+        lines.append(
+            f"| {c.year:04}/{c.day:02} | {c.stage:<5} | {c.impl:<10} "
+            f"| {when(c.base):>14} | {when(c.head):>14} "
+            f"| {c.percent:>+7.1f}% | {flag:<6} |"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,195 @@
+import csv
+import math
+import statistics
+import tempfile
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from aoc.bench import generators
+from aoc.bench.harness import benchmark
+from aoc.runner import Day
+
+# The default scale factors, doubling from the size of the examples.
+SCALES = (1, 2, 4, 8, 16, 32, 64)
+
+
+@dataclass
+class Curve:
+    """The median time of one stage at each input size it was benchmarked at."""
+
+    scales: list[int] = field(default_factory=list)
+    # the input size in bytes
+    sizes: list[int] = field(default_factory=list)
+    seconds: list[float] = field(default_factory=list)
+
+    def add(self, scale: int, size: int, seconds: float) -> None:
+        self.scales.append(scale)
+        self.sizes.append(size)
+        self.seconds.append(seconds)
+
+    def predict(self, scale: int) -> float:
+        """Return the seconds expected at `scale`, extrapolating the last two times."""
+        if len(self.scales) < 2:
+            return self.seconds[-1] * scale / self.scales[-1] if self.scales else 0.0
+
+        (s0, s1), (t0, t1) = self.scales[-2:], self.seconds[-2:]
+        growth = math.log(max(t1, 1e-9) / max(t0, 1e-9)) / math.log(s1 / s0)
+
+        return t1 * (scale / s1) ** max(growth, 1.0)
+
+    @property
+    def slope(self) -> float | None:
+        """Return the growth exponent k of time ~ size**k, or None if unknown.
+
+        This is the least-squares slope of log(time) against log(size), so 1.0 is
+        linear in the size of the input and 2.0 is quadratic.
+        """
+        if len(set(self.sizes)) < 2:
+            return None
+
+        xs = [math.log(size) for size in self.sizes]
+        # guard against a zero time from a coarse clock
+        ys = [math.log(max(seconds, 1e-9)) for seconds in self.seconds]
+
+        return statistics.linear_regression(xs, ys).slope
+
+
+@dataclass
+class ScalingResult:
+    """The scaling curve per stage from benchmarking a single day."""
+
+    day: Day
+    curves: dict[str, Curve] = field(default_factory=dict)
+    error: str | None = None
+
+
+def scaling_day(
+    day: Day,
+    scales: Sequence[int] = SCALES,
+    parts: Sequence[int] = (1, 2),
+    warmup: int = 1,
+    repeat: int = 3,
+    budget: float = 5.0,
+    seed: int = 0,
+) -> ScalingResult:
+    """Benchmark each stage of `day` on generated inputs of increasing scale.
+
+    Scales stop increasing before any stage is predicted to take longer than `budget`
+    seconds, extrapolating from its last two times (or once the generator can't go
+    any larger). Stopping only after the fact could be too late: a quadratic stage
+    takes 16 times longer (and may need 16 times the memory) at each doubling of a
+    grid's side.
+
+    Args:
+        day (Day): the day to benchmark (see `aoc.bench.generators`)
+        scales (Sequence[int]): the scale factors, in increasing order
+        parts (Sequence[int]): the parts to solve
+        warmup (int): the number of untimed calls per stage and scale
+        repeat (int): the number of timed calls per stage and scale
+        budget (float): the longest median seconds of a stage to allow
+        seed (int): the seed for the generated inputs
+
+    Returns:
+        ScalingResult: the curves; on failure, the error and any partial curves
+    """
+    result = ScalingResult(day)
+    stages = ["parse", *(f"part{part}" for part in parts)]
+    for stage in stages:
+        result.curves[stage] = Curve()
+
+    try:
+        solution = day.solution()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for i, scale in enumerate(scales):
+                if i > 0 and any(
+                    c.predict(scale) > budget for c in result.curves.values()
+                ):
+                    break
+
+                try:
+                    path = generators.write(day, Path(tmp) / "input.txt", scale, seed)
+                except ValueError:
+                    break
+                size = path.stat().st_size
+
+                data, stats = benchmark(
+                    solution.parse, path, warmup=warmup, repeat=repeat, copy=False
+                )
+                result.curves["parse"].add(scale, size, stats.median)
+
+                for part in parts:
+                    _, stats = benchmark(
+                        solution.parts[part],
+                        data,
+                        warmup=warmup,
+                        repeat=repeat,
+                        copy=solution.mutates,
+                        **solution.kwargs(part),
+                    )
+                    result.curves[f"part{part}"].add(scale, size, stats.median)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def write_csv(results: Iterable[ScalingResult], path: Path) -> Path:
+    """Write one row per day, stage and scale to a CSV file at `path`."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["year", "day", "stage", "scale", "bytes", "seconds"])
+        for r in results:
+            for stage, curve in r.curves.items():
+                for scale, size, seconds in zip(
+                    curve.scales, curve.sizes, curve.seconds
+                ):
+                    writer.writerow(
+                        [r.day.year, r.day.day, stage, scale, size, seconds]
+                    )
+
+    return path
+
+
+def format_curves(results: Iterable[ScalingResult], threshold: float) -> str:
+    """Return a plain-text table of growth exponents, flagging any above `threshold`."""
+
+    def when(seconds: float) -> str:
+        return str(timedelta(seconds=seconds))
+
+    lines = [
+        f"| {'day':<7} | {'stage':<5} | {'scales':>7} | {'max bytes':>10} "
+        f"| {'max time':>14} | {'slope':>6} | {'':<5} |"
+    ]
+
+    for r in results:
+        for stage, curve in r.curves.items():
+            if not curve.sizes:
+                continue
+
+            slope = curve.slope
+            flag = "STEEP" if slope is not None and slope > threshold else ""
+            lines.append(
+                f"| {str(r.day):<7} | {stage:<5} "
+                f"| {f'{curve.scales[0]}-{curve.scales[-1]}':>7} "
+                f"| {curve.sizes[-1]:>10} | {when(curve.seconds[-1]):>14} "
+                f"| {'' if slope is None else f'{slope:.2f}':>6} | {flag:<5} |"
+            )
+        if r.error:
+            lines.append(f"| {str(r.day):<7} | ERROR: {r.error}")
+
+    return "\n".join(lines)
+
+
+def is_steep(results: Iterable[ScalingResult], threshold: float) -> bool:
+    """Return whether any stage grows faster than size**threshold."""
+    return any(
+        curve.slope is not None and curve.slope > threshold
+        for r in results
+        for curve in r.curves.values()
+    )
@@ -0,0 +1,442 @@
+import argparse
+import logging
+import os
+import subprocess
+import sys
+from contextlib import closing
+from pathlib import Path
+
+from aoc.bench import differential, generators, history, scaling
+from aoc.bench.harness import (
+    bench_day,
+    bench_variants,
+    format_speedups,
+    format_stats,
+)
+from aoc.bench.scaling import SCALES
+from aoc.runner import Day, RunOptions, discover, format_table, run_days
+from aoc.server import serve
+from aoc.utils.importtime import import_times, summarize_import_times
+from aoc.utils.reporting import PROFILERS, summarize_profile
+from aoc.utils.state import state_path
+
+# The default CSV of `aoc bench --scaling` timings, in the state directory.
+SCALING = "scaling.csv"
+
+
+def parse_parts(value: str) -> tuple[int, ...]:
+    parts = tuple(int(p) for p in value.split(","))
+    if not set(parts) <= {1, 2}:
+        raise argparse.ArgumentTypeError(f"invalid parts: {value}")
+    return parts
+
+
+def parse_scales(value: str) -> tuple[int, ...]:
+    scales = tuple(sorted(int(s) for s in value.split(",")))
+    if not scales or scales[0] < 1:
+        raise argparse.ArgumentTypeError(f"invalid scales: {value}")
+    return scales
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aoc", description="Run Advent of Code solutions."
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="log solver output at INFO level"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # the options for selecting which days to run
+    days = argparse.ArgumentParser(add_help=False)
+    days.add_argument("-y", "--year", type=int, action="append", help="year(s) to run")
+    days.add_argument("-d", "--day", type=int, action="append", help="day(s) to run")
+
+    # ...and which parts and inputs
+    select = argparse.ArgumentParser(add_help=False, parents=[days])
+    select.add_argument(
+        "-p", "--parts", type=parse_parts, default=(1, 2), help="e.g. 1, 2 or 1,2"
+    )
+    select.add_argument(
+        "-i",
+        "--input",
+        metavar="TEMPLATE",
+        help="input path template with {year} and {day} fields, such as "
+        "'inputs/{year}/{day:02}.txt' (default: data/data.txt next to each solution)",
+    )
+
+    run = commands.add_parser(
+        "run", parents=[select], help="solve days and print a timing table"
+    )
+    run.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count(),
+        default=1,
+        help="run days across a pool of JOBS processes (default: one per core)",
+    )
+    run.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="also measure peak traced memory and RSS (slows allocation-heavy code)",
+    )
+    run.add_argument(
+        "--profile",
+        metavar="DIR",
+        type=Path,
+        help="profile each stage, writing a profile per stage to DIR",
+    )
+    run.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        default="cprofile",
+        help="cprofile writes .pstats; sampling writes low-overhead collapsed stacks "
+        "for flamegraph tools (cprofile)",
+    )
+    run.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="the number of functions (or modules) to show from each profile (20)",
+    )
+    run.add_argument(
+        "-c",
+        "--cache",
+        action="store_true",
+        help="load parse results from the parse cache when the input and solution "
+        "source are unchanged",
+    )
+    run.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="solve every part even if its answer is stored for the same source and "
+        "input",
+    )
+    run.add_argument(
+        "-t",
+        "--timeout",
+        metavar="SECONDS",
+        type=float,
+        help="run each part in a child process, and give up on it (as TIMEOUT) "
+        "after this many seconds",
+    )
+    run.add_argument(
+        "--max-memory",
+        metavar="MIB",
+        type=int,
+        help="run each part in a child process that may map at most this many MiB "
+        "(including the interpreter), failing it as OOM beyond that",
+    )
+    run.add_argument(
+        "--impl",
+        metavar="NAME",
+        help="solve with this variant of each day's solvers, such as d06's slow "
+        "(default: the first variant each day declares); always solves",
+    )
+    run.add_argument(
+        "--import-times",
+        action="store_true",
+        help="also import each solution in a fresh interpreter and show the top "
+        "modules by import time (see python -X importtime)",
+    )
+    run.set_defaults(func=cmd_run)
+
+    bench = commands.add_parser(
+        "bench", parents=[select], help="time repeated solves and print statistics"
+    )
+    bench.add_argument(
+        "-w", "--warmup", type=int, default=1, help="untimed calls per stage"
+    )
+    bench.add_argument(
+        "-r", "--repeat", type=int, default=5, help="timed calls per stage"
+    )
+    bench.add_argument(
+        "-m", "--memory", action="store_true", help="also measure peak memory"
+    )
+    bench.add_argument(
+        "-s", "--save", action="store_true", help="record results in the history"
+    )
+    bench.add_argument(
+        "-c",
+        "--cache",
+        action="store_true",
+        help="load parse results from the parse cache rather than benchmarking parse",
+    )
+    bench.add_argument(
+        "--variants",
+        action="store_true",
+        help="also time every other variant of each day's solvers on the same input, "
+        "and print their relative speed-ups",
+    )
+    bench.add_argument(
+        "--scaling",
+        metavar="SCALES",
+        type=parse_scales,
+        nargs="?",
+        const=SCALES,
+        help="instead of timing the input, time generated inputs at each scale, such "
+        "as 1,2,4 (default: 1,2,4,...,64), and fit the growth exponent of each stage",
+    )
+    bench.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="with --scaling, flag stages whose time grows faster than "
+        "size**THRESHOLD (1.5)",
+    )
+    bench.add_argument(
+        "--budget",
+        type=float,
+        default=5.0,
+        help="with --scaling, stop scaling a day up before the next scale, once any "
+        "stage is predicted to take longer than this many seconds there (5)",
+    )
+    bench.add_argument(
+        "--csv",
+        type=Path,
+        help="with --scaling, where to write the timings (.aoc/scaling.csv)",
+    )
+    bench.add_argument(
+        "--seed", type=int, default=0, help="with --scaling, the random seed (0)"
+    )
+    bench.set_defaults(func=cmd_bench)
+
+    generate = commands.add_parser(
+        "generate", parents=[days], help="write synthetic inputs at a given scale"
+    )
+    generate.add_argument(
+        "-o",
+        "--output",
+        metavar="TEMPLATE",
+        required=True,
+        help="output path template with {year} and {day} fields (pass the same "
+        "template to run or bench with -i)",
+    )
+    generate.add_argument(
+        "-s", "--scale", type=int, default=1, help="the size relative to the examples"
+    )
+    generate.add_argument("--seed", type=int, default=0, help="the random seed (0)")
+    generate.set_defaults(func=cmd_generate)
+
+    diff = commands.add_parser(
+        "diff",
+        parents=[days],
+        help="check optimized implementations against their references on "
+        "synthetic inputs",
+    )
+    diff.add_argument(
+        "-n", "--trials", type=int, default=100, help="the number of inputs (100)"
+    )
+    diff.add_argument(
+        "-s", "--scale", type=int, default=1, help="the size relative to the examples"
+    )
+    diff.add_argument("--seed", type=int, default=0, help="the first random seed (0)")
+    diff.set_defaults(func=cmd_diff)
+
+    server = commands.add_parser(
+        "serve",
+        help="preload every solution and answer JSON solve requests on a Unix socket",
+    )
+    server.add_argument(
+        "-s",
+        "--socket",
+        type=Path,
+        help="the socket path (.aoc/serve.sock)",
+    )
+    server.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="the number of worker processes; 0 solves in the server (one per core)",
+    )
+    server.set_defaults(func=cmd_serve)
+
+    compare = commands.add_parser(
+        "compare", help="compare benchmark history between two git revisions"
+    )
+    compare.add_argument("base", help="the baseline revision")
+    compare.add_argument(
+        "head", nargs="?", default="HEAD", help="the revision to compare (HEAD)"
+    )
+    compare.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="flag stages slower by more than this percentage (10)",
+    )
+    compare.set_defaults(func=cmd_compare)
+
+    return parser
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    days = discover(args.year, args.day)
+    if not days:
+        print("no matching solutions found", file=sys.stderr)
+        return 1
+
+    options = RunOptions(
+        template=args.input,
+        parts=args.parts,
+        memory=args.memory,
+        profile=args.profile,
+        profiler=args.profiler,
+        cache=args.cache,
+        memo=True,
+        force=args.force,
+        timeout=args.timeout,
+        max_memory=args.max_memory * 2**20 if args.max_memory else None,
+        impl=args.impl,
+    )
+    results = run_days(days, options, args.jobs)
+
+    print(format_table(results))
+
+    for result in results:
+        for stage, path in result.profiles.items():
+            print(f"\n{result.day} {stage} | {path}")
+            print(summarize_profile(path, args.top))
+
+    if args.import_times:
+        for day in days:
+            print(f"\n{day} import")
+            try:
+                print(summarize_import_times(import_times(day.module), args.top))
+            except subprocess.CalledProcessError as e:
+                print(f"ERROR: {e.stderr.strip().splitlines()[-1]}")
+
+    return 1 if any(r.error for r in results) else 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    days = discover(args.year, args.day)
+    if not days:
+        print("no matching solutions found", file=sys.stderr)
+        return 1
+
+    if args.scaling is not None:
+        return cmd_scaling(args, days)
+
+    results = []
+    for day in days:
+        bench_args = (
+            day,
+            args.input,
+            args.parts,
+            args.warmup,
+            args.repeat,
+            args.memory,
+            args.cache,
+        )
+        if args.variants:
+            results.extend(bench_variants(*bench_args))
+        else:
+            results.append(bench_day(*bench_args))
+
+    print(format_stats(results))
+    if args.variants:
+        print(f"\n{format_speedups(results)}")
+
+    if args.save:
+        with closing(history.connect()) as conn:
+            history.save(conn, results)
+
+    return 1 if any(r.error for r in results) else 0
+
+
+def cmd_scaling(args: argparse.Namespace, days: list[Day]) -> int:
+    results = [
+        scaling.scaling_day(
+            day,
+            args.scaling,
+            args.parts,
+            args.warmup,
+            args.repeat,
+            args.budget,
+            args.seed,
+        )
+        for day in days
+        if day in generators.GENERATORS
+    ]
+
+    print(scaling.format_curves(results, args.threshold))
+    print(f"\n{scaling.write_csv(results, args.csv or state_path(SCALING))}")
+
+    if any(r.error for r in results):
+        return 1
+    return 1 if scaling.is_steep(results, args.threshold) else 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    days = [
+        day for day in discover(args.year, args.day) if day in generators.GENERATORS
+    ]
+    if not days:
+        print("no matching generators found", file=sys.stderr)
+        return 1
+
+    for day in days:
+        path = Path(args.output.format(year=day.year, day=day.day)).expanduser()
+        print(generators.write(day, path, args.scale, args.seed))
+
+    return 0
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    days = set(discover(args.year, args.day))
+    pairs = [pair for pair in differential.PAIRS if pair.day in days]
+    if not pairs:
+        print("no matching implementation pairs found", file=sys.stderr)
+        return 1
+
+    mismatches = 0
+    for pair in pairs:
+        mismatch = differential.check(pair, args.trials, args.scale, args.seed)
+        if mismatch is None:
+            print(f"{pair}: ok on {args.trials} inputs")
+        else:
+            print(mismatch)
+            mismatches += 1
+
+    return 1 if mismatches else 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    # the server logs where it's listening, so it's worth seeing without -v
+    logging.getLogger("aoc.server").setLevel(logging.INFO)
+    serve(args.socket, args.jobs)
+
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    with closing(history.connect()) as conn:
+        changes = history.compare(conn, args.base, args.head)
+
+    if not changes:
+        print(f"no common results for {args.base} and {args.head}", file=sys.stderr)
+        return 1
+
+    print(history.format_changes(changes, args.threshold))
+
+    return 1 if any(c.percent > args.threshold for c in changes) else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    logging.basicConfig(
+        stream=sys.stdout, level=logging.INFO if args.verbose else logging.WARNING
+    )
+
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
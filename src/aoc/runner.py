@@ -0,0 +1,476 @@
+import importlib
+import json
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import deepcopy
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import aoc
+from aoc.solution import Solution
+from aoc.utils.cache import ParseCache, content_key
+from aoc.utils.isolation import isolated
+from aoc.utils.memo import AnswerStore, Memo
+from aoc.utils.progress import Counter
+from aoc.utils.reporting import PROFILERS, Measurement, measure, mib
+from aoc.utils.state import state_path
+
+# The template solution lives in y0000 and is never discovered as a real day.
+TEMPLATE_YEAR = 0
+
+SOLUTION_RE = re.compile(r"y(?P<year>\d{4})/d(?P<day>\d{2})/solution\.py$")
+
+STAGES = ("parse", "part1", "part2")
+
+TIMINGS = "timings.json"
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    """Identifies a single solution module by its year and day."""
+
+    year: int
+    day: int
+
+    def __str__(self) -> str:
+        return f"{self.year:04}/{self.day:02}"
+
+    @property
+    def module(self) -> str:
+        return f"aoc.y{self.year:04}.d{self.day:02}.solution"
+
+    def load(self):
+        return importlib.import_module(self.module)
+
+    def solution(self) -> Solution:
+        return Solution.of(self.load())
+
+    def input(self, template: str | None = None) -> Path:
+        """Return the path to the input for this day.
+
+        Args:
+            template (str | None): a path template with `{year}` and `{day}` fields;
+                if None, use `data/data.txt` next to the solution module
+
+        Returns:
+            Path: the path to the input
+        """
+        if template is None:
+            return Path(self.load().__file__).parent / "data" / "data.txt"
+
+        return Path(template.format(year=self.year, day=self.day)).expanduser()
+
+
+@dataclass
+class Result:
+    """The answers, timings and any error from running a single day."""
+
+    day: Day
+    answers: dict[str, Any] = field(default_factory=dict)
+    times: dict[str, float] = field(default_factory=dict)
+    # the peak traced bytes of each stage and the peak RSS, if measured
+    peaks: dict[str, int] = field(default_factory=dict)
+    maxrss: int | None = None
+    # the profile of each stage, if profiled
+    profiles: dict[str, Path] = field(default_factory=dict)
+    # the stages whose results were loaded from a cache rather than computed
+    cached: set[str] = field(default_factory=set)
+    # the loops counted in each stage, if counting (see `progress.counted`)
+    counters: dict[str, list[Counter]] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.times.values())
+
+    def record(self, stage: str, m: Measurement) -> None:
+        """Record the measurements of a stage."""
+        self.times[stage] = m.seconds
+        if m.peak is not None:
+            self.peaks[stage] = m.peak
+        if m.usage is not None:
+            self.maxrss = max(self.maxrss or 0, m.usage.maxrss)
+        if m.profile is not None:
+            self.profiles[stage] = m.profile
+        if m.counters:
+            self.counters[stage] = m.counters
+
+
+def discover(
+    years: Iterable[int] | None = None, days: Iterable[int] | None = None
+) -> list[Day]:
+    """Return the sorted list of solution modules found under the aoc package.
+
+    Args:
+        years (Iterable[int] | None): the years to include, or None for all years
+        days (Iterable[int] | None): the days to include, or None for all days
+
+    Returns:
+        list[Day]: the matching days
+    """
+    years = set(years) if years else None
+    days = set(days) if days else None
+
+    found = set()
+    for root in map(Path, aoc.__path__):
+        for path in root.glob("y[0-9][0-9][0-9][0-9]/d[0-9][0-9]/solution.py"):
+            m = SOLUTION_RE.search(path.relative_to(root).as_posix())
+            day = Day(int(m.group("year")), int(m.group("day")))
+
+            if day.year == TEMPLATE_YEAR:
+                continue
+            if years is not None and day.year not in years:
+                continue
+            if days is not None and day.day not in days:
+                continue
+
+            found.add(day)
+
+    return sorted(found)
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    """How to run each day (see `run_day`)."""
+
+    # the input path template (see `Day.input`)
+    template: str | None = None
+    # the parts to solve
+    parts: tuple[int, ...] = (1, 2)
+    # if True, also measure peak memory (see `measure`)
+    memory: bool = False
+    # if not None, the directory in which to write a profile of each stage
+    profile: Path | None = None
+    # the profiler to use (see `measure`)
+    profiler: str = "cprofile"
+    # if True, load parse results from (and save them to) the parse cache
+    cache: bool = False
+    # if True, return stored answers for unchanged stages and store new ones
+    memo: bool = False
+    # if True (with memo), solve every stage anyway, replacing the stored answers
+    force: bool = False
+    # if either is set, each part runs (and parses) in its own child process, which
+    # is killed after `timeout` seconds and may map at most `max_memory` bytes
+    timeout: float | None = None
+    max_memory: int | None = None
+    # the variant of each day's solvers to run (see `Solution.using`), or None for
+    # the default
+    impl: str | None = None
+
+    @property
+    def isolated(self) -> bool:
+        return self.timeout is not None or self.max_memory is not None
+
+
+def run_day(day: Day, options: RunOptions = RunOptions()) -> Result:
+    """Parse the input for `day` and solve the requested parts, timing each stage.
+
+    Args:
+        day (Day): the day to run
+        options (RunOptions): the input, parts and measurements to make
+
+    Returns:
+        Result: the answers and timings; on failure, the error and any partial results
+    """
+    if options.isolated:
+        return run_isolated(day, options)
+
+    result = Result(day)
+
+    def run(stage: str, func: Callable, *args, **kwargs) -> Any:
+        profile = None
+        if options.profile is not None:
+            suffix = PROFILERS[options.profiler]
+            profile = options.profile / f"y{day.year:04}-d{day.day:02}-{stage}{suffix}"
+
+        m = measure(
+            func,
+            *args,
+            memory=options.memory,
+            profile=profile,
+            profiler=options.profiler,
+            **kwargs,
+        )
+        result.record(stage, m)
+
+        return m.result
+
+    def recall(stage: str, memo: Memo) -> None:
+        result.times[stage] = memo.seconds
+        if stage != "parse":
+            result.answers[stage] = memo.answer
+        result.cached.add(stage)
+
+    store = None
+    try:
+        module = day.load()
+        solution = Solution.of(module).using(options.impl)
+        path = day.input(options.template)
+        parts = [f"part{part}" for part in options.parts]
+
+        memos = {}
+        # the stored answers and times are those of the default variant
+        if options.memo and solution.impl is None:
+            key = content_key(module, path)
+            store = AnswerStore()
+            # measuring memory or profiling needs the stages to actually run
+            if not (options.force or options.memory or options.profile is not None):
+                memos = store.get(key)
+
+        # when every part is stored, there's no need to even parse
+        if memos and all(stage in memos for stage in parts):
+            for stage in ["parse", *parts]:
+                if stage in memos:
+                    recall(stage, memos[stage])
+            return result
+
+        if options.cache:
+            data, hit = run("parse", ParseCache().parse, solution.parse, path)
+            if hit:
+                result.cached.add("parse")
+        else:
+            data = run("parse", solution.parse, path)
+
+        # a parse loaded from the parse cache says nothing about the parse time
+        if store is not None and "parse" not in result.cached:
+            store.put(key, "parse", None, result.times["parse"])
+
+        for part, stage in zip(options.parts, parts):
+            if stage in memos:
+                recall(stage, memos[stage])
+                continue
+
+            # a solver that mutates its input gets a copy, so the next part doesn't
+            # see the changes
+            args = deepcopy(data) if solution.mutates else data
+            result.answers[stage] = run(
+                stage, solution.parts[part], args, **solution.kwargs(part)
+            )
+            if store is not None:
+                store.put(key, stage, result.answers[stage], result.times[stage])
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        if store is not None:
+            store.close()
+
+    return result
+
+
+def out_of_memory(error: str) -> bool:
+    """Whether `error` is how running out of (address space) memory shows up."""
+    kind = error.split(":")[0]
+    # numpy raises a subclass of MemoryError of its own, and an extension module
+    # that can't be mapped (or a package that fails to import one) raises a plain
+    # ImportError, unlike a module that isn't there at all
+    return kind.endswith("MemoryError") or kind == "ImportError"
+
+
+def run_isolated(day: Day, options: RunOptions) -> Result:
+    """Run each part of `day` in a child process, within the limits of `options`.
+
+    A part that runs out of time or memory is reported as a TIMEOUT or OOM error
+    rather than holding up (or taking down) the rest of the run, and the other parts
+    still run. Each child parses the input itself; the parse time reported is the
+    first child's.
+    """
+    result = Result(day)
+    unlimited = replace(options, timeout=None, max_memory=None)
+    errors = []
+
+    for part in options.parts:
+        stage = f"part{part}"
+        try:
+            r = isolated(
+                run_day,
+                day,
+                replace(unlimited, parts=(part,)),
+                timeout=options.timeout,
+                memory=options.max_memory,
+            )
+        except TimeoutError as e:
+            errors.append(f"TIMEOUT: {stage} {e}")
+            continue
+        except ChildProcessError as e:
+            errors.append(f"CRASHED: {stage} {e}")
+            continue
+
+        for name, seconds in r.times.items():
+            result.times.setdefault(name, seconds)
+        for name, peak in r.peaks.items():
+            result.peaks.setdefault(name, peak)
+        result.answers.update(r.answers)
+        result.profiles.update(r.profiles)
+        result.counters.update(r.counters)
+        result.cached |= r.cached
+        if r.maxrss is not None:
+            result.maxrss = max(result.maxrss or 0, r.maxrss)
+
+        if r.error is None:
+            continue
+        if options.max_memory is not None and out_of_memory(r.error):
+            limit = mib(options.max_memory)
+            cause = r.error.splitlines()[0].removesuffix(": ")
+            errors.append(f"OOM: {stage} needed more than {limit} MiB ({cause})")
+        elif r.error not in errors:
+            # (a parse error repeats for every part)
+            errors.append(r.error)
+
+    result.error = "; ".join(errors) or None
+
+    return result
+
+
+def load_timings() -> dict[str, dict[str, float]]:
+    """Return the seconds of each stage per day (keyed by `str(Day)`) from previous
+    runs.
+    """
+    path = state_path(TIMINGS)
+    if not path.exists():
+        return {}
+
+    # (a day saved as just a total, before stages were kept, is timed afresh)
+    timings = json.loads(path.read_text())
+    return {day: stages for day, stages in timings.items() if isinstance(stages, dict)}
+
+
+def save_timings(results: Iterable[Result]) -> None:
+    """Merge the seconds of each stage of each successful result into the saved
+    timings.
+
+    Stages are merged one by one, so a run of just part 1 keeps the part 2 time of
+    an earlier run.
+    """
+    timings = load_timings()
+    for r in results:
+        if r.error is None:
+            timings.setdefault(str(r.day), {}).update(r.times)
+
+    state_path(TIMINGS).write_text(json.dumps(timings, indent=2, sort_keys=True))
+
+
+def schedule(days: Iterable[Day], timings: dict[str, dict[str, float]]) -> list[Day]:
+    """Return days ordered longest-first by previous timings (see `load_timings`).
+
+    Days without a previous timing are scheduled first, since they may be long.
+    """
+
+    def total(day: Day) -> float:
+        stages = timings.get(str(day))
+        return float("inf") if stages is None else sum(stages.values())
+
+    return sorted(days, key=lambda day: -total(day))
+
+
+def log_finished(result: Result) -> None:
+    """Log that a day has finished, with the loops counted in each of its stages."""
+    log = logging.getLogger(__name__)
+    log.info(f"{result.day} | {timedelta(seconds=result.total)} | finished")
+    for stage, counters in result.counters.items():
+        for counter in counters:
+            log.info(f"{result.day} | {stage} | {counter}")
+
+
+def run_days(
+    days: Iterable[Day], options: RunOptions = RunOptions(), jobs: int = 1
+) -> list[Result]:
+    """Run each of `days`, either serially or across a pool of `jobs` processes.
+
+    In parallel, days are submitted longest-first (see `schedule`) so that the slowest
+    days don't leave the pool idle at the end, and results are collected as each day
+    finishes. Either way, the timings are saved for scheduling the next run.
+
+    Args:
+        days (Iterable[Day]): the days to run
+        options (RunOptions): the input, parts and measurements to make
+        jobs (int): the number of worker processes; 1 runs in this process
+
+    Returns:
+        list[Result]: the results, sorted by day
+    """
+    results = []
+
+    if jobs <= 1:
+        for day in days:
+            results.append(run_day(day, options))
+            log_finished(results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(run_day, day, options): day
+                for day in schedule(days, load_timings())
+            }
+
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker itself died (for example, it was killed), so there's
+                    # no partial result to report.
+                    result = Result(futures[future], error=f"{type(e).__name__}: {e}")
+
+                results.append(result)
+                log_finished(result)
+
+    # the saved timings schedule the default variant, so another isn't saved over it
+    if options.impl is None:
+        save_timings(results)
+
+    return sorted(results, key=lambda r: r.day)
+
+
+def format_table(results: Iterable[Result]) -> str:
+    """Return a plain-text table of answers and timings, one row per day."""
+    results = list(results)
+
+    def when(r: Result, stage: str) -> str:
+        if stage not in r.times:
+            return ""
+        mark = "*" if stage in r.cached else ""
+        return f"{timedelta(seconds=r.times[stage])}{mark}"
+
+    def row(day, parse, time1, part1, time2, part2, peak, maxrss) -> str:
+        return (
+            f"| {day:<7} | {parse:>15} | {time1:>15} | {part1:>20} "
+            f"| {time2:>15} | {part2:>20} | {peak:>9} | {maxrss:>10} |"
+        )
+
+    lines = [
+        row(
+            "day",
+            "parse",
+            "part1",
+            "answer",
+            "part2",
+            "answer",
+            "peak MiB",
+            "maxrss MiB",
+        )
+    ]
+
+    total = 0.0
+    for r in results:
+        total += r.total
+        lines.append(
+            row(
+                str(r.day),
+                when(r, "parse"),
+                when(r, "part1"),
+                str(r.answers.get("part1", "")),
+                when(r, "part2"),
+                str(r.answers.get("part2", "")),
+                mib(max(r.peaks.values(), default=None)),
+                mib(r.maxrss),
+            )
+        )
+        if r.error:
+            lines.append(f"| {'':<7} | ERROR: {r.error}")
+
+    lines.append(f"| {'total':<7} | {str(timedelta(seconds=total)):>15} |")
+    if any(r.cached for r in results):
+        lines.append("* loaded from cache")
+
+    return "\n".join(lines)
@@ -0,0 +1,205 @@
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator
+
+from aoc.runner import Day, discover
+from aoc.solution import Solution
+from aoc.utils.reporting import measure
+from aoc.utils.state import state_path
+
+# The default socket, in the state directory.
+SOCKET = "serve.sock"
+
+# The solutions preloaded by `preload`, which forked workers inherit.
+SOLUTIONS: dict[Day, Solution] = {}
+
+
+def preload(days: list[Day] | None = None) -> dict[Day, Solution]:
+    """Import the solution of each of `days` (default: all), and what they import.
+
+    Lazily imported modules (see `lazy_import`) are loaded too, so that no request
+    pays for importing numpy.
+    """
+    for day in discover() if days is None else days:
+        module = day.load()
+        SOLUTIONS[day] = Solution.of(module)
+
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                # any attribute access loads a lazy module
+                getattr(value, "__name__")
+
+    return SOLUTIONS
+
+
+@contextmanager
+def request_input(request: dict) -> Iterator[Path]:
+    """Yield the path of the input of `request`, writing inline input to a file."""
+    if "path" in request:
+        yield Path(request["path"]).expanduser()
+        return
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.write(request["input"])
+        file.flush()
+        yield Path(file.name)
+
+
+def jsonable(value: Any) -> Any:
+    """Return `value` as a JSON value, so that numpy integers answer as integers."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "__index__"):
+        return int(value)
+    return str(value)
+
+
+def solve(request: dict) -> dict:
+    """Return the response to a single solve request.
+
+    A request has a `year` and `day`, optionally a `part` (1, 2, or a list of parts;
+    default both) and an `impl` (see `Solution.using`), and either the `path` to an
+    input or the `input` itself as text.
+    The response has the `answers` and `times` per stage (like `Result`) and the
+    `error`, if any.
+    """
+    response = {"answers": {}, "times": {}, "error": None}
+
+    try:
+        day = Day(int(request["year"]), int(request["day"]))
+        solution = (SOLUTIONS.get(day) or day.solution()).using(request.get("impl"))
+        parts = request.get("part", list(solution.parts))
+        parts = [parts] if isinstance(parts, int) else parts
+
+        with request_input(request) as path:
+            m = measure(solution.parse, path)
+        data = m.result
+        response["times"]["parse"] = m.seconds
+
+        for part in parts:
+            args = deepcopy(data) if solution.mutates else data
+            m = measure(solution.parts[part], args, **solution.kwargs(part))
+            response["answers"][f"part{part}"] = jsonable(m.result)
+            response["times"][f"part{part}"] = m.seconds
+    except Exception as e:
+        response["error"] = f"{type(e).__name__}: {e}"
+
+    return response
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Answers each line of JSON read from a connection with a line of JSON."""
+
+    server: "Server"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("a request must be a JSON object")
+                if self.server.pool is None:
+                    response = solve(request)
+                else:
+                    response = self.server.pool.submit(solve, request).result()
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """A Unix socket server that solves requests in a pool of worker processes.
+
+    Each connection is handled by its own thread, which hands its requests to the
+    pool, so a slow day on one connection doesn't hold up the others. Without a pool,
+    requests are solved in the connection's thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, pool: Executor | None = None):
+        self.pool = pool
+        super().__init__(str(path), Handler)
+
+
+def ignore_interrupts() -> None:
+    # Ctrl-C (and a SIGTERM sent to the process group) reaches every worker, but only
+    # the server should stop on it; it then shuts down the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+
+@contextmanager
+def pool(jobs: int) -> Iterator[Executor | None]:
+    """Yield a pool of `jobs` worker processes forked from this one, or None if 0.
+
+    The workers are all forked before this returns (and so before any server thread
+    starts), so each inherits the preloaded solutions without re-importing them.
+    """
+    if jobs <= 0:
+        yield None
+        return
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=context, initializer=ignore_interrupts
+    ) as executor:
+        # a fork context starts every worker on the first submit
+        executor.submit(os.getpid).result()
+        yield executor
+
+
+def serve(path: Path | None = None, jobs: int = 1) -> None:
+    """Preload every solution and answer requests on the Unix socket at `path`.
+
+    Args:
+        path (Path | None): the socket path (default: serve.sock in the state dir)
+        jobs (int): the number of worker processes; 0 solves in the server itself
+    """
+    log = logging.getLogger(__name__)
+    path = Path(path) if path is not None else state_path(SOCKET)
+
+    preload()
+    log.info(f"preloaded {len(SOLUTIONS)} solutions")
+
+    # a socket left by a previous server would make the bind fail
+    path.unlink(missing_ok=True)
+    # stop on SIGTERM as on Ctrl-C, so the socket is removed either way
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with pool(jobs) as executor, Server(path, executor) as server:
+        log.info(f"serving on {path} with {jobs} worker(s)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def request(address: Path, fields: dict) -> dict:
+    """Send a single request to the server at the socket `address`, and return its
+    response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(address))
+        with sock.makefile("rwb") as file:
+            file.write(json.dumps(fields).encode() + b"\n")
+            file.flush()
+            return json.loads(file.readline())
@@ -0,0 +1,114 @@
+import logging
+import re
+import sys
+from copy import deepcopy
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Sequence
+
+from aoc.utils.reporting import measure
+
+MODULE_RE = re.compile(r"\.y(?P<year>\d{4})\.d(?P<day>\d{2})\.solution$")
+
+
+@dataclass(frozen=True)
+class Solution:
+    """The parser and solvers of a single day, and how to call them.
+
+    Each solution module declares one of these as `SOLUTION`, so that the runner, the
+    benchmarks and the tests drive every day the same way, rather than relying on
+    each module's own conventions.
+    """
+
+    year: int
+    day: int
+    parse: Callable[[Path], Any]
+    # the solver of each part, which takes the parsed input (and any keywords)
+    parts: dict[int, Callable[..., Any]]
+    # the keywords passed to each part's solver for a real input, such as d11's
+    # `mult`; tests override them to match the examples
+    defaults: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # if True, a solver changes the parsed input, so each call needs its own copy;
+    # otherwise, the parsed input is safely shared between parts and repeats
+    mutates: bool = False
+    # named alternative implementations, as the keywords that select each one, which
+    # every part's solver takes (such as d06's `wins`); the first is the default
+    variants: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # the variant to use, or None for the default
+    impl: str | None = None
+
+    @classmethod
+    def of(cls, module: ModuleType) -> "Solution":
+        """Return the solution declared by `module`.
+
+        A module without a `SOLUTION` (such as one written before it was declared) is
+        described by its `parse` and `solve_part1` and `solve_part2` functions.
+        """
+        if isinstance(solution := getattr(module, "SOLUTION", None), Solution):
+            return solution
+
+        m = MODULE_RE.search(module.__name__)
+        year, day = (int(m.group("year")), int(m.group("day"))) if m else (0, 0)
+        parts = {
+            part: getattr(module, f"solve_part{part}")
+            for part in (1, 2)
+            if hasattr(module, f"solve_part{part}")
+        }
+
+        return cls(year, day, module.parse, parts)
+
+    def using(self, impl: str | None) -> "Solution":
+        """Return this solution with the variant named `impl` (None: the default).
+
+        Naming the default variant is the same as None, so that its stored answers
+        still apply. A solution without variants has just the one implementation,
+        whatever `impl`.
+
+        Raises:
+            ValueError: if the solution has variants, but none named `impl`
+        """
+        if impl is not None and self.variants and impl not in self.variants:
+            names = ", ".join(self.variants)
+            raise ValueError(f"no variant {impl!r} (choose from {names})")
+
+        if impl not in self.variants or impl == next(iter(self.variants)):
+            impl = None
+
+        return replace(self, impl=impl)
+
+    @property
+    def variant(self) -> str | None:
+        """The name of the variant in use, or None if there are no variants."""
+        return self.impl or next(iter(self.variants), None)
+
+    def kwargs(self, part: int, **overrides) -> dict[str, Any]:
+        """Return the keywords for the solver of `part`, with any `overrides`."""
+        variant = self.variants.get(self.variant, {})
+        return {**variant, **self.defaults.get(part, {}), **overrides}
+
+    def solve(self, part: int, data: Any, **overrides) -> Any:
+        """Return the answer to `part` for the parsed input `data`."""
+        return self.parts[part](data, **self.kwargs(part, **overrides))
+
+    def main(self, argv: Sequence[str] | None = None) -> int:
+        """Parse the input at argv[0] and print the answer and time of each part.
+
+        This is what running a solution module as a script does, as in
+        `python -m aoc.y2023.d06.solution input.txt`.
+        """
+        logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+        argv = sys.argv[1:] if argv is None else argv
+        data = self.parse(Path(argv[0]))
+
+        print()
+        for part, solve in self.parts.items():
+            args = deepcopy(data) if self.mutates else data
+            m = measure(solve, args, **self.kwargs(part))
+            print(f"part{part} | {timedelta(seconds=m.seconds)} | {m.result:>20} |")
+            for counter in m.counters:
+                print(f"part{part} | {counter}")
+
+        return 0
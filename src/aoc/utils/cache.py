@@ -0,0 +1,200 @@
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc.utils.hashing import hash_bytes, hash_file
+from aoc.utils.lazy import lazy_import, module_name
+from aoc.utils.state import state_path
+
+np = lazy_import("numpy")
+
+# The directory (within the state directory) for cached parse results.
+CACHE = "parse"
+
+# The maximum total size of cached parse results, in MiB, before the least recently
+# used results are evicted.
+MAX_MIB_ENV = "AOC_CACHE_MAX_MIB"
+MAX_MIB = 512
+
+
+def is_aoc(name: str | None) -> bool:
+    return isinstance(name, str) and (name == "aoc" or name.startswith("aoc."))
+
+
+def dependencies(module: ModuleType) -> list[ModuleType]:
+    """Return `module` and the aoc modules it uses, directly or indirectly.
+
+    A module is used if it (or a class or function defined in it) is a global of a
+    module already found.
+    """
+    found = {}
+    stack = [module]
+
+    while stack:
+        mod = stack.pop()
+        if mod.__name__ in found:
+            continue
+        found[mod.__name__] = mod
+
+        for value in vars(mod).values():
+            if isinstance(value, ModuleType):
+                # (looking up __name__ directly would load a lazy module)
+                name = module_name(value)
+            else:
+                name = getattr(value, "__module__", None)
+
+            if is_aoc(name) and name in sys.modules:
+                stack.append(sys.modules[name])
+
+    return [found[name] for name in sorted(found)]
+
+
+def source_hash(module: ModuleType) -> str:
+    """Return a hash of the source of `module` and the aoc modules it uses."""
+    sources = []
+    for mod in dependencies(module):
+        path = getattr(mod, "__file__", None)
+        if path is not None:
+            sources.append(mod.__name__.encode() + b"\0" + Path(path).read_bytes())
+
+    return hash_bytes(b"\0".join(sources))
+
+
+def content_key(module: ModuleType, path: Path) -> str:
+    """Return a key that changes whenever `module` (see `source_hash`) or `path` does."""
+    return f"{source_hash(module)}-{hash_file(path)}"
+
+
+def is_array(value: Any) -> bool:
+    return isinstance(value, np.ndarray) and value.dtype != object
+
+
+def is_arrays(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) and all(map(is_array, value))
+
+
+class ParseCache:
+    """A content-addressed, size-bounded cache of parse results on disk.
+
+    Results are keyed by a hash of the solution's source (see `source_hash`) and a
+    hash of the input file, so editing either one misses the cache. Arrays (and lists
+    or tuples of arrays) are stored as .npz; anything else is pickled. Whenever the
+    total size exceeds `max_bytes`, the least recently used results are evicted.
+    """
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None):
+        if root is None:
+            root = state_path(CACHE)
+        if max_bytes is None:
+            max_bytes = int(os.environ.get(MAX_MIB_ENV, MAX_MIB)) * 2**20
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for `key`, or raise KeyError."""
+        for path in self.root.glob(f"{key}.*"):
+            try:
+                value = self._read(path)
+            except Exception:
+                # an unreadable entry (for example, truncated) is just a miss
+                path.unlink(missing_ok=True)
+                continue
+
+            # mark the entry as recently used
+            os.utime(path)
+            return value
+
+        raise KeyError(key)
+
+    def put(self, key: str, value: Any) -> Path:
+        """Store `value` under `key`, then evict entries if over the size limit."""
+        suffix = ".npz" if is_array(value) or is_arrays(value) else ".pickle"
+        path = self.root / f"{key}{suffix}"
+
+        # write to a temporary file first so that concurrent readers never see a
+        # partially-written entry
+        with tempfile.NamedTemporaryFile(dir=self.root, delete=False) as f:
+            try:
+                self._write(f, value, suffix)
+            except BaseException:
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+        self.evict()
+
+        return path
+
+    def parse(self, parse: Callable[[Path], Any], path: Path) -> tuple[Any, bool]:
+        """Return the result of `parse(path)`, from the cache if possible.
+
+        Args:
+            parse (Callable): a solution module's parse function
+            path (Path): the input to parse
+
+        Returns:
+            tuple[Any, bool]: the parse result and whether it came from the cache
+        """
+        key = content_key(sys.modules[parse.__module__], path)
+        try:
+            return self.get(key), True
+        except KeyError:
+            pass
+
+        value = parse(path)
+        self.put(key, value)
+
+        return value, False
+
+    def entries(self) -> list[Path]:
+        return [p for p in self.root.iterdir() if p.suffix in (".npz", ".pickle")]
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under the size limit."""
+        entries = []
+        for path in self.entries():
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:
+                # another process evicted (or cleared) it since it was listed
+                continue
+        entries.sort(key=lambda e: e[0].st_mtime)
+        total = sum(stat.st_size for stat, _ in entries)
+
+        for stat, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def clear(self) -> None:
+        for path in self.entries():
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _write(file, value: Any, suffix: str) -> None:
+        if suffix == ".pickle":
+            pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+        elif is_array(value):
+            np.savez(file, array=value)
+        else:
+            np.savez(file, *value, kind=np.array(type(value).__name__))
+
+    @staticmethod
+    def _read(path: Path) -> Any:
+        if path.suffix == ".pickle":
+            with open(path, "rb") as f:
+                return pickle.load(f)
+
+        with np.load(path, allow_pickle=False) as npz:
+            if "array" in npz.files:
+                return npz["array"]
+
+            arrays = [npz[f"arr_{i}"] for i in range(len(npz.files) - 1)]
+            return tuple(arrays) if str(npz["kind"]) == "tuple" else arrays
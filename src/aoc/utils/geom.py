@@ -0,0 +1,91 @@
+from typing import Iterable, NamedTuple
+
+from aoc.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Building a vector through NamedTuple's generated __new__ costs a Python call, so the
+# operators below build their results with tuple.__new__ directly.
+_new = tuple.__new__
+
+# The offset that keeps a packed x non-negative (see `pack`).
+_BIAS = 1 << 31
+
+
+class Vec2d(NamedTuple):
+    """A 2D vector (or coordinate) in row-major (y, x) format.
+
+    Being a tuple, a vector has no per-instance dict, and it hashes and compares in C,
+    which matters for the sets and dicts of coordinates that most grid puzzles keep.
+    For moving many points at once, use the array functions of this module instead.
+    """
+
+    y: int = 0
+    x: int = 0
+
+    def __add__(self, other: "Vec2d") -> "Vec2d":
+        return _new(Vec2d, (self[0] + other[0], self[1] + other[1]))
+
+    def __sub__(self, other: "Vec2d") -> "Vec2d":
+        return _new(Vec2d, (self[0] - other[0], self[1] - other[1]))
+
+    def __mod__(self, other: "Vec2d") -> "Vec2d":
+        return _new(Vec2d, (self[0] % other[0], self[1] % other[1]))
+
+    def __mul__(self, scalar: int) -> "Vec2d":
+        return _new(Vec2d, (self[0] * scalar, self[1] * scalar))
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Vec2d":
+        return _new(Vec2d, (-self[0], -self[1]))
+
+    def det(self, other: "Vec2d") -> int:
+        """Return the determinant of the 2x2 matrix of (x, y) columns self and other."""
+        return self[1] * other[0] - self[0] * other[1]
+
+    def manhattan(self, other: "Vec2d" = (0, 0)) -> int:
+        return abs(self[0] - other[0]) + abs(self[1] - other[1])
+
+
+# The (dy, dx) of a step North, East, South and West.
+HEADINGS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def as_array(vecs: Iterable[tuple[int, int]]):
+    """Return an (N, 2) int64 array of the (y, x) of each of `vecs`."""
+    return np.array(list(vecs), dtype=np.int64).reshape(-1, 2)
+
+
+def as_vecs(points) -> list[Vec2d]:
+    """Return the rows of an (N, 2) array as vectors."""
+    return [_new(Vec2d, (y, x)) for y, x in points.tolist()]
+
+
+def neighbours(points, headings=HEADINGS):
+    """Return the (N * K, 2) array of each of N points moved by each of K headings."""
+    steps = np.asarray(headings, dtype=points.dtype)
+    return (points[:, np.newaxis, :] + steps[np.newaxis, :, :]).reshape(-1, 2)
+
+
+def wrap(points, size: tuple[int, int]):
+    """Return `points` on a grid of `size` that repeats forever in every direction."""
+    return points % np.asarray(size, dtype=points.dtype)
+
+
+def pack(points):
+    """Return a single int64 per point, which compares and sorts much faster than rows.
+
+    Points must lie within [-2**31, 2**31) on each axis.
+    """
+    return (points[:, 0] << 32) + (points[:, 1] + _BIAS)
+
+
+def unpack(keys):
+    """Return the (N, 2) array of points packed by `pack`."""
+    return np.stack([keys >> 32, (keys & 0xFFFFFFFF) - _BIAS], axis=1)
+
+
+def unique(points):
+    """Return the distinct rows of an (N, 2) array, sorted by (y, x)."""
+    return unpack(np.unique(pack(points)))
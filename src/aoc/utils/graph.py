@@ -0,0 +1,236 @@
+from collections import deque
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Callable, Iterable
+
+from aoc.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# The weighted edges out of a state, as (next state, weight) pairs.
+Edges = Callable[[int], Iterable[tuple[int, int]]]
+
+INF = float("inf")
+
+
+@dataclass
+class SearchStats:
+    """How much work a search did, to compare engines on the same problem."""
+
+    # the states popped and expanded (not counting stale queue entries)
+    expanded: int = 0
+    # the entries added to the queue
+    pushed: int = 0
+
+
+def dijkstra(
+    sources: Iterable[int],
+    edges: Edges,
+    is_target: Callable[[int], bool],
+    stats: SearchStats | None = None,
+) -> int | None:
+    """Return the shortest distance from any source to a target, or None.
+
+    States are integers, so the caller can pack whatever a state needs (a position,
+    a heading, a run length) into one hashable, cheaply compared value. The queue
+    is a binary heap (`heapq`) of (distance, state) pairs with lazy deletion.
+
+    Args:
+        sources (Iterable[int]): the states to start from, at distance 0
+        edges (Edges): the (next state, weight) pairs out of a state
+        is_target (Callable[[int], bool]): whether a state is a target
+        stats (SearchStats | None): if not None, counters to update
+
+    Returns:
+        int | None: the distance of the nearest target, or None if none is reachable
+    """
+    stats = stats if stats is not None else SearchStats()
+
+    best = {}
+    heap = []
+    for state in sources:
+        best[state] = 0
+        heappush(heap, (0, state))
+        stats.pushed += 1
+
+    while heap:
+        dist, state = heappop(heap)
+        if dist > best[state]:
+            continue
+        stats.expanded += 1
+
+        if is_target(state):
+            return dist
+
+        for next_state, weight in edges(state):
+            next_dist = dist + weight
+            if next_dist < best.get(next_state, INF):
+                best[next_state] = next_dist
+                heappush(heap, (next_dist, next_state))
+                stats.pushed += 1
+
+    return None
+
+
+def astar(
+    sources: Iterable[int],
+    edges: Edges,
+    is_target: Callable[[int], bool],
+    heuristic: Callable[[int], int],
+    stats: SearchStats | None = None,
+) -> int | None:
+    """Return the shortest distance from any source to a target, or None.
+
+    This is `dijkstra` ordered by distance plus `heuristic`, which must never
+    overestimate the distance from a state to the nearest target. The better the
+    bound, the fewer states are expanded.
+
+    Args:
+        sources (Iterable[int]): the states to start from, at distance 0
+        edges (Edges): the (next state, weight) pairs out of a state
+        is_target (Callable[[int], bool]): whether a state is a target
+        heuristic (Callable[[int], int]): a lower bound on the distance to a target
+        stats (SearchStats | None): if not None, counters to update
+
+    Returns:
+        int | None: the distance of the nearest target, or None if none is reachable
+    """
+    stats = stats if stats is not None else SearchStats()
+
+    best = {}
+    heap = []
+    for state in sources:
+        best[state] = 0
+        heappush(heap, (heuristic(state), 0, state))
+        stats.pushed += 1
+
+    while heap:
+        _, dist, state = heappop(heap)
+        if dist > best[state]:
+            continue
+        stats.expanded += 1
+
+        if is_target(state):
+            return dist
+
+        for next_state, weight in edges(state):
+            next_dist = dist + weight
+            if next_dist < best.get(next_state, INF):
+                best[next_state] = next_dist
+                heappush(
+                    heap, (next_dist + heuristic(next_state), next_dist, next_state)
+                )
+                stats.pushed += 1
+
+    return None
+
+
+def dial(
+    sources: Iterable[int],
+    edges: Edges,
+    is_target: Callable[[int], bool],
+    max_weight: int,
+    stats: SearchStats | None = None,
+) -> int | None:
+    """Return the shortest distance from any source to a target, or None.
+
+    This is `dijkstra` with a bucket queue (Dial's algorithm) in place of the heap:
+    with integer weights of at most `max_weight`, every queued distance lies within
+    `max_weight` of the current one, so a ring of `max_weight + 1` lists replaces
+    O(log n) heap operations with O(1) appends and pops.
+
+    Args:
+        sources (Iterable[int]): the states to start from, at distance 0
+        edges (Edges): the (next state, weight) pairs out of a state
+        is_target (Callable[[int], bool]): whether a state is a target
+        max_weight (int): the largest weight of any edge
+        stats (SearchStats | None): if not None, counters to update
+
+    Returns:
+        int | None: the distance of the nearest target, or None if none is reachable
+
+    Raises:
+        ValueError: if an edge weighs more than `max_weight` or less than zero
+    """
+    stats = stats if stats is not None else SearchStats()
+
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    best = {}
+    # the entries left in the buckets, counted here rather than from `stats`, which
+    # the caller may have passed to other searches too
+    queued = 0
+    for state in sources:
+        best[state] = 0
+        buckets[0].append(state)
+        queued += 1
+        stats.pushed += 1
+
+    dist = 0
+    while queued:
+        bucket = buckets[dist % size]
+        while bucket:
+            state = bucket.pop()
+            queued -= 1
+            if best[state] < dist:
+                continue
+            stats.expanded += 1
+
+            if is_target(state):
+                return dist
+
+            for next_state, weight in edges(state):
+                if not 0 <= weight <= max_weight:
+                    raise ValueError(f"weight {weight} not in [0, {max_weight}]")
+
+                next_dist = dist + weight
+                if next_dist < best.get(next_state, INF):
+                    best[next_state] = next_dist
+                    buckets[next_dist % size].append(next_state)
+                    queued += 1
+                    stats.pushed += 1
+        dist += 1
+
+    return None
+
+
+def bfs(
+    sources: Iterable[int],
+    neighbours: Callable[[int], Iterable[int]],
+    size: int,
+    stats: SearchStats | None = None,
+):
+    """Return the number of steps from the nearest source to every state.
+
+    Args:
+        sources (Iterable[int]): the states to start from, in [0, size)
+        neighbours (Callable[[int], Iterable[int]]): the states one step from a state
+        size (int): the number of states
+        stats (SearchStats | None): if not None, counters to update
+
+    Returns:
+        ndarray: the steps to each state, or -1 where a state is unreachable
+    """
+    stats = stats if stats is not None else SearchStats()
+
+    # a list is much faster than an ndarray to index one element at a time
+    dist = [-1] * size
+    queue = deque()
+    for state in sources:
+        if dist[state] < 0:
+            dist[state] = 0
+            queue.append(state)
+            stats.pushed += 1
+
+    while queue:
+        state = queue.popleft()
+        stats.expanded += 1
+
+        steps = dist[state] + 1
+        for next_state in neighbours(state):
+            if dist[next_state] < 0:
+                dist[next_state] = steps
+                queue.append(next_state)
+                stats.pushed += 1
+
+    return np.array(dist, dtype=np.int64)
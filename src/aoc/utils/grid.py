@@ -0,0 +1,213 @@
+from pathlib import Path
+from typing import Iterator
+
+from aoc.utils.io import Buffer, frombuffer, mapped
+from aoc.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+NEWLINE = ord("\n")
+
+# The (dy, dx) offsets of the orthogonal and diagonal neighbours of a cell.
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+
+
+def code(value: str | int) -> int:
+    """Return the byte stored for `value`, a single character or a byte."""
+    return ord(value) if isinstance(value, str) else value
+
+
+class Grid:
+    """A 2-D grid of single-byte cells, backed by a `uint8` ndarray.
+
+    A cell holds the byte of its character in the input, so a grid costs a byte per
+    cell (an `np.str_` array costs 4 and a dict of tuples about 100). Positions are
+    (y, x) tuples. Rotations and flips return views sharing the same cells.
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells):
+        self.cells = np.asarray(cells, dtype=np.uint8)
+
+    @classmethod
+    def parse(cls, text: Buffer | str) -> "Grid":
+        """Return the grid of a block of equal-length lines.
+
+        The cells are the only copy made of `text` (unless it has CRLF line endings),
+        so a grid can be parsed straight from a memory-mapped input.
+
+        Raises:
+            ValueError: if the lines aren't all the same length
+        """
+        if isinstance(text, str):
+            text = text.encode()
+        if text.find(b"\r") >= 0:
+            text = bytes(text).replace(b"\r\n", b"\n")
+
+        flat = frombuffer(text)
+        start, end = 0, len(flat)
+        while start < end and flat[start] == NEWLINE:
+            start += 1
+        while end > start and flat[end - 1] == NEWLINE:
+            end -= 1
+        flat = flat[start:end]
+
+        width = text.find(b"\n", start, end) - start
+        if width < 0:
+            return cls(flat.reshape(1, -1).copy())
+
+        # Each row is `width` cells and a newline, which the reshape leaves in a column.
+        # The last row has no newline, so it's copied separately.
+        height, rest = divmod(len(flat) + 1, width + 1)
+        if rest != 0:
+            raise ValueError("ragged grid")
+        rows = flat[: (height - 1) * (width + 1)].reshape(height - 1, width + 1)
+        if np.any(rows[:, width] != NEWLINE):
+            raise ValueError("ragged grid")
+
+        cells = np.empty((height, width), dtype=np.uint8)
+        cells[:-1] = rows[:, :width]
+        cells[-1] = flat[(height - 1) * (width + 1) :]
+
+        return cls(cells)
+
+    @classmethod
+    def parse_many(cls, text: bytes | str) -> list["Grid"]:
+        """Return the grids of blocks separated by blank lines."""
+        if isinstance(text, str):
+            text = text.encode()
+        blocks = text.replace(b"\r\n", b"\n").strip(b"\n").split(b"\n\n")
+
+        return [cls.parse(block) for block in blocks]
+
+    @classmethod
+    def read(cls, path: Path) -> "Grid":
+        """Return the grid in the file at `path`."""
+        with mapped(path) as buf:
+            return cls.parse(buf)
+
+    def __repr__(self) -> str:
+        return f"Grid({self.height}x{self.width})"
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    def __array__(self, dtype=None):
+        return self.cells if dtype is None else self.cells.astype(dtype)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __setitem__(self, key, value) -> None:
+        self.cells[key] = code(value)
+
+    def __contains__(self, pos: tuple[int, int]) -> bool:
+        y, x = pos
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def copy(self) -> "Grid":
+        return Grid(self.cells.copy())
+
+    def key(self) -> bytes:
+        """Return the cells as bytes, to hash or compare grids cheaply."""
+        return self.cells.tobytes()
+
+    def get(self, pos: tuple[int, int], default: int | None = None) -> int | None:
+        """Return the byte at `pos`, or `default` if it's out of bounds."""
+        return int(self.cells[pos]) if pos in self else default
+
+    def wrap(self, pos: tuple[int, int]) -> int:
+        """Return the byte at `pos` on a grid that repeats forever in every direction."""
+        y, x = pos
+        return int(self.cells[y % self.height, x % self.width])
+
+    def mask(self, value: str | int):
+        """Return a boolean array of the cells equal to `value`."""
+        return self.cells == code(value)
+
+    def find(self, value: str | int):
+        """Return an (n, 2) array of the positions of cells equal to `value`."""
+        return np.argwhere(self.mask(value))
+
+    def find_one(self, value: str | int) -> tuple[int, int] | None:
+        """Return the first position (in row order) of `value`, or None."""
+        index = np.flatnonzero(self.mask(value))
+        if len(index) == 0:
+            return None
+        y, x = divmod(int(index[0]), self.width)
+        return (y, x)
+
+    def neighbours(
+        self, pos: tuple[int, int], diagonal: bool = False
+    ) -> Iterator[tuple[int, int]]:
+        """Yield the in-bounds neighbours of `pos`."""
+        y, x = pos
+        for dy, dx in ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL:
+            if (y + dy, x + dx) in self:
+                yield (y + dy, x + dx)
+
+    def shift(self, dy: int, dx: int, fill: int = 0):
+        """Return the cells moved by (dy, dx), filling the cells uncovered with `fill`.
+
+        The cell at (y, x) of the result is the cell at (y - dy, x - dx) of the grid.
+        """
+        return shift(self.cells, dy, dx, fill)
+
+    def count_neighbours(self, value: str | int, diagonal: bool = False):
+        """Return an array of how many neighbours of each cell are equal to `value`."""
+        mask = self.mask(value).astype(np.uint8)
+        return sum(
+            shift(mask, dy, dx)
+            for dy, dx in (ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL)
+        )
+
+    def rot90(self, k: int = 1) -> "Grid":
+        """Return a view rotated counterclockwise `k` times."""
+        return Grid(np.rot90(self.cells, k))
+
+    def fliplr(self) -> "Grid":
+        """Return a view with each row reversed."""
+        return Grid(self.cells[:, ::-1])
+
+    def flipud(self) -> "Grid":
+        """Return a view with the rows in reverse order."""
+        return Grid(self.cells[::-1])
+
+    def transpose(self) -> "Grid":
+        """Return a view with rows and columns swapped."""
+        return Grid(self.cells.T)
+
+
+def shift(cells, dy: int, dx: int, fill: int = 0):
+    """Return `cells` moved by (dy, dx), filling the cells uncovered with `fill`."""
+    out = np.full_like(cells, fill)
+    h, w = cells.shape
+    if abs(dy) >= h or abs(dx) >= w:
+        return out
+
+    out[max(dy, 0) : h + min(dy, 0), max(dx, 0) : w + min(dx, 0)] = cells[
+        max(-dy, 0) : h + min(-dy, 0), max(-dx, 0) : w + min(-dx, 0)
+    ]
+    return out
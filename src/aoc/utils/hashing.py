@@ -0,0 +1,12 @@
+import hashlib
+from pathlib import Path
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return a short, stable hex digest of `data`."""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def hash_file(path: Path) -> str:
+    """Return a short, stable hex digest of the contents of the file at `path`."""
+    return hash_bytes(Path(path).read_bytes())
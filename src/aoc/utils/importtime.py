@@ -0,0 +1,78 @@
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Iterable
+
+# A line of `python -X importtime` output, such as
+# "import time:       283 |        583 |         struct".
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """The time taken to import one module, as reported by `-X importtime`."""
+
+    name: str
+    # microseconds spent in the module itself, and including the imports it made
+    self_us: int
+    cumulative_us: int
+    # how deeply nested the import was (0 for imports made by the importing code)
+    depth: int
+
+
+def parse_importtime(output: str, name: str) -> list[ImportTime]:
+    """Return the imports made while importing `name` from `-X importtime` output.
+
+    This includes `name`'s parent packages and every import nested within them, but
+    not the imports made at interpreter start-up.
+    """
+    times = []
+    pending = []
+
+    # children are reported before their parent, so collect nested imports until
+    # the top-level import they belong to is known
+    for line in output.splitlines():
+        m = LINE_RE.match(line)
+        if m is None:
+            continue
+
+        entry = ImportTime(
+            m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2
+        )
+        pending.append(entry)
+
+        if entry.depth == 0:
+            if name == entry.name or name.startswith(f"{entry.name}."):
+                times.extend(pending)
+            pending = []
+
+    return times
+
+
+def import_times(name: str) -> list[ImportTime]:
+    """Import module `name` in a fresh interpreter and return its import times."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return parse_importtime(proc.stderr, name)
+
+
+def total_us(times: Iterable[ImportTime]) -> int:
+    """Return the total microseconds of the top-level imports in `times`."""
+    return sum(t.cumulative_us for t in times if t.depth == 0)
+
+
+def summarize_import_times(times: Iterable[ImportTime], top: int = 20) -> str:
+    """Return the top modules by self time, in the style of `summarize_profile`."""
+    times = list(times)
+
+    lines = [f"{total_us(times)} us", f"{'self':>8} {'total':>8}  module"]
+    for t in sorted(times, key=lambda t: -t.self_us)[:top]:
+        lines.append(f"{t.self_us:>8} {t.cumulative_us:>8}  {t.name}")
+
+    return "\n".join(lines)
@@ -0,0 +1,173 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Sequence
+
+
+class Interval:
+    """A half-open range of integers [lo, hi), which is empty if hi <= lo.
+
+    Unlike `range`, intervals intersect, subtract and split. Every empty interval
+    compares equal (and is stored as [0, 0)).
+    """
+
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo: int, hi: int):
+        if hi <= lo:
+            lo = hi = 0
+        self.lo = lo
+        self.hi = hi
+
+    @classmethod
+    def closed(cls, first: int, last: int) -> "Interval":
+        """Return the interval of `first` to `last`, inclusive."""
+        return cls(first, last + 1)
+
+    def __repr__(self) -> str:
+        return f"Interval({self.lo}, {self.hi})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return self.lo == other.lo and self.hi == other.hi
+
+    def __hash__(self) -> int:
+        return hash((self.lo, self.hi))
+
+    def __len__(self) -> int:
+        return self.hi - self.lo
+
+    def __bool__(self) -> bool:
+        return self.hi > self.lo
+
+    def __contains__(self, value: int) -> bool:
+        return self.lo <= value < self.hi
+
+    def __le__(self, other: "Interval") -> bool:
+        """Return whether this is a subset of `other`."""
+        return not self or (other.lo <= self.lo and self.hi <= other.hi)
+
+    def __and__(self, other: "Interval") -> "Interval":
+        """Return the intersection."""
+        return Interval(max(self.lo, other.lo), min(self.hi, other.hi))
+
+    def __or__(self, other: "Interval") -> "IntervalSet":
+        """Return the union."""
+        return IntervalSet((self, other))
+
+    def __sub__(self, other: "Interval") -> "IntervalSet":
+        """Return the integers not in `other`, as up to two intervals."""
+        if not other:
+            return IntervalSet((self,))
+        return IntervalSet(
+            (Interval(self.lo, min(self.hi, other.lo)), Interval(other.hi, self.hi))
+        )
+
+    @property
+    def last(self) -> int:
+        """Return the greatest integer in a non-empty interval."""
+        return self.hi - 1
+
+    def shift(self, offset: int) -> "Interval":
+        return Interval(self.lo + offset, self.hi + offset)
+
+    def split(self, breaks: Sequence[int]) -> list["Interval"]:
+        """Return the pieces of this interval between each of the sorted `breaks`."""
+        if not self:
+            return []
+
+        # only the breaks strictly inside the interval split it
+        inner = breaks[bisect_right(breaks, self.lo) : bisect_left(breaks, self.hi)]
+        bounds = [self.lo, *inner, self.hi]
+
+        return [Interval(lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+
+
+class IntervalSet:
+    """A set of integers, stored as sorted, disjoint and non-adjacent intervals.
+
+    Overlapping and adjacent intervals are coalesced as the set is built, so the
+    number of intervals stays as small as the set allows however it's combined.
+    """
+
+    __slots__ = ("spans",)
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        spans = []
+        for interval in sorted((i for i in intervals if i), key=lambda i: i.lo):
+            if spans and interval.lo <= spans[-1].hi:
+                if interval.hi > spans[-1].hi:
+                    spans[-1] = Interval(spans[-1].lo, interval.hi)
+            else:
+                spans.append(interval)
+
+        self.spans: tuple[Interval, ...] = tuple(spans)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self.spans)})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.spans == other.spans
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self.spans)
+
+    def __bool__(self) -> bool:
+        return bool(self.spans)
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.spans, value, key=lambda span: span.lo) - 1
+        return i >= 0 and value in self.spans[i]
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        """Return the union."""
+        return IntervalSet(self.spans + other.spans)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        """Return the intersection."""
+        out = []
+        i = j = 0
+        # walk both sorted lists together, advancing whichever interval ends first
+        while i < len(self.spans) and j < len(other.spans):
+            lhs, rhs = self.spans[i], other.spans[j]
+            if overlap := lhs & rhs:
+                out.append(overlap)
+            if lhs.hi <= rhs.hi:
+                i += 1
+            else:
+                j += 1
+
+        return IntervalSet(out)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        """Return the integers not in `other`."""
+        out = []
+        j = 0
+        for span in self.spans:
+            lo = span.lo
+            # skip the intervals of other that end before this one starts
+            while j < len(other.spans) and other.spans[j].hi <= lo:
+                j += 1
+            k = j
+            while k < len(other.spans) and other.spans[k].lo < span.hi:
+                out.append(Interval(lo, other.spans[k].lo))
+                lo = max(lo, other.spans[k].hi)
+                k += 1
+            out.append(Interval(lo, span.hi))
+
+        return IntervalSet(out)
+
+    @property
+    def size(self) -> int:
+        """Return the number of integers in the set."""
+        return sum(len(span) for span in self.spans)
+
+    @property
+    def lo(self) -> int:
+        """Return the least integer in a non-empty set."""
+        return self.spans[0].lo
+
+    def split(self, breaks: Sequence[int]) -> list[Interval]:
+        """Return the pieces of every interval between each of the sorted `breaks`."""
+        return [piece for span in self.spans for piece in span.split(breaks)]
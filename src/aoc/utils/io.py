@@ -0,0 +1,89 @@
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from aoc.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# A buffer that can be searched without copying it.
+Buffer = bytes | mmap.mmap
+
+
+@contextmanager
+def mapped(path: Path) -> Iterator[Buffer]:
+    """Memory-map the file at `path` read-only for the duration of the context.
+
+    Pages are read from the page cache as they're touched, so an input is never
+    decoded or copied whole; only what a parse keeps costs memory. Views into the map
+    (memoryviews and arrays from this module) must not outlive the context, so copy
+    whatever the parse returns.
+    """
+    with open(path, "rb") as file:
+        # an empty file can't be mapped
+        if Path(path).stat().st_size == 0:
+            yield b""
+            return
+
+        buf = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield buf
+        finally:
+            try:
+                buf.close()
+            except BufferError:
+                # a view is still alive, so leave the map for the garbage collector
+                pass
+
+
+def split(
+    buf: Buffer, sep: bytes, start: int = 0, end: int | None = None
+) -> Iterator[memoryview]:
+    """Yield a view of each `sep`-separated item of buf[start:end], without copying.
+
+    Like `bytes.split`, n separators make n + 1 items, some of which may be empty.
+    """
+    end = len(buf) if end is None else end
+    view = memoryview(buf)
+
+    while (stop := buf.find(sep, start, end)) >= 0:
+        yield view[start:stop]
+        start = stop + len(sep)
+
+    yield view[start:end]
+
+
+def lines(buf: Buffer) -> Iterator[memoryview]:
+    """Yield a view of each line, without its line ending, and without copying."""
+    end = len(buf)
+    if end == 0:
+        return
+    # unlike split, a trailing newline doesn't start another (empty) line
+    if buf[end - 1] == ord("\n"):
+        end -= 1
+
+    for line in split(buf, b"\n", 0, end):
+        yield line[:-1] if len(line) and line[-1] == ord("\r") else line
+
+
+def count(buf: Buffer, sep: bytes, start: int = 0, end: int | None = None) -> int:
+    """Return the number of items that `split` would yield."""
+    end = len(buf) if end is None else end
+    if isinstance(buf, bytes):
+        return buf.count(sep, start, end) + 1
+
+    # mmap has no count, but finding each separator doesn't copy either
+    n = 1
+    while (stop := buf.find(sep, start, end)) >= 0:
+        n += 1
+        start = stop + len(sep)
+
+    return n
+
+
+def frombuffer(buf: Buffer, dtype="uint8"):
+    """Return a read-only ndarray view of the bytes of `buf`, without copying."""
+    if len(buf) == 0:
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(buf, dtype=dtype)
@@ -0,0 +1,91 @@
+import multiprocessing
+import resource
+import signal
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+
+def describe_exit(exitcode: int | None) -> str:
+    """Return how a child process with `exitcode` ended, such as "SIGKILL"."""
+    if exitcode is not None and exitcode < 0:
+        try:
+            return signal.Signals(-exitcode).name
+        except ValueError:
+            return f"signal {-exitcode}"
+    return f"exit code {exitcode}"
+
+
+def _child(
+    conn: Connection, func: Callable, args: tuple, kwargs: dict, memory: int | None
+) -> None:
+    if memory is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory, hard))
+
+    try:
+        value = (True, func(*args, **kwargs))
+    except BaseException as e:
+        value = (False, e)
+
+    try:
+        conn.send(value)
+    except Exception as e:
+        # the result (or the exception) couldn't be pickled
+        conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+def isolated(
+    func: Callable,
+    /,
+    *args,
+    timeout: float | None = None,
+    memory: int | None = None,
+    **kwargs,
+) -> Any:
+    """Call `func` with `args` and `kwargs` in a forked child process, within limits.
+
+    The child inherits everything imported or computed so far, and only its result is
+    pickled back, so `func` itself needn't be picklable. However the call goes, the
+    child is gone when this returns, so a call that runs away costs at most its
+    budget.
+
+    Args:
+        func (Callable): the function to call
+        timeout (float | None): the wall-clock seconds to wait for the result before
+            killing the child, or None to wait forever
+        memory (int | None): the most bytes of address space the child may map (see
+            RLIMIT_AS), including what it inherits, or None for no limit; beyond it,
+            allocations fail with MemoryError
+
+    Returns:
+        Any: the result of the call
+
+    Raises:
+        TimeoutError: if the call took longer than `timeout`
+        ChildProcessError: if the child died without a result (for example, killed
+            by a signal)
+        Exception: whatever the call raised
+    """
+    context = multiprocessing.get_context("fork")
+    recv, send = context.Pipe(duplex=False)
+    child = context.Process(target=_child, args=(send, func, args, kwargs, memory))
+
+    child.start()
+    send.close()
+    try:
+        if not recv.poll(timeout):
+            raise TimeoutError(f"took longer than {timeout:g}s")
+        try:
+            ok, value = recv.recv()
+        except EOFError:
+            child.join()
+            raise ChildProcessError(f"died with {describe_exit(child.exitcode)}")
+    finally:
+        if child.is_alive():
+            child.kill()
+        child.join()
+        recv.close()
+
+    if not ok:
+        raise value
+    return value
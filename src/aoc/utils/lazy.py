@@ -0,0 +1,36 @@
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return the module `name`, deferring its execution until first attribute access.
+
+    This keeps heavy dependencies such as numpy out of the start-up time of code
+    that imports them but doesn't always use them:
+
+        np = lazy_import("numpy")
+
+    If the module is already imported, it's returned as is. Only top-level packages
+    benefit: finding a submodule imports its parents, so use `np.polynomial` rather
+    than `lazy_import("numpy.polynomial")`.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
+def module_name(module: ModuleType) -> str:
+    """Return the name of `module` without loading it, if lazy."""
+    return object.__getattribute__(module, "__name__")
@@ -0,0 +1,106 @@
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from aoc.utils.lazy import lazy_import
+from aoc.utils.state import state_path
+
+np = lazy_import("numpy")
+
+ANSWERS = "answers.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    answer TEXT,
+    seconds REAL NOT NULL,
+    created TEXT NOT NULL,
+    PRIMARY KEY (key, stage)
+)
+"""
+
+
+@dataclass(frozen=True)
+class Memo:
+    """A stored answer and how long it originally took to compute."""
+
+    answer: Any
+    seconds: float
+
+
+def encode(answer: Any) -> str | None:
+    """Return `answer` as JSON, or None if it can't be stored."""
+
+    def default(value):
+        # solvers often return numpy scalars, such as np.int64 from a sum
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(type(value).__name__)
+
+    try:
+        return json.dumps(answer, default=default)
+    except (TypeError, ValueError):
+        return None
+
+
+class AnswerStore:
+    """A persistent store of answers (and their timings) by content key and stage.
+
+    The key is a `content_key`, so an answer is only found while both the solution's
+    source and its input are unchanged. Stages without an answer (such as parse)
+    record just their timing.
+    """
+
+    def __init__(self, path: Path | None = None):
+        # several worker processes may write at once, so wait on the lock for a while
+        self.conn = sqlite3.connect(path or state_path(ANSWERS), timeout=30)
+        self.conn.execute(SCHEMA)
+
+    def __enter__(self) -> "AnswerStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def get(self, key: str) -> dict[str, Memo]:
+        """Return the stored memo of each stage for `key`."""
+        rows = self.conn.execute(
+            "SELECT stage, answer, seconds FROM answers WHERE key = ?", (key,)
+        )
+        return {
+            stage: Memo(None if answer is None else json.loads(answer), seconds)
+            for stage, answer, seconds in rows
+        }
+
+    def put(self, key: str, stage: str, answer: Any, seconds: float) -> bool:
+        """Store the answer and time of a stage, replacing any previous one.
+
+        Returns:
+            bool: whether it was stored; answers that can't be encoded as JSON aren't
+        """
+        encoded = None
+        if answer is not None:
+            encoded = encode(answer)
+            if encoded is None:
+                return False
+
+        created = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO answers (key, stage, answer, seconds, created) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, stage, encoded, seconds, created),
+            )
+
+        return True
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM answers")
@@ -0,0 +1,91 @@
+import os
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Set to a non-empty value other than "0" to have `counted` loops record their
+# iterations, which `report` then logs with the answer (see `enable`).
+COUNTS_ENV = "AOC_REPORT_COUNTS"
+
+
+@dataclass
+class Counter:
+    """The iterations of every loop with the same name, and the seconds they took."""
+
+    name: str
+    count: int = 0
+    seconds: float = 0.0
+    loops: int = 0
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name} | {self.count} iterations in {self.loops} loop(s) | "
+            f"{self.seconds:.6f}s | {self.rate:,.0f}/s"
+        )
+
+
+COUNTERS: dict[str, Counter] = {}
+
+ENABLED = os.environ.get(COUNTS_ENV, "") not in ("", "0")
+
+
+def enable(enabled: bool = True) -> None:
+    """Turn counting on (or off) for loops started from now on."""
+    global ENABLED
+    ENABLED = enabled
+
+
+def counted(iterable: Iterable[T], name: str) -> Iterable[T]:
+    """Count the iterations of a loop over `iterable` under `name`, if enabled.
+
+    This takes the place of a progress bar around a hot loop. When counting is
+    disabled (the default), `iterable` is returned as is, so the loop runs exactly as
+    if it weren't wrapped. When enabled, each iteration adds to the named `Counter`,
+    along with the time from the start of the loop to its end (or its `break`).
+
+    Args:
+        iterable (Iterable[T]): what the loop iterates over
+        name (str): the name to count under, shared by loops that add up together
+
+    Returns:
+        Iterable[T]: `iterable`, or a generator over it that counts
+    """
+    if not ENABLED:
+        return iterable
+
+    return _counting(iterable, COUNTERS.setdefault(name, Counter(name)))
+
+
+def _counting(iterable: Iterable[T], counter: Counter) -> Iterator[T]:
+    t0 = perf_counter()
+    try:
+        for item in iterable:
+            counter.count += 1
+            yield item
+    finally:
+        counter.seconds += perf_counter() - t0
+        counter.loops += 1
+
+
+def snapshot() -> dict[str, tuple[int, float, int]]:
+    """Return the count, seconds and loops of every counter so far."""
+    return {c.name: (c.count, c.seconds, c.loops) for c in COUNTERS.values()}
+
+
+def since(before: dict[str, tuple[int, float, int]]) -> list[Counter]:
+    """Return what each counter has added since the `snapshot` `before`."""
+    counters = []
+    for c in COUNTERS.values():
+        count, seconds, loops = before.get(c.name, (0, 0.0, 0))
+        if c.loops > loops:
+            counters.append(
+                Counter(c.name, c.count - count, c.seconds - seconds, c.loops - loops)
+            )
+
+    return counters
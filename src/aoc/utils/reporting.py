@@ -1,21 +1,301 @@
 # define the benchmark decorator
+import cProfile
+import io
 import logging
+import os
+import pstats
+import resource
+import signal
+import sys
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
 from datetime import timedelta
 from functools import wraps
+from pathlib import Path
 from time import perf_counter
+from typing import Any, Callable
 
+from aoc.utils import progress
+from aoc.utils.sampling import Sampler, summarize_collapsed
 
-def report(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
+# Set to a non-empty value other than "0" to have `report` record memory and resource
+# usage for every call (see `configure`).
+MEMORY_ENV = "AOC_REPORT_MEMORY"
+
+# Set to a directory to have `report` profile every call with cProfile, writing one
+# .pstats file per function and logging the top functions by cumulative time. Set
+# AOC_PROFILER=sampling to use the sampling profiler instead, which writes collapsed
+# stacks (.collapsed) for flamegraph tools.
+PROFILE_ENV = "AOC_PROFILE"
+PROFILE_TOP_ENV = "AOC_PROFILE_TOP"
+PROFILER_ENV = "AOC_PROFILER"
+
+# The profilers supported by `measure`, and the suffix of the files they write.
+PROFILERS = {"cprofile": ".pstats", "sampling": ".collapsed"}
+
+
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, "") not in ("", "0")
+
+
+def env_path(name: str) -> Path | None:
+    return Path(os.environ[name]) if os.environ.get(name) else None
+
+
+@dataclass
+class Options:
+    """The opt-in measurements made by `report`."""
+
+    # record tracemalloc and getrusage numbers (tracing slows allocation-heavy code)
+    memory: bool = env_flag(MEMORY_ENV)
+    # the directory for .pstats files, or None to not profile
+    profile: Path | None = env_path(PROFILE_ENV)
+    # the number of functions logged from each profile, or None to read it from
+    # AOC_PROFILE_TOP when a profile is logged (see `profile_top`)
+    top: int | None = None
+    # the profiler to use (see PROFILERS)
+    profiler: str = os.environ.get(PROFILER_ENV, "cprofile")
+
+
+OPTIONS = Options()
+
+
+def profile_top() -> int:
+    """Return the number of functions `report` logs from each profile.
+
+    Unless set with `configure(top=...)`, this is AOC_PROFILE_TOP, or 20 if that's
+    unset or isn't an integer (which is logged as a warning, rather than failing).
+    """
+    if OPTIONS.top is not None:
+        return OPTIONS.top
+
+    value = os.environ.get(PROFILE_TOP_ENV, "")
+    try:
+        return int(value) if value else 20
+    except ValueError:
+        log = logging.getLogger(__name__)
+        log.warning(f"{PROFILE_TOP_ENV} should be an integer, not {value!r}; using 20")
+        return 20
+
+
+def configure(**kwargs) -> None:
+    """Update the options used by `report`, such as `configure(memory=True)`."""
+    for key, value in kwargs.items():
+        if not hasattr(OPTIONS, key):
+            raise TypeError(f"unknown option: {key}")
+        setattr(OPTIONS, key, value)
+
+
+@dataclass(frozen=True)
+class Usage:
+    """The change in process resource usage over a call (see `resource.getrusage`)."""
+
+    # user and system CPU seconds
+    utime: float
+    stime: float
+    # the peak resident set size of the process (not a delta) in bytes
+    maxrss: int
+    # voluntary and involuntary context switches
+    nvcsw: int
+    nivcsw: int
+
+    @classmethod
+    def between(cls, before: resource.struct_rusage, after: resource.struct_rusage):
+        # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+
+        return cls(
+            after.ru_utime - before.ru_utime,
+            after.ru_stime - before.ru_stime,
+            after.ru_maxrss * scale,
+            after.ru_nvcsw - before.ru_nvcsw,
+            after.ru_nivcsw - before.ru_nivcsw,
+        )
+
+
+@dataclass
+class Measurement:
+    """The result of a single timed call."""
+
+    name: str
+    result: Any
+    seconds: float
+    # the peak and final bytes traced by tracemalloc during the call, if measured
+    peak: int | None = None
+    current: int | None = None
+    usage: Usage | None = None
+    # the profile written for the call, if profiled
+    profile: Path | None = None
+    # the loops counted during the call, if counting (see `progress.counted`)
+    counters: list[progress.Counter] = field(default_factory=list)
+
+
+def start_profiler(kind: str) -> cProfile.Profile | Sampler | None:
+    """Return a newly started profiler, or None if another profiler is active.
+
+    Args:
+        kind (str): "cprofile" or "sampling" (see PROFILERS)
+    """
+    if kind == "sampling":
+        # the sampler relies on a signal handler, which only the main thread can set
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        if signal.getsignal(signal.SIGPROF) not in (signal.SIG_DFL, signal.SIG_IGN):
+            return None
+
+        sampler = Sampler()
+        sampler.start()
+        return sampler
+
+    if kind != "cprofile":
+        raise ValueError(f"unknown profiler: {kind}")
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None
+
+    return profiler
+
+
+def stop_profiler(profiler: cProfile.Profile | Sampler) -> None:
+    if isinstance(profiler, Sampler):
+        profiler.stop()
+    else:
+        profiler.disable()
+
+
+def dump_profile(profiler: cProfile.Profile | Sampler, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(profiler, Sampler):
+        profiler.write(path)
+    else:
+        profiler.dump_stats(path)
+
+
+def measure(
+    func: Callable,
+    /,
+    *args,
+    memory: bool = False,
+    profile: Path | None = None,
+    profiler: str = "cprofile",
+    **kwargs,
+) -> Measurement:
+    """Call `func` with `args` and `kwargs` and measure how long it takes.
+
+    Args:
+        func (Callable): the function to call
+        memory (bool): if True, also measure traced memory and resource usage; if
+            tracemalloc is already tracing (for example, in an enclosing `measure`),
+            only resource usage is measured, so as not to disturb the outer trace
+        profile (Path | None): if not None, profile the call and write the profile
+            to this path (unless another profiler is already active)
+        profiler (str): "cprofile" to write .pstats, or "sampling" to write collapsed
+            stacks (see `Sampler`)
+
+    Returns:
+        Measurement: the result of the call and its measurements
+    """
+    counts = progress.snapshot() if progress.ENABLED else None
+
+    if not memory and profile is None:
         t0 = perf_counter()
         res = func(*args, **kwargs)
         t1 = perf_counter()
-        td = t1 - t0
+
+        m = Measurement(func.__name__, res, t1 - t0)
+        if counts is not None:
+            m.counters = progress.since(counts)
+        return m
+
+    trace = memory and not tracemalloc.is_tracing()
+    if trace:
+        tracemalloc.start()
+
+    try:
+        r0 = resource.getrusage(resource.RUSAGE_SELF)
+        active = start_profiler(profiler) if profile is not None else None
+        t0 = perf_counter()
+        try:
+            res = func(*args, **kwargs)
+        finally:
+            t1 = perf_counter()
+            if active is not None:
+                stop_profiler(active)
+        r1 = resource.getrusage(resource.RUSAGE_SELF)
+
+        m = Measurement(func.__name__, res, t1 - t0)
+        if counts is not None:
+            m.counters = progress.since(counts)
+        if memory:
+            m.usage = Usage.between(r0, r1)
+        if trace:
+            m.current, m.peak = tracemalloc.get_traced_memory()
+    finally:
+        if trace:
+            tracemalloc.stop()
+
+    if active is not None:
+        dump_profile(active, profile)
+        m.profile = profile
+
+    return m
+
+
+def summarize_profile(path: Path, top: int = 20) -> str:
+    """Return the top functions by cumulative time (or samples) from a profile."""
+    if Path(path).suffix == PROFILERS["sampling"]:
+        return summarize_collapsed(path, top)
+
+    out = io.StringIO()
+    stats = pstats.Stats(str(path), stream=out)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    return out.getvalue().strip()
+
+
+def mib(size: int | None) -> str:
+    return "" if size is None else f"{size / 2**20:.1f}"
+
+
+def report(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = None
+        if OPTIONS.profile is not None:
+            suffix = PROFILERS[OPTIONS.profiler]
+            profile = OPTIONS.profile / f"{func.__module__}.{func.__qualname__}{suffix}"
+
+        m = measure(
+            func,
+            *args,
+            memory=OPTIONS.memory,
+            profile=profile,
+            profiler=OPTIONS.profiler,
+            **kwargs,
+        )
 
         log = logging.getLogger(__name__)
-        log.info(f"{func.__name__} | {timedelta(seconds=td)} | {res:>20} | ")
+        line = f"{m.name} | {timedelta(seconds=m.seconds)} | {m.result:>20} | "
+        if m.peak is not None:
+            line += f"peak {mib(m.peak)} MiB | current {mib(m.current)} MiB | "
+        if m.usage is not None:
+            u = m.usage
+            line += (
+                f"user {u.utime:.3f}s | sys {u.stime:.3f}s | "
+                f"maxrss {mib(u.maxrss)} MiB | csw {u.nvcsw}/{u.nivcsw} | "
+            )
+        log.info(line)
+        for counter in m.counters:
+            log.info(f"{m.name} | {counter}")
+        if m.profile is not None:
+            log.info(
+                f"{m.name} | {m.profile}\n{summarize_profile(m.profile, profile_top())}"
+            )
 
-        return res
+        return m.result
 
     return wrapper
@@ -0,0 +1,100 @@
+import signal
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+
+class Sampler:
+    """A low-overhead statistical profiler driven by a CPU-time interval timer.
+
+    While active, SIGPROF fires every `interval` seconds of process CPU time and the
+    handler records the current stack of the sampled thread (by default, the thread
+    that started the sampler). Unlike cProfile, nothing runs on each function call,
+    so call-heavy code (such as deep recursion or generator pipelines) isn't
+    distorted. The stacks are written in the "collapsed" format understood by
+    flamegraph.pl, speedscope and similar tools:
+
+        aoc.cli:main;aoc.runner:run_day;aoc.y2023.d16.solution:march 42
+
+    Since signal handlers run on the main thread, the sampler must be started there.
+    """
+
+    def __init__(self, interval: float = 0.001, thread: int | None = None):
+        self.interval = interval
+        self.thread = thread
+        self.stacks: Counter[str] = Counter()
+        self._handler = None
+
+    def __enter__(self) -> "Sampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self.thread is None:
+            self.thread = threading.get_ident()
+
+        self._handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._handler or signal.SIG_DFL)
+        self._handler = None
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        frame = sys._current_frames().get(self.thread)
+
+        # skip this handler's own frame when sampling the main thread
+        if frame is not None and frame.f_code is Sampler._sample.__code__:
+            frame = frame.f_back
+
+        names = []
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "?")
+            names.append(f"{module}:{frame.f_code.co_qualname}")
+            frame = frame.f_back
+
+        if names:
+            self.stacks[";".join(reversed(names))] += 1
+
+    @property
+    def samples(self) -> int:
+        return self.stacks.total()
+
+    def collapsed(self) -> str:
+        """Return the sampled stacks in collapsed format, one stack per line."""
+        return "".join(f"{stack} {n}\n" for stack, n in sorted(self.stacks.items()))
+
+    def write(self, path: Path) -> None:
+        """Write the sampled stacks to `path` in collapsed format."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.collapsed())
+
+
+def summarize_collapsed(path: Path, top: int = 20) -> str:
+    """Return the top functions by inclusive sample count from a collapsed file."""
+    inclusive = Counter()
+    exclusive = Counter()
+    total = 0
+
+    for line in Path(path).read_text().splitlines():
+        stack, _, count = line.rpartition(" ")
+        names = stack.split(";")
+        total += int(count)
+
+        # count each function once per stack, even if it recurses
+        for name in set(names):
+            inclusive[name] += int(count)
+        exclusive[names[-1]] += int(count)
+
+    lines = [f"{total} samples", f"{'total':>8} {'self':>8}  function"]
+    for name, n in inclusive.most_common(top):
+        lines.append(f"{n:>8} {exclusive[name]:>8}  {name}")
+
+    return "\n".join(lines)
@@ -0,0 +1,21 @@
+import os
+from pathlib import Path
+
+# The environment variable naming the directory for local, untracked run state (such
+# as timings, caches and benchmark history). Defaults to `.aoc` in the working dir.
+STATE_DIR_ENV = "AOC_STATE_DIR"
+
+
+def state_path(*parts: str) -> Path:
+    """Return a path within the state directory, creating its parent directories.
+
+    Args:
+        parts (str): the path components relative to the state directory
+
+    Returns:
+        Path: the path
+    """
+    path = Path(os.environ.get(STATE_DIR_ENV, ".aoc"), *parts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    return path
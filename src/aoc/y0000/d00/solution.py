@@ -1,9 +1,7 @@
 import sys
-from datetime import timedelta
-from pathlib import Path
-from time import perf_counter
 
-from tqdm import tqdm
+from aoc.solution import Solution
+from aoc.utils.progress import counted
 
 
 def parse(path):
@@ -11,33 +9,19 @@ def parse(path):
 
 
 def solve_part1(data):
-    for each in tqdm(data):
+    for each in counted(data, "data"):
         pass
     return ...
 
 
 def solve_part2(data):
-    for each in tqdm(data):
+    for each in counted(data, "data"):
         pass
     return ...
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(0, 0, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
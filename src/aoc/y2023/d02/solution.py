@@ -1,10 +1,11 @@
-import logging
 import sys
-from pathlib import Path
 
-import numpy as np
+from aoc.solution import Solution
+from aoc.utils.lazy import lazy_import
 from aoc.utils.reporting import report
 
+np = lazy_import("numpy")
+
 
 def parse(path):
     """Returns the history of games as a 3-D array (game, color, round).
@@ -44,17 +45,8 @@ def solve_part2(cubes):
     return cubes.max(2).prod(1).sum()
 
 
-def main():
-    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    solve_part1(data)
-    solve_part2(data)
-
-    return 0
+SOLUTION = Solution(2023, 2, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
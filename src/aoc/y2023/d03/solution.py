@@ -1,11 +1,10 @@
 import re
 import sys
-from datetime import timedelta
 from functools import partial
 from itertools import groupby
 from math import prod
-from pathlib import Path
-from time import perf_counter
+
+from aoc.solution import Solution
 
 
 def first(value: tuple) -> any:
@@ -80,22 +79,8 @@ def solve_part2(data):
     return totals
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(2023, 3, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,22 +1,28 @@
 import sys
-from datetime import timedelta
 from pathlib import Path
-from time import perf_counter
 
-from tqdm import tqdm
+from aoc.solution import Solution
+from aoc.utils.lazy import lazy_import
+from aoc.utils.parsing import int_table, ints
+
+np = lazy_import("numpy")
 
 
 def parse(path):
-    with open(path) as file:
-        data = []
-        for line in file:
-            elem = line.split()
-            vbar = elem.index("|")
-            card = elem[1].rstrip(":")
-            have = set(elem[2:vbar])
-            want = set(elem[vbar + 1 :])
-            data.append((card, len(have & want)))
-        return data
+    text = Path(path).read_bytes()
+
+    # each row is the card number, the numbers before the "|" and the numbers after
+    table = int_table(text)
+    vbar = len(ints(text[: text.index(b"|")]))
+    have = np.sort(table[:, 1:vbar], axis=1)
+    want = table[:, vbar:]
+    # a number had twice still wins once: only count the first of each in a row
+    first = np.ones(have.shape, dtype=bool)
+    first[:, 1:] = have[:, 1:] != have[:, :-1]
+    matches = (have[:, :, None] == want[:, None, :]).any(axis=2)
+    wins = (matches & first).sum(axis=1)
+
+    return list(zip(table[:, 0].tolist(), wins.tolist()))
 
 
 def solve_part1(data):
@@ -31,22 +37,8 @@ def solve_part2(data):
     return sum(score)
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(2023, 4, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,20 +1,21 @@
 import sys
-from datetime import timedelta
+from bisect import bisect_right
 from itertools import batched
 from pathlib import Path
-from time import perf_counter
+
+from aoc.solution import Solution
+from aoc.utils.intervals import Interval, IntervalSet
+from aoc.utils.parsing import ints
 
 
 def parse(path):
-    data = path.read_text()
-    head, *body = data.split("\n\n")
-    seeds = list(map(int, head.split()[1:]))
+    data = Path(path).read_bytes()
+    head, *body = data.split(b"\n\n")
+    seeds = ints(head, array=False)
     parts = []
     for sect in body:
-        part = []
-        for line in sect.splitlines()[1:]:
-            dst, src, len = map(int, line.split())
-            part.append((src, src + len, dst - src))
+        dst, src, len = ints(sect).reshape(-1, 3).T
+        part = list(zip(src.tolist(), (src + len).tolist(), (dst - src).tolist()))
         part.sort()
         parts.append(part)
 
@@ -22,52 +23,45 @@ def parse(path):
 
 
 def transform(part, packs):
-    for x, y in packs:
-        for a, b, s in part:
-            yield (x, min(y, a))
-            yield (max(x, a) + s, min(y, b) + s)
-            x = max(x, min(y, b))
-        yield (x, y)
+    # split the packs at every range boundary, so each piece is either within one
+    # range or outside them all, then shift the pieces within a range
+    starts = [a for a, _, _ in part]
+    breaks = sorted({v for a, b, _ in part for v in (a, b)})
+
+    out = []
+    for piece in packs.split(breaks):
+        i = bisect_right(starts, piece.lo) - 1
+        if i >= 0 and piece.lo < part[i][1]:
+            piece = piece.shift(part[i][2])
+        out.append(piece)
+
+    return IntervalSet(out)
 
 
 def calculate(parts, packs):
-    packs = list(packs)
+    packs = IntervalSet(packs)
     for part in parts:
-        packs = [(x, y) for x, y in transform(part, packs) if x < y]
+        packs = transform(part, packs)
 
-    return min(x for x, _ in packs)
+    return packs.lo
 
 
 def solve_part1(data):
     seeds, parts = data
-    packs = ((x, x + 1) for x in seeds)
+    packs = (Interval(x, x + 1) for x in seeds)
 
     return calculate(parts, packs)
 
 
 def solve_part2(data):
     seeds, parts = data
-    packs = ((x, x + y) for x, y in batched(seeds, 2))
+    packs = (Interval(x, x + y) for x, y in batched(seeds, 2))
 
     return calculate(parts, packs)
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(2023, 5, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
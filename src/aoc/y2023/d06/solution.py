@@ -1,18 +1,16 @@
 import operator
 import sys
-from datetime import timedelta
 from functools import reduce
 from math import ceil, floor, prod
 from pathlib import Path
-from time import perf_counter
+
+from aoc.solution import Solution
+from aoc.utils.parsing import ints_by_line
 
 
 def parse(path):
-    with open(path) as file:
-        time, dist = file.readlines()
-        times = map(int, time.split()[1:])
-        dists = map(int, dist.split()[1:])
-        return tuple(zip(times, dists))
+    times, dists = ints_by_line(Path(path).read_bytes())
+    return tuple(zip(times.tolist(), dists.tolist()))
 
 
 def wins_slow(data):
@@ -38,37 +36,25 @@ def wins_fast(data):
         yield quad(time, best)
 
 
-def wins(data):
-    return wins_fast(data)
-
-
-def solve_part1(data):
+def solve_part1(data, wins=wins_fast):
     return prod(wins(data))
 
 
-def solve_part2(data):
+def solve_part2(data, wins=wins_fast):
     time = int(reduce(operator.concat, (str(time) for time, _ in data)))
     best = int(reduce(operator.concat, (str(best) for _, best in data)))
 
     return prod(wins([(time, best)]))
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(
+    2023,
+    6,
+    parse,
+    {1: solve_part1, 2: solve_part2},
+    variants={"fast": {"wins": wins_fast}, "slow": {"wins": wins_slow}},
+)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,10 +1,10 @@
-from math import ceil
 import sys
-from datetime import timedelta
-from pathlib import Path
-from time import perf_counter
+from math import ceil
 
-import numpy as np
+from aoc.solution import Solution
+from aoc.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 TR = str.maketrans("SF-7|JL.", "⍟┏━┓┃┛┗·")
 
@@ -93,22 +93,8 @@ def solve_part2(data):
     return count
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(2023, 10, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,37 +1,33 @@
 import sys
-from datetime import timedelta
-from pathlib import Path
-from time import perf_counter
 
-import numpy as np
+from aoc.solution import Solution
+from aoc.utils.grid import Grid
+from aoc.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 TR = str.maketrans(".#", "·⍟")
 
 
 def print_image(data):
-    for line in data:
-        disp = "".join(line).translate(TR)
-        print(disp)
+    print(str(data).translate(TR))
 
 
 def parse(path):
-    with open(path) as file:
-        data = np.array([list(line.strip()) for line in file])
-
-    return data
+    return Grid.read(path)
 
 
 def solve(data, mult=1):
     mult = max(1, mult - 1)
 
-    dots = data == "."
+    dots = data.mask(".")
     rows = np.cumsum(np.all(dots, axis=1).astype(np.int64) * mult)
     cols = np.cumsum(np.all(dots, axis=0).astype(np.int64) * mult)
 
     rowd = np.arange(len(rows)) + rows
     cold = np.arange(len(cols)) + cols
 
-    bity, bitx = np.where(data == "#")
+    bity, bitx = np.where(data.mask("#"))
     outy = np.abs(rowd[bity] - rowd[bity][:, np.newaxis])
     outx = np.abs(cold[bitx] - cold[bitx][:, np.newaxis])
 
@@ -42,26 +38,14 @@ def solve_part1(data):
     return solve(data)
 
 
-def solve_part2(data, mult=1000000):
+def solve_part2(data, mult):
     return solve(data, mult)
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(
+    2023, 11, parse, {1: solve_part1, 2: solve_part2}, defaults={2: {"mult": 1000000}}
+)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,23 +1,15 @@
 import sys
-from datetime import timedelta
 from pathlib import Path
-from time import perf_counter
 
-import numpy as np
+from aoc.solution import Solution
+from aoc.utils.grid import Grid
+from aoc.utils.lazy import lazy_import
 
-TR = str.maketrans(".#", "01")
+np = lazy_import("numpy")
 
 
 def parse(path):
-    def parse_rec(rec):
-        return np.array([tuple(map(int, tuple(row))) for row in rec.split()])
-
-    with open(path) as file:
-        text = file.read()
-        recs = str.translate(text, TR).split("\n\n")
-        pats = [parse_rec(rec) for rec in recs]
-
-    return pats
+    return Grid.parse_many(Path(path).read_bytes())
 
 
 def find_reflection_h(pattern, goal, exclude=0):
@@ -33,11 +25,11 @@ def find_reflection_h(pattern, goal, exclude=0):
 
 
 def find_reflection(pattern, goal, exclude=0):
-    r = find_reflection_h(pattern, goal, exclude)
+    r = find_reflection_h(pattern.cells, goal, exclude)
     if r:
         return r
 
-    r = find_reflection_h(np.rot90(pattern), goal, exclude / 100)
+    r = find_reflection_h(pattern.rot90().cells, goal, exclude / 100)
     if r:
         return r * 100
 
@@ -52,22 +44,8 @@ def solve_part2(data):
     return sum([find_reflection(pattern, 1) for pattern in data])
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(2023, 13, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,24 +1,30 @@
 import sys
-from datetime import timedelta
 from itertools import count
-from pathlib import Path
-from time import perf_counter
 
-import numpy as np
+from aoc.solution import Solution
+from aoc.utils.grid import Grid, code
+from aoc.utils.lazy import lazy_import
 
+np = lazy_import("numpy")
 
-def parse(path):
-    TR = {"O": -1, ".": 0, "#": 1}
 
-    with open(path) as file:
-        return np.array([[TR[cell] for cell in line.strip()] for line in file])
+ROUND = code("O")
+CUBE = code("#")
+
+
+def parse(path):
+    return Grid.read(path)
 
 
 def tilt(data):
+    # Sorting a segment that ends at a cube in descending order ("O" > "." > "#") rolls
+    # its round rocks to the start, and leaves the cube at the end.
     data = np.rot90(data)
     data = np.row_stack(
         [
-            np.concatenate([np.sort(s) for s in np.hsplit(r, np.where(r == 1)[0] + 1)])
+            np.concatenate(
+                [np.sort(s)[::-1] for s in np.hsplit(r, np.where(r == CUBE)[0] + 1)]
+            )
             for r in data
         ]
     )
@@ -40,7 +46,7 @@ def loop(data):
 
     for i in count(1):
         data = spin(data)
-        key = hash(tuple(data.flat))
+        key = data.tobytes()
         if key in hist:
             return (hist[key], i, recs)
         else:
@@ -49,40 +55,32 @@ def loop(data):
 
 
 def load(data):
-    rocks = np.count_nonzero(data == -1, 1)
+    rocks = np.count_nonzero(data == ROUND, 1)
     score = np.arange(rocks.shape[0], 0, -1)
 
     return np.sum(rocks * score)
 
 
 def solve_part1(data):
-    return load(tilt(data))
+    return load(tilt(data.cells))
 
 
-def solve_part2(data, times=1000000000):
-    beg, end, recs = loop(data)
+def solve_part2(data, times):
+    beg, end, recs = loop(data.cells)
     stop = beg + (times - beg) % (end - beg)
     stop = min(times, stop) - 1
 
     return recs[stop]
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    time0 = perf_counter()
-    part1 = solve_part1(data)
-    time1 = perf_counter()
-    part2 = solve_part2(data)
-    time2 = perf_counter()
-
-    print()
-    print(f"part1 | {timedelta(seconds=time1 - time0)} | {part1:>20} |")
-    print(f"part2 | {timedelta(seconds=time2 - time1)} | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(
+    2023,
+    14,
+    parse,
+    {1: solve_part1, 2: solve_part2},
+    defaults={2: {"times": 1000000000}},
+)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
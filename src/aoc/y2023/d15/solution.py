@@ -2,18 +2,41 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
+from aoc.solution import Solution
 from aoc.utils.reporting import report
 
 
+class Steps:
+    """The comma-separated steps of the initialization sequence.
+
+    Rather than a list of a string per step, this keeps the input as one bytes object
+    and splits it into a bytes object per step as it's iterated, which is much faster
+    to hash than a str (or a memoryview) per step.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data.rstrip(b"\r\n")
+
+    def __len__(self) -> int:
+        return self.data.count(b",") + 1 if self.data else 0
+
+    def __iter__(self):
+        return iter(self.data.split(b",") if self.data else ())
+
+
 def parse(path):
-    with open(path) as file:
-        return [item for line in file for item in line.strip().split(",")]
+    return Steps(Path(path).read_bytes())
 
 
 def hash_item(item):
+    if isinstance(item, str):
+        item = item.encode()
+
     res = 0
     for c in item:
-        res += ord(c)
+        res += c
         res *= 17
         res %= 256
 
@@ -30,7 +53,7 @@ def solve_part2(data):
     boxes = defaultdict(dict)
 
     for item in data:
-        oper = item.rstrip("-").split("=")
+        oper = item.rstrip(b"-").split(b"=")
         match oper:
             case [lens]:
                 boxes[hash_item(lens)].pop(lens, None)
@@ -45,18 +68,8 @@ def solve_part2(data):
     return res
 
 
-def main():
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    part1 = solve_part1(data)
-    print(f"> solve_part1 | {part1:>20} |")
-
-    part2 = solve_part2(data)
-    print(f"> solve_part2 | {part2:>20} |")
-
-    return 0
+SOLUTION = Solution(2023, 15, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,14 +1,26 @@
-import logging
 import sys
-from collections import deque
 from pathlib import Path
 
+from aoc.solution import Solution
+from aoc.utils.graph import bfs
+from aoc.utils.lazy import lazy_import
 from aoc.utils.reporting import report
 
-N = (-1, 0)  # North
-E = (0, 1)  # East
-W = (0, -1)  # West
-S = (1, 0)  # South
+np = lazy_import("numpy")
+
+N, E, S, W = range(4)  # the headings North, East, South and West
+
+DY = (-1, 0, 1, 0)  # the change in y of a step in each heading
+DX = (0, 1, 0, -1)  # the change in x of a step in each heading
+
+# The headings in which a beam leaves each tile, by the heading in which it entered.
+TURNS = {
+    ".": ((N,), (E,), (S,), (W,)),
+    "-": ((E, W), (E,), (E, W), (W,)),
+    "|": ((N,), (N, S), (S,), (N, S)),
+    "/": ((E,), (N,), (W,), (S,)),
+    "\\": ((W,), (S,), (E,), (N,)),
+}
 
 
 def parse(path: Path) -> tuple[str, ...]:
@@ -25,123 +37,97 @@ def parse(path: Path) -> tuple[str, ...]:
         return tuple(line.strip() for line in file)
 
 
-def tile(board: tuple[str, ...], coord: tuple[int, int]) -> str | None:
-    """Returns the tile (a single character) from the board located at coord.
+def state(board: tuple[str, ...], coord: tuple[int, int], news: int) -> int:
+    """Returns the beam state of entering the tile at coord in the direction of news.
+
+    A beam state packs a tile and a heading into a single int, `4 * (y * X + x) + news`.
 
     Args:
         board (tuple[str, ...]): a board
         coord (tuple[int, int]): a coordinate in (y, x) format
+        news (int): the heading of the beam
 
     Returns:
-        str | None: the tile if within bounds of the board, otherwise, None.
+        int: the beam state
     """
 
-    # If the coordinate is within the bounds of the board...
-    if 0 <= coord[0] < len(board) and 0 <= coord[1] < len(board[0]):
-        return board[coord[0]][coord[1]]
-    else:
-        return None
+    return 4 * (coord[0] * len(board[0]) + coord[1]) + news
 
 
-def next(lhs: tuple[int, int], rhs: tuple[int, int]) -> tuple[int, int]:
-    """Adds the rhs coordinate to the lhs coordinate.
+def moves(board: tuple[str, ...]) -> list[tuple[int, ...]]:
+    """Returns the beam states that follow each beam state on the board.
 
     Args:
-        lhs (tuple[int, int]): a coordinate in (y, x) format
-        rhs (tuple[int, int]): a coordinate in (y, x) format
+        board (tuple[str, ...]): a board
 
     Returns:
-        tuple[int, int]: the element-wise sum of lhs + rhs
+        list[tuple[int, ...]]: the beam states that follow, indexed by beam state
     """
 
-    return (lhs[0] + rhs[0], lhs[1] + rhs[1])
+    Y = len(board)
+    X = len(board[0])
+
+    table = []
+    for y, row in enumerate(board):
+        for x, t in enumerate(row):
+            for turns in TURNS[t]:
+                # Keep only the beams that stay within the bounds of the board.
+                table.append(
+                    tuple(
+                        state(board, (y + DY[news], x + DX[news]), news)
+                        for news in turns
+                        if 0 <= y + DY[news] < Y and 0 <= x + DX[news] < X
+                    )
+                )
+
+    return table
 
 
-def march(board: tuple[str, ...], curr: tuple[int, int], news: tuple[int, int]) -> int:
-    """Returns the count of tiles energized by marching from curr in the direction of news.
+def march(table: list[tuple[int, ...]], start: int) -> int:
+    """Returns the count of tiles energized by a beam starting from the start state.
 
     Args:
-        board (tuple[str, ...]): a board
-        curr (tuple[int, int]): a coordinate in (y, x) format from which to start the march
-        news (tuple[int, int]): a coordinate in (y, x) format representing the march direction
+        table (list[tuple[int, ...]]): the beam states that follow each beam state
+        start (int): the beam state that enters the board
 
     Returns:
         int: the count of tiles.
     """
 
-    TURNS = {
-        "-": {N: [E, W], S: [E, W]},
-        "|": {E: [N, S], W: [N, S]},
-        "/": {N: [E], E: [N], W: [S], S: [W]},
-        "\\": {N: [W], E: [S], W: [N], S: [E]},
-    }
-
-    tiles = set()  # a set of energized tiles
-    moves = set()  # a set of moves (curr, news) already marched
-    stack = deque([(curr, news)])  # a stack of moves to march
-
-    while len(stack) > 0:
-        curr, news = stack.pop()
-        curr = next(curr, news)
-
-        # To reduce runtime and prevent loops, skip this move if we've already marched it.
-        if (curr, news) in moves:
-            continue
-
-        match t := tile(board, curr):
-            case None:
-                # curr isn't within bounds of the board, so stop marching in this direction.
-                continue
-            case ".":
-                # We found a ".", so keep marching in this direction.
-                stack += [(curr, news)]
-            case _:
-                # Look up the list of next moves to march from TURNS.
-                stack += [(curr, d) for d in TURNS[t].get(news, [news])]
+    # Every beam state reachable from start is marched, whatever its distance.
+    dist = bfs((start,), table.__getitem__, len(table))
 
-        tiles |= {curr}
-        moves |= {(curr, news)}
-
-    return len(tiles)
+    return int(np.count_nonzero((dist.reshape(-1, 4) >= 0).any(axis=1)))
 
 
 @report
 def solve_part1(board: tuple[str, ...]) -> int:
-    return march(board, (0, -1), E)
+    return march(moves(board), state(board, (0, 0), E))
 
 
 @report
 def solve_part2(board: tuple[str, ...]) -> int:
     res = []
 
-    I = -1  # noqa: E741
+    table = moves(board)
     Y = len(board)
     X = len(board[0])
 
-    # Generate a list of marches starting off the board on the east and west sides.
+    # Generate a list of marches entering the board on the west and east sides.
     for y in range(Y):
-        res.append(march(board, (y, I), E))
-        res.append(march(board, (y, X), W))
+        res.append(march(table, state(board, (y, 0), E)))
+        res.append(march(table, state(board, (y, X - 1), W)))
 
-    # Generate a list of marches starting off the board on the south and north sides.
+    # Generate a list of marches entering the board on the north and south sides.
     for x in range(X):
-        res.append(march(board, (I, x), S))
-        res.append(march(board, (Y, x), N))
+        res.append(march(table, state(board, (0, x), S)))
+        res.append(march(table, state(board, (Y - 1, x), N)))
 
     return max(res)
 
 
-def main():
-    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    solve_part1(data)
-    solve_part2(data)
-
-    return 0
+SOLUTION = Solution(2023, 16, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,133 +1,99 @@
-import logging
-import operator
 import sys
-from collections import defaultdict, namedtuple
-from heapq import heappop, heappush
 from pathlib import Path
+from typing import Iterator
 
+from aoc.solution import Solution
+from aoc.utils.graph import dial, dijkstra
+from aoc.utils.grid import Grid
 from aoc.utils.reporting import report
 
 
-def parse(path: Path) -> dict[tuple[int, int], int]:
-    """Parse the input from path into a dictionary of vertices to weights.
+def parse(path: Path) -> Grid:
+    """Parse the input from path into a grid of heat losses.
 
     Args:
         path (Path): the path to the input
 
     Returns:
-        dict[tuple[int, int], int]: a dictionary of grid coordinates to weights
+        Grid: a grid of digits, one per block
     """
-    with open(path) as file:
-        return {
-            (y, x): int(cost)
-            for y, line in enumerate(file)
-            for x, cost in enumerate(line.strip())
-        }
+    return Grid.read(path)
 
 
-def dijkstra(states, source, target, minrun, maxrun):
-    """Find the shortest path from a source vertex to a destination vertex in a graph.
+def crucible(grid: Grid, minrun: int, maxrun: int, queue: str = "bucket") -> int | None:
+    """Find the least heat loss from the top-left block to the bottom-right block.
+
+    A state packs a block and the axis the crucible last moved along into one int,
+    `2 * (y * width + x) + axis`, where axis 0 is vertical and 1 is horizontal. Each
+    move turns onto the other axis and goes straight for `minrun` to `maxrun` blocks,
+    so the run length never needs to be part of the state.
 
     Args:
-        states: a dictionary of vertices to edges
-        source: the source vertex
-        target: the destination vertex
-        minrun: the minimum steps in the same direction required
-        maxrun: the maximum steps in the same direction allowed
+        grid (Grid): the heat loss of each block
+        minrun (int): the minimum steps in the same direction required
+        maxrun (int): the maximum steps in the same direction allowed
+        queue (str): "bucket" to search with a bucket queue (`dial`), or "heap" to
+            search with a binary heap (`dijkstra`)
 
     Returns:
-        The  shortest path from the source vertex to the destination vertex.
+        int | None: the least heat loss, or None if the target is unreachable
     """
-
-    State = namedtuple("State", ["pos", "dir"])
-    Entry = namedtuple("Entry", ["dst", "state"])
-
-    # Initialize a priority queue with the source vertex at zero cost.
-    # heap = [(0, State(source, (0, 0)))]
-    heap = [Entry(0, State(source, (0, 0)))]
-
-    # Initialize a dictionary of vertices to shortest paths found so far. If no path
-    # has yet been found, return an "arbritrarily large number" (such as 1e9).
-    best = defaultdict(lambda: int(1e9))
-    best[heap[0].state] = heap[0].dst
-
-    while heap:
-        # Dequeue the vertex with the lowest distance.
-        dst, curr = heappop(heap)
-
-        # If the target vertex has been reached, return the cost of the shortest path.
-        if curr.pos == target:
-            return dst
-
-        # For each neighbor of the current vertex...
-        for next_dir in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
-            # ...without continuing in the same direction or doubling back in the
-            # direction we came from...
-            if next_dir in (curr.dir, tuple(map(operator.neg, curr.dir))):
-                # NOTE: This was the source of considerable frustration and debugging
-                # for me, especially once I rewired for Part 2. It was obvious that I
-                # had to prevent going backwards, but I misssed having to prevent going
-                # forwards. Since we greedily go forwards below up to maxrun, going any
-                # further would violate maxrun.
-                continue
-
-            next_dst = dst
-            next_pos = curr.pos
-
-            # Go as far as we can in the current direction before changing direction...
+    height, width = grid.shape
+    # plain ints are much faster than numpy scalars to add one at a time
+    losses = (grid.cells - ord("0")).ravel().tolist()
+    target = height * width - 1
+
+    def edges(state: int) -> Iterator[tuple[int, int]]:
+        pos, axis = divmod(state, 2)
+        y, x = divmod(pos, width)
+
+        # turn onto the other axis, in either direction
+        if axis == 1:
+            moves = ((1, y, height, width), (-1, y, height, width))
+            axis = 0
+        else:
+            moves = ((1, x, width, 1), (-1, x, width, 1))
+            axis = 1
+
+        for sign, start, limit, stride in moves:
+            loss = 0
+            next_pos = pos
             for i in range(1, maxrun + 1):
-                next_pos = (
-                    curr.pos[0] + i * next_dir[0],
-                    curr.pos[1] + i * next_dir[1],
-                )
-
-                # Break if next_pos is not within the bounds of the grid...
-                if next_pos not in states:
+                if not 0 <= start + sign * i < limit:
                     break
+                next_pos += sign * stride
+                loss += losses[next_pos]
+                if i >= minrun:
+                    yield 2 * next_pos + axis, loss
 
-                next_dst += states[next_pos]
-                next = State(next_pos, next_dir)
+    def is_target(state: int) -> bool:
+        return state // 2 == target
 
-                # If we can reach this neighbor via a shorter path that has at least as
-                # many steps in the current direction as required by minrun, update our
-                # vertex leaderboard (best) and add it to the heap to explore further.
-                if next_dst < best[next] and i >= minrun:
-                    best[next] = next_dst
-                    heappush(heap, Entry(next_dst, next))
-
-    # If the target was not reachable, return None.
-    return None
+    # start facing along either axis, so that the first move can go either way
+    if queue == "heap":
+        return dijkstra((0, 1), edges, is_target)
+    # a move loses at most 9 per block
+    return dial((0, 1), edges, is_target, 9 * maxrun)
 
 
 @report
-def solve_part1(data) -> int:
-    states = data
-    source = min(states)
-    target = max(states)
-
-    return dijkstra(states, source, target, 1, 3)
+def solve_part1(data, queue: str = "bucket") -> int:
+    return crucible(data, 1, 3, queue)
 
 
 @report
-def solve_part2(data) -> int:
-    states = data
-    source = min(states)
-    target = max(states)
-
-    return dijkstra(states, source, target, 4, 10)
-
-
-def main():
-    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-    path = Path(sys.argv[1])
-    data = parse(path)
+def solve_part2(data, queue: str = "bucket") -> int:
+    return crucible(data, 4, 10, queue)
 
-    solve_part1(data)
-    solve_part2(data)
 
-    return 0
+SOLUTION = Solution(
+    2023,
+    17,
+    parse,
+    {1: solve_part1, 2: solve_part2},
+    variants={"bucket": {"queue": "bucket"}, "heap": {"queue": "heap"}},
+)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,10 +1,12 @@
-import logging
 import sys
 from dataclasses import dataclass
 from enum import Enum
 from itertools import chain, islice, pairwise
 from pathlib import Path
 
+from aoc.solution import Solution
+from aoc.utils.geom import Vec2d
+from aoc.utils.parsing import hexes, ints
 from aoc.utils.reporting import report
 
 
@@ -12,61 +14,30 @@ from aoc.utils.reporting import report
 class Operation:
     dir: str
     len: int
-    rgb: str
-
-    def __init__(self, *args):
-        assert len(args) == 3
-        self.dir = args[0]
-        self.len = int(args[1])
-        self.rgb = args[2].strip("(#)")
+    rgb: int
 
     @classmethod
     def from_rgb(cls, oper):
-        oper_len = int(oper.rgb[:5], base=16)
-        oper_dir = None
-        match oper.rgb[-1]:
-            case "0":
-                oper_dir = "R"
-            case "1":
-                oper_dir = "D"
-            case "2":
-                oper_dir = "L"
-            case "3":
-                oper_dir = "U"
-            case _:
-                assert False
-
-        return cls(oper_dir, oper_len, oper.rgb)
-
-
-@dataclass(order=True, frozen=True)
-class Point:
-    y: int = 0
-    x: int = 0
-
-    def __add__(self, rhs):
-        assert isinstance(rhs, Point)
-        return Point(self.y + rhs.y, self.x + rhs.x)
-
-    def __mul__(self, rhs):
-        assert isinstance(rhs, int)
-        return Point(self.y * rhs, self.x * rhs)
-
-    def det(self, rhs):
-        assert isinstance(rhs, Point)
-        return self.x * rhs.y - self.y * rhs.x
-
-
-class Direction(Point, Enum):
+        # the colour's first five hex digits are the length and its last the direction
+        assert oper.rgb & 0xF < 4
+        return cls("RDLU"[oper.rgb & 0xF], oper.rgb >> 4, oper.rgb)
+
+
+class Direction(Vec2d, Enum):
     U = (-1, 0)
     R = (0, 1)
     D = (1, 0)
     L = (0, -1)
 
 
-def parse(path: Path) -> dict[tuple[int, int], int]:
-    with open(path) as file:
-        return [Operation(*line.split()) for line in file]
+def parse(path: Path) -> list[Operation]:
+    text = Path(path).read_bytes()
+    fields = text.split()
+    dirs = [field.decode() for field in fields[0::3]]
+    lens = ints(b" ".join(fields[1::3]), array=False)
+    rgbs = hexes(text, array=False)
+
+    return list(map(Operation, dirs, lens, rgbs))
 
 
 def limit_graph(graph):
@@ -75,8 +46,8 @@ def limit_graph(graph):
     graph_max_y = max(p.y for p in graph)
     graph_max_x = max(p.x for p in graph)
 
-    graph_min = Point(graph_min_y, graph_min_x)
-    graph_max = Point(graph_max_y, graph_max_x)
+    graph_min = Vec2d(graph_min_y, graph_min_x)
+    graph_max = Vec2d(graph_max_y, graph_max_x)
 
     return graph_min, graph_max
 
@@ -89,9 +60,9 @@ def print_graph(graph):
     for y in range(graph_min.y, graph_max.y + 1):
         for x in range(graph_min.x, graph_max.x + 1):
             c = "."
-            p = Point(y, x)
+            p = Vec2d(y, x)
             if p in graph:
-                c = "#" if p != Point(0, 0) else "S"
+                c = "#" if p != Vec2d(0, 0) else "S"
             print(c, end="")
         print()
 
@@ -110,7 +81,7 @@ def graph_area(graph, perim):
 
 
 def solve(data) -> int:
-    start = Point(0, 0)
+    start = Vec2d(0, 0)
     graph = {start: None}
     perim = 0
 
@@ -132,17 +103,8 @@ def solve_part2(data) -> int:
     return solve(map(Operation.from_rgb, data))
 
 
-def main():
-    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    solve_part1(data)
-    solve_part2(data)
-
-    return 0
+SOLUTION = Solution(2023, 18, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
@@ -1,12 +1,11 @@
-import logging
 import re
 import sys
 from dataclasses import dataclass
-from functools import total_ordering
 from math import prod
-from pathlib import Path
 from typing import ClassVar, Iterable
 
+from aoc.solution import Solution
+from aoc.utils.intervals import Interval
 from aoc.utils.reporting import report
 
 
@@ -34,111 +33,16 @@ class Parts(list):
         super().__init__(iterable)
 
 
-@dataclass(frozen=True)
-@total_ordering
-class PartsBlock:
-    # the *inclusive* lower bound of block
-    lower: int = None
-    # the *inclusive* upper bound of block
-    upper: int = None
-
-    def __post_init__(self):
-        if self.lower and self.upper:
-            assert self.lower <= self.upper
-
-        if self.lower is None:
-            assert self.upper is None
-
-    def __eq__(self, other):
-        if not isinstance(other, PartsBlock):
-            raise TypeError
-
-        return self.lower == other.lower and self.upper == other.upper
-
-    def __lt__(self, other):
-        # subset
-        if not isinstance(other, PartsBlock):
-            raise TypeError
-
-        if self.isempty():
-            return True
-
-        return self.lower >= other.lower and self.upper <= other.upper
-
-    def __and__(self, other):
-        # union
-        if not isinstance(other, PartsBlock):
-            raise TypeError
-
-        if self.isempty():
-            return other
-
-        if other.isempty():
-            return self
-
-        if self.isdisjoint(other):
-            return PartsBlock()
-
-        lower = min(self.lower, other.lower)
-        upper = max(self.upper, other.upper)
-
-        return PartsBlock(lower, upper)
-
-    def __or__(self, other):
-        # intersection
-        if not isinstance(other, PartsBlock):
-            raise TypeError
-
-        if self.isempty() or other.isempty():
-            return PartsBlock()
-
-        lower = max(self.lower, other.lower)
-        upper = min(self.upper, other.upper)
-
-        if lower <= upper:
-            return PartsBlock(lower, upper)
-        else:
-            return PartsBlock()
-
-    def __sub__(self, other):
-        # difference
-        if not isinstance(other, PartsBlock):
-            raise TypeError
-
-        if other.isempty():
-            return self
-
-        if self <= other:
-            return PartsBlock()
-
-        if other.lower > self.lower:
-            return PartsBlock(self.lower, other.lower - 1)
-        else:
-            return PartsBlock(other.upper + 1, self.upper)
-
-    def __contains__(self, other):
-        if not isinstance(other, int):
-            raise TypeError
-
-        return self.lower <= other <= self.upper
-
-    def __len__(self):
-        return self.upper + 1 - self.lower
-
-    def isdisjoint(self, other):
-        return (self | other).isempty()
-
-    def isempty(self):
-        return self.lower is None and self.upper is None
-
-
 @dataclass
 class Condition:
     RE: ClassVar[re.Pattern] = re.compile(r"(?P<key>[xmas])(?P<cmp>[<>])(?P<val>\d+)")
-    BLOCK: ClassVar[PartsBlock] = PartsBlock(1, sys.maxsize)
+    BLOCK: ClassVar[Interval] = Interval.closed(1, sys.maxsize)
 
     key: str = None
-    block: PartsBlock = BLOCK
+    # the ratings that pass the condition...
+    block: Interval = BLOCK
+    # ...and the ratings that fail it
+    rest: Interval = Interval(0, 0)
 
     @classmethod
     def parse(cls, input: str):
@@ -147,29 +51,31 @@ class Condition:
 
         m = re.fullmatch(Condition.RE, input)
         key = m.group("key")
+        val = int(m.group("val"))
         match m.group("cmp"):
             case "<":
-                block = PartsBlock(Condition.BLOCK.lower, int(m.group("val")) - 1)
+                block = Interval(Condition.BLOCK.lo, val)
+                rest = Interval(val, Condition.BLOCK.hi)
             case ">":
-                block = PartsBlock(int(m.group("val")) + 1, Condition.BLOCK.upper)
+                block = Interval(val + 1, Condition.BLOCK.hi)
+                rest = Interval(Condition.BLOCK.lo, val + 1)
             case _:
                 assert False
 
-        return cls(key, block)
+        return cls(key, block, rest)
 
     def check(self, part: Part):
         return self.key is None or part[self.key] in self.block
 
-    def combo(self, blocks: PartsBlock):
+    def combo(self, blocks: dict[str, Interval]):
         if self.key is None:
             return None
         else:
-            lhs = self.block
             rhs = blocks[self.key]
 
             return (
-                {self.key: rhs | lhs},
-                {self.key: rhs - lhs},
+                {self.key: rhs & self.block},
+                {self.key: rhs & self.rest},
             )
 
 
@@ -191,12 +97,12 @@ class Rule:
     def check(self, part: Part):
         return self.action if self.condition.check(part) else None
 
-    def combo(self, blocks: PartsBlock):
+    def combo(self, blocks: dict[str, Interval]):
         match self.condition.combo(blocks):
             case lhs, rhs:
                 return self.action, blocks | lhs, blocks | rhs
             case _:
-                return self.action, blocks, PartsBlock()
+                return self.action, blocks, None
 
 
 @dataclass
@@ -221,12 +127,14 @@ class Workflow:
 
         assert False
 
-    def combo(self, blocks: PartsBlock):
+    def combo(self, blocks: dict[str, Interval]):
         result = []
 
         for rule in self.rules:
             key, lhs, blocks = rule.combo(blocks)
             result.append((key, lhs))
+            if blocks is None:
+                break
 
         return result
 
@@ -256,7 +164,7 @@ class System:
                     stack.append(self.workflows[key])
 
     def combo(self, key: str):
-        blocks = dict({c: PartsBlock(1, 4000) for c in "xmas"})
+        blocks = dict({c: Interval.closed(1, 4000) for c in "xmas"})
         result = 0
 
         stack = []
@@ -271,6 +179,10 @@ class System:
                 # for visualization at https://sankeymatic.com/build/
                 # print(f"{action} [{combos}] {key}")
 
+                # no part can follow a rule whose ratings are empty
+                if combos == 0:
+                    continue
+
                 match key:
                     case "A":
                         result += combos
@@ -303,17 +215,8 @@ def solve_part2(data) -> int:
     return system.combo("in")
 
 
-def main():
-    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    solve_part1(data)
-    solve_part2(data)
-
-    return 0
+SOLUTION = Solution(2023, 19, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
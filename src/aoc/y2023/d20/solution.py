@@ -1,4 +1,3 @@
-import logging
 import sys
 from abc import ABC
 from collections import Counter, defaultdict, deque
@@ -18,6 +17,7 @@ from typing import (
     override,
 )
 
+from aoc.solution import Solution
 from aoc.utils.reporting import report
 
 
@@ -311,17 +311,8 @@ def solve_part2(data: Tuple[ModulesDict, SourcesDict]) -> int:
     return system.reach(sources["zr"])
 
 
-def main():
-    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    solve_part1(data)
-    solve_part2(data)
-
-    return 0
+SOLUTION = Solution(2023, 20, parse, {1: solve_part1, 2: solve_part2})
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
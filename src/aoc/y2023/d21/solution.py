@@ -1,4 +1,3 @@
-import logging
 import sys
 from dataclasses import dataclass
 from enum import Enum
@@ -6,30 +5,14 @@ from pathlib import Path
 from pprint import pprint
 from typing import Iterable, Optional, override
 
-import numpy as np
+from aoc.solution import Solution
+from aoc.utils import geom
+from aoc.utils.geom import Vec2d
+from aoc.utils.lazy import lazy_import
+from aoc.utils.progress import counted
 from aoc.utils.reporting import report
-from numpy.polynomial import polynomial as npp
-from tqdm import trange
 
-
-@dataclass(frozen=True, order=True)
-class Vec2d:
-    """Represents a 2D vector (or coordinate) in row-major (y, x) format."""
-
-    y: int = 0
-    x: int = 0
-
-    def __add__(self, other: "Vec2d") -> "Vec2d":
-        return Vec2d(self.y + other.y, self.x + other.x)
-
-    def __mod__(self, other: "Vec2d") -> "Vec2d":
-        return Vec2d(self.y % other.y, self.x % other.x)
-
-    def __mul__(self, scalar: int) -> "Vec2d":
-        return Vec2d(self.y * scalar, self.x * scalar)
-
-    def __neg__(self) -> "Vec2d":
-        return Vec2d(-self.y, -self.x)
+np = lazy_import("numpy")
 
 
 class Heading(Vec2d, Enum):
@@ -80,6 +63,12 @@ class Garden(dict[Vec2d, str]):
         """The size of the garden."""
         self.size = max(self.keys()) + Vec2d(1, 1)
 
+        """The mask of all plots in the garden, for stepping many tiles at once."""
+        self.plots = np.zeros(self.size, dtype=bool)
+        self.plots[
+            tuple(geom.as_array(k for k in self if k not in self.rocks).T)
+        ] = True
+
     @override
     def __contains__(self, __key: object) -> bool:
         if not isinstance(__key, Vec2d):
@@ -110,9 +99,21 @@ class Garden(dict[Vec2d, str]):
     def neighbors(self, tile: Vec2d):
         return (tile + h for h in Heading if self.is_plot(tile + h))
 
+    def next_tiles(self, tiles):
+        """Return the distinct plots one step from any of tiles, an (N, 2) array."""
+        nexts = geom.neighbours(tiles)
+
+        if self.infinite:
+            wrapped = geom.wrap(nexts, self.size)
+        else:
+            nexts = nexts[np.all((nexts >= 0) & (nexts < self.size), axis=1)]
+            wrapped = nexts
+
+        return geom.unique(nexts[self.plots[wrapped[:, 0], wrapped[:, 1]]])
+
     def next_step(self, step: GardenStep) -> GardenStep:
         next = GardenStep(step.step + 1)
-        next.update([n for p in step for n in self.neighbors(p)])
+        next.update(geom.as_vecs(self.next_tiles(geom.as_array(step))))
         return next
 
 
@@ -126,18 +127,19 @@ def parse(path: Path):
 
 
 @report
-def solve_part1(garden, steps: int = 64) -> int:
-    step = GardenStep()
-    step.add(garden.start)
+def solve_part1(garden, steps: int) -> int:
+    # Step all of the reachable tiles at once as an array, rather than as a set of
+    # vectors that would allocate an object per tile per step.
+    tiles = geom.as_array([garden.start])
 
-    for i in trange(steps):
-        step = garden.next_step(step)
+    for i in counted(range(steps), "steps"):
+        tiles = garden.next_tiles(tiles)
 
-    return len(step)
+    return len(tiles)
 
 
 @report
-def solve_part2(garden, steps: int = 26501365) -> int:
+def solve_part2(garden, steps: int) -> int:
     # My approach for Part 2 differs from Part 1 in two notable ways:
     #   1. we treat the garden as toroidal ("infinite")
     #   2. we numerically extrapolate the plots at step n rather than simulate it
@@ -196,21 +198,20 @@ def solve_part2(garden, steps: int = 26501365) -> int:
     def scale_mod(x: int) -> int:
         return (x - garden.size.x // 2) % garden.size.x
 
-    step = GardenStep()
-    step.add(garden.start)
+    tiles = geom.as_array([garden.start])
 
     garden.infinite = True
     samples = {}
 
-    for i in trange(steps + 1):
+    for i in counted(range(steps + 1), "steps"):
         if scale_mod(i) == 0:
-            samples[i] = len(step)
+            samples[i] = len(tiles)
 
             # stop after taking three samples, which is all we need for fitting
             if len(samples) == 3:
                 break
 
-        step = garden.next_step(step)
+        tiles = garden.next_tiles(tiles)
 
     pprint(f"SAMPLES: {samples.items()}")
 
@@ -218,23 +219,21 @@ def solve_part2(garden, steps: int = 26501365) -> int:
     x = np.arange(y.size)
     n = scale_div(steps)
 
-    c = npp.polyfit(x, y, 2)
-    r = npp.polyval(n, c)
+    c = np.polynomial.polynomial.polyfit(x, y, 2)
+    r = np.polynomial.polynomial.polyval(n, c)
 
     return round(r)
 
 
-def main():
-    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-    path = Path(sys.argv[1])
-    data = parse(path)
-
-    solve_part1(data)
-    solve_part2(data)
-
-    return 0
+SOLUTION = Solution(
+    2023,
+    21,
+    parse,
+    {1: solve_part1, 2: solve_part2},
+    defaults={1: {"steps": 64}, 2: {"steps": 26501365}},
+    mutates=True,
+)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(SOLUTION.main())
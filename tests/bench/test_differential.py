@@ -0,0 +1,50 @@
+from dataclasses import replace
+
+import pytest
+from aoc.bench.differential import PAIRS, check, compare, ddmin, shrink
+from aoc.runner import Day, discover
+
+
+def wins_off(data):
+    # wrong for every race longer than 50ms
+    for time, best in data:
+        yield time if time > 50 else sum(h * (time - h) > best for h in range(time))
+
+
+@pytest.fixture
+def off(monkeypatch):
+    module = Day(2023, 6).load()
+    monkeypatch.setattr(module, "wins_off", wins_off, raising=False)
+    return replace(PAIRS[0], candidate="wins_off")
+
+
+@pytest.mark.parametrize("pair", PAIRS, ids=str)
+def test_pairs_agree(pair):
+    assert pair.day in discover()
+    assert check(pair, trials=20) is None
+
+
+def test_ddmin():
+    # fails whenever both 3 and 7 are present
+    pieces = ddmin(list(range(10)), lambda p: 3 in p and 7 in p)
+    assert pieces == [3, 7]
+
+    assert ddmin([1], lambda p: True) == [1]
+
+
+def test_compare_parse_error():
+    reference, candidate = compare(PAIRS[0], "not an input\n")
+    assert reference == candidate
+    assert reference[0] == "error"
+
+
+def test_check_mismatch(off):
+    mismatch = check(off, trials=20)
+    assert mismatch is not None
+
+    # a single race, which is long enough to go wrong
+    (time, dist), *rest = off.split(mismatch.shrunk)
+    assert not rest and int(time) > 50
+    assert mismatch.outcomes[0] != mismatch.outcomes[1]
+    assert mismatch.shrunk == shrink(off, mismatch.text)
+    assert "MISMATCH" in str(mismatch)
@@ -0,0 +1,79 @@
+import random
+from math import lcm
+
+import pytest
+from aoc.bench.generators import GENERATORS, generate, reflections, skyline, write
+from aoc.runner import Day, discover
+
+STEPS = {"U": (-1, 0), "R": (0, 1), "D": (1, 0), "L": (0, -1)}
+
+
+def test_every_day_has_a_generator():
+    assert set(discover([2023])) <= set(GENERATORS)
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS), ids=str)
+def test_generate_solves(day, tmp_path, capsys):
+    solution = day.solution()
+    path = write(day, tmp_path / "input.txt", scale=1, seed=1)
+
+    for part in solution.parts:
+        assert solution.solve(part, solution.parse(path)) is not None
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS), ids=str)
+def test_generate_seeded(day):
+    assert generate(day, seed=1) == generate(day, seed=1)
+    assert generate(day, seed=1) != generate(day, seed=2)
+
+
+def test_generate_invalid():
+    with pytest.raises(ValueError):
+        generate(Day(2023, 99))
+    with pytest.raises(ValueError):
+        generate(Day(2023, 1), scale=0)
+
+
+def test_skyline():
+    edges = skyline(random.Random(0), 5, 3, 4)
+    assert len(edges) == 12
+
+    y = x = area = 0
+    for d, n in edges:
+        dy, dx = STEPS[d]
+        area += x * (y + dy * n) - y * (x + dx * n)
+        y, x = y + dy * n, x + dx * n
+
+    # the loop closes, clockwise
+    assert (y, x) == (0, 0)
+    assert area > 0
+
+
+def test_d13_reflections():
+    for pattern in generate(Day(2023, 13), scale=3).split("\n\n"):
+        pattern = pattern.split()
+        assert len(reflections(pattern, 0)) == 1
+        assert len(reflections(pattern, 1)) == 1
+
+
+def test_d20_answer(tmp_path):
+    module = Day(2023, 20).load()
+    data = module.parse(write(Day(2023, 20), tmp_path / "input.txt"))
+    modules, sources = data
+
+    # each counter resets after as many presses as the flip-flops feeding its hub add
+    periods = []
+    for flop in modules["broadcaster"]["targets"]:
+        chain = [flop]
+        while nexts := [
+            t
+            for t in modules[chain[-1]]["targets"]
+            if modules[t]["type"] == module.ModuleType.FLIP_FLOP
+        ]:
+            chain.append(nexts[0])
+        (hub,) = set(modules[chain[0]]["targets"]) - set(chain)
+        periods.append(
+            sum(1 << i for i, f in enumerate(chain) if hub in modules[f]["targets"])
+        )
+
+    assert module.solve_part2(data) == lcm(*periods)
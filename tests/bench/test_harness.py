@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+from aoc.bench.harness import (
+    BenchResult,
+    Stats,
+    bench_day,
+    bench_variants,
+    benchmark,
+    format_speedups,
+    format_stats,
+)
+from aoc.runner import Day
+
+EXAMPLE = str(Path(__file__).parents[1] / "y{year}" / "d{day:02}" / "data" / "ex01.txt")
+
+
+def test_stats():
+    stats = Stats((5.0, 1.0, 3.0, 2.0, 4.0))
+    assert stats.min == 1.0
+    assert stats.median == 3.0
+    assert stats.mean == 3.0
+    assert stats.stdev == pytest.approx(1.5811, abs=1e-4)
+    assert stats.iqr == 3.0
+
+
+def test_stats_single():
+    stats = Stats((2.0,))
+    assert stats.median == 2.0
+    assert stats.stdev == 0.0
+    assert stats.iqr == 0.0
+
+
+def test_benchmark_counts_calls():
+    calls = []
+    result, stats = benchmark(calls.append, 1, warmup=2, repeat=3)
+    assert result is None
+    assert len(calls) == 5
+    assert len(stats.samples) == 3
+
+
+def test_benchmark_copies_input():
+    def mutate(data):
+        data.append(len(data))
+        return len(data)
+
+    data = []
+    result, _ = benchmark(mutate, data, warmup=1, repeat=3)
+    assert result == 1
+    assert data == []
+
+
+def test_benchmark_no_copy():
+    data = []
+    benchmark(data.append, 0, warmup=0, repeat=2, copy=False)
+    assert data == [0, 0]
+
+
+def test_benchmark_repeat():
+    with pytest.raises(ValueError):
+        benchmark(len, "", repeat=0)
+
+
+def test_bench_day_mutating_solver():
+    # d21's solve_part2 flips its garden to infinite, which must not leak into the
+    # next repeat or into the other parts.
+    result = bench_day(Day(2023, 21), EXAMPLE, parts=(2, 1), warmup=1, repeat=2)
+    assert result.error is None
+    assert result.answers["part1"] == 42
+    assert set(result.stats) == {"parse", "part1", "part2"}
+    assert all(len(s.samples) == 2 for s in result.stats.values())
+
+
+def test_bench_variants():
+    results = bench_variants(Day(2023, 6), EXAMPLE, warmup=0, repeat=2)
+    assert [r.impl for r in results] == ["fast", "slow"]
+    assert all(r.error is None for r in results)
+    assert all(set(r.stats) == {"parse", "part1", "part2"} for r in results)
+    assert [r.answers["part2"] for r in results] == [71503, 71503]
+
+
+def test_bench_variants_none():
+    results = bench_variants(Day(2023, 21), EXAMPLE, parts=(1,), warmup=0, repeat=1)
+    assert [r.impl for r in results] == ["default"]
+
+
+def test_bench_day_error(tmp_path):
+    result = bench_day(Day(2023, 6), str(tmp_path / "missing.txt"))
+    assert result.error.startswith("FileNotFoundError")
+
+
+def test_format_stats():
+    results = [
+        BenchResult(Day(2023, 6), {"part1": 288}, {"part1": Stats((1.0, 2.0))}),
+        BenchResult(Day(2023, 7), error="ValueError: oops"),
+    ]
+    table = format_stats(results).splitlines()
+    assert "median" in table[0]
+    assert "2023/06" in table[1] and "part1" in table[1] and "288" in table[1]
+    assert "ERROR: ValueError: oops" in table[2]
+
+
+def test_format_speedups():
+    results = [
+        BenchResult(Day(2023, 6), stats={"part1": Stats((1.0,))}, impl="fast"),
+        BenchResult(Day(2023, 6), stats={"part1": Stats((4.0,))}, impl="slow"),
+        BenchResult(Day(2023, 7), stats={"part1": Stats((1.0,))}),
+    ]
+    table = format_speedups(results).splitlines()
+    assert "speed-up" in table[0]
+    assert "fast" in table[1] and "4.00x" in table[1]
+    assert "slow" in table[2] and "1.00x" in table[2]
+    assert len(table) == 3
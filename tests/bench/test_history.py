@@ -0,0 +1,82 @@
+import pytest
+from aoc.bench import history
+from aoc.bench.harness import BenchResult, Stats
+from aoc.runner import Day
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = history.connect(tmp_path / "history.sqlite")
+    yield conn
+    conn.close()
+
+
+def bench_result(day, median, input_hash="abc", impl="default"):
+    return BenchResult(
+        Day(2023, day),
+        stats={"part1": Stats((median,))},
+        memory={"part1": 1024},
+        input_hash=input_hash,
+        impl=impl,
+    )
+
+
+def save_at(conn, monkeypatch, revision, results):
+    monkeypatch.setattr(history, "git_revision", lambda: (revision, False))
+    return history.save(conn, results)
+
+
+def test_change_percent():
+    assert history.Change(2023, 1, "part1", "default", 2.0, 3.0).percent == 50.0
+    assert history.Change(2023, 1, "part1", "default", 2.0, 1.0).percent == -50.0
+
+
+def test_git_revision():
+    revision, dirty = history.git_revision()
+    assert revision
+    assert isinstance(dirty, bool)
+
+
+def test_resolve_unknown():
+    assert history.resolve("not-a-revision") == "not-a-revision"
+
+
+def test_save_skips_failed(conn, monkeypatch):
+    failed = BenchResult(Day(2023, 3), error="FileNotFoundError")
+    assert save_at(conn, monkeypatch, "aaaa", [bench_result(1, 1.0), failed]) == 1
+
+    row = conn.execute("SELECT revision, python, memory FROM results").fetchone()
+    assert row[0] == "aaaa"
+    assert row[1]
+    assert row[2] == 1024
+
+
+def test_save_impl(conn, monkeypatch):
+    results = [bench_result(6, 1.0, impl="fast"), bench_result(6, 4.0, impl="slow")]
+    assert save_at(conn, monkeypatch, "aaaa", results) == 2
+
+    rows = conn.execute("SELECT stage, impl FROM results ORDER BY impl").fetchall()
+    assert rows == [("part1", "fast"), ("part1", "slow")]
+
+
+def test_compare(conn, monkeypatch):
+    save_at(conn, monkeypatch, "aaaa1111", [bench_result(1, 1.0), bench_result(2, 1.0)])
+    save_at(conn, monkeypatch, "bbbb2222", [bench_result(1, 1.5), bench_result(2, 0.5)])
+
+    changes = history.compare(conn, "aaaa", "bbbb")
+    assert [(c.day, c.percent) for c in changes] == [(1, 50.0), (2, -50.0)]
+
+    table = history.format_changes(changes, threshold=10.0).splitlines()
+    assert "SLOWER" in table[1]
+    assert "SLOWER" not in table[2]
+
+
+def test_compare_latest_and_same_input(conn, monkeypatch):
+    save_at(conn, monkeypatch, "aaaa", [bench_result(1, 1.0)])
+    save_at(conn, monkeypatch, "bbbb", [bench_result(1, 9.0)])
+    save_at(conn, monkeypatch, "bbbb", [bench_result(1, 2.0)])
+    save_at(conn, monkeypatch, "bbbb", [bench_result(2, 2.0, input_hash="other")])
+
+    changes = history.compare(conn, "aaaa", "bbbb")
+    assert len(changes) == 1
+    assert changes[0].head == 2.0
@@ -0,0 +1,73 @@
+import csv
+
+import pytest
+from aoc.bench.scaling import (
+    Curve,
+    ScalingResult,
+    format_curves,
+    is_steep,
+    scaling_day,
+    write_csv,
+)
+from aoc.runner import Day
+
+
+def curve(power):
+    c = Curve()
+    for scale in (1, 2, 4, 8):
+        c.add(scale, 100 * scale, 0.001 * scale**power)
+    return c
+
+
+def test_curve_slope():
+    assert curve(1).slope == pytest.approx(1.0)
+    assert curve(2).slope == pytest.approx(2.0)
+
+    c = Curve()
+    assert c.slope is None
+    c.add(1, 100, 0.1)
+    assert c.slope is None
+
+
+def test_curve_predict():
+    assert Curve().predict(2) == 0.0
+    assert curve(2).predict(16) == pytest.approx(0.001 * 16**2)
+    # growth is never extrapolated as less than linear
+    assert curve(0).predict(16) == pytest.approx(0.002)
+
+
+def test_scaling_day(tmp_path):
+    result = scaling_day(Day(2023, 6), scales=(1, 2, 4), warmup=0, repeat=1)
+    assert result.error is None
+    assert list(result.curves) == ["parse", "part1", "part2"]
+    assert all(c.scales == [1, 2, 4] for c in result.curves.values())
+
+    path = write_csv([result], tmp_path / "scaling.csv")
+    with open(path) as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 9
+    assert rows[0]["stage"] == "parse" and rows[0]["scale"] == "1"
+
+
+def test_scaling_day_budget():
+    result = scaling_day(Day(2023, 6), scales=(1, 2, 4), warmup=0, repeat=1, budget=0)
+    assert result.curves["parse"].scales == [1]
+
+
+def test_scaling_day_error():
+    result = scaling_day(Day(2023, 99), scales=(1,))
+    assert result.error.startswith("ModuleNotFoundError")
+
+
+def test_format_curves():
+    results = [
+        ScalingResult(Day(2023, 1), {"part1": curve(1), "part2": curve(2)}),
+        ScalingResult(Day(2023, 2), error="ValueError: oops"),
+    ]
+    table = format_curves(results, 1.5).splitlines()
+    assert "1.00" in table[1] and "STEEP" not in table[1]
+    assert "2.00" in table[2] and "STEEP" in table[2]
+    assert "ERROR: ValueError: oops" in table[3]
+
+    assert is_steep(results, 1.5)
+    assert not is_steep(results, 2.5)
@@ -0,0 +1,115 @@
+import re
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from aoc.bench import generators
+from aoc.bench.harness import Stats, benchmark, peak_memory
+from aoc.runner import Day
+from aoc.solution import Solution
+from aoc.utils.isolation import isolated
+from aoc.utils.state import STATE_DIR_ENV
+
+DAY_RE = re.compile(r"y(?P<year>\d{4})[/\\]d(?P<day>\d{2})[/\\]")
+
+# The median seconds of `baseline` on the machine the `max_seconds` budgets were set
+# on. A budget is stretched by how much slower `baseline` runs alongside the part
+# being timed (but never tightened), so a slower or busier machine doesn't fail it.
+BASELINE_SECONDS = 0.02
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    """Keep run state (timings, caches, history) out of the working directory."""
+    path = tmp_path / "state"
+    monkeypatch.setenv(STATE_DIR_ENV, str(path))
+    return path
+
+
+@dataclass
+class Perf:
+    """The answer, timings and peak traced bytes of a `perf` fixture's solve."""
+
+    answer: Any
+    stats: Stats
+    peak: int | None
+
+
+def baseline(n: int) -> int:
+    return sum(i * i % 7 for i in range(n))
+
+
+def measure_part(
+    solution: Solution, part: int, data: Any, repeat: int, memory: bool
+) -> tuple[Any, Stats, int | None, float]:
+    solve, kwargs = solution.parts[part], solution.kwargs(part)
+    answer, stats = benchmark(
+        solve, data, warmup=1, repeat=repeat, copy=solution.mutates, **kwargs
+    )
+    peak = peak_memory(solve, data, **kwargs) if memory else None
+    _, reference = benchmark(baseline, 200_000, warmup=1, repeat=repeat, copy=False)
+
+    return answer, stats, peak, max(reference.median / BASELINE_SECONDS, 1.0)
+
+
+@pytest.fixture
+def perf(request, tmp_path) -> Perf:
+    """Time a part on a large generated input, failing the test if it's over budget.
+
+    The part and budgets come from the test's marker, such as
+
+        @pytest.mark.perf(part=2, scale=100, max_seconds=0.01, max_mib=1)
+
+    where `max_seconds` bounds the median of `repeat` (5) timed calls, so that one
+    slow call doesn't fail the test, on a machine as fast as the one it was set on
+    (see `BASELINE_SECONDS`), and `max_mib` bounds the peak traced memory of a call.
+    The input is generated at `scale` (10) with `seed` (0) for the day of the test's
+    directory. Deselect these tests with `-m "not perf"`.
+
+    The calls are made in a child process that's given up on well past the budget,
+    so a regression to a much slower algorithm fails rather than hangs the suite.
+    """
+    marker = request.node.get_closest_marker("perf")
+    if marker is None:
+        pytest.fail("the perf fixture needs a perf marker")
+    options = marker.kwargs
+    max_seconds = options.get("max_seconds")
+    max_mib = options.get("max_mib")
+
+    m = DAY_RE.search(str(request.node.path))
+    day = Day(int(m.group("year")), int(m.group("day")))
+    solution = day.solution()
+    part = options["part"]
+
+    path = tmp_path / "input.txt"
+    generators.write(day, path, options.get("scale", 10), options.get("seed", 0))
+    data = solution.parse(path)
+
+    repeat = options.get("repeat", 5)
+    timeout = None if max_seconds is None else 10 * max_seconds * (repeat + 1) + 5
+    try:
+        answer, stats, peak, slowdown = isolated(
+            measure_part,
+            solution,
+            part,
+            data,
+            repeat,
+            max_mib is not None,
+            timeout=timeout,
+        )
+    except TimeoutError:
+        pytest.fail(
+            f"{day} part{part} is over budget: no result in {timeout:g}s", False
+        )
+
+    over = []
+    if max_seconds is not None and stats.median > max_seconds * slowdown:
+        over.append(
+            f"median {stats.median:.4f}s > {max_seconds}s x {slowdown:.2f} slowdown"
+        )
+    if max_mib is not None and peak / 2**20 > max_mib:
+        over.append(f"peak {peak / 2**20:.1f} MiB > {max_mib} MiB")
+    if over:
+        pytest.fail(f"{day} part{part} is over budget: {', '.join(over)}", False)
+
+    return Perf(answer, stats, peak)
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import pytest
+from aoc.cli import main, parse_parts
+
+EXAMPLE = str(Path(__file__).parent / "y{year}" / "d{day:02}" / "data" / "ex01.txt")
+
+
+def test_parse_parts():
+    assert parse_parts("1") == (1,)
+    assert parse_parts("1,2") == (1, 2)
+
+
+def test_main_run(capsys):
+    assert main(["run", "-y", "2023", "-d", "6", "-i", EXAMPLE]) == 0
+    out = capsys.readouterr().out
+    assert "2023/06" in out
+    assert "71503" in out
+
+
+def test_main_run_impl(capsys):
+    assert main(["run", "-d", "6", "--impl", "slow", "-i", EXAMPLE]) == 0
+    assert "71503" in capsys.readouterr().out
+
+
+def test_main_run_force(capsys):
+    argv = ["run", "-d", "6", "-i", EXAMPLE]
+    assert main(argv) == 0
+    assert "loaded from cache" not in capsys.readouterr().out
+    assert main(argv) == 0
+    assert "loaded from cache" in capsys.readouterr().out
+    assert main(argv + ["--force"]) == 0
+    assert "loaded from cache" not in capsys.readouterr().out
+
+
+def test_main_run_import_times(capsys):
+    # with every module shown, the solution's rank by self time doesn't matter
+    argv = ["run", "-d", "6", "--import-times", "--top", "1000", "-i", EXAMPLE]
+    assert main(argv) == 0
+    out = capsys.readouterr().out
+    assert "2023/06 import" in out
+    assert "self    total  module" in out
+    assert "aoc.y2023.d06.solution" in out
+
+
+def test_main_run_error(capsys, tmp_path):
+    assert main(["run", "-d", "6", "-i", str(tmp_path / "missing.txt")]) == 1
+    assert "FileNotFoundError" in capsys.readouterr().out
+
+
+def test_main_run_none(capsys):
+    assert main(["run", "-y", "1999"]) == 1
+
+
+def test_main_invalid_parts():
+    with pytest.raises(SystemExit):
+        main(["run", "-p", "3"])
+
+
+def test_main_bench(capsys):
+    assert main(["bench", "-d", "6", "-w", "0", "-r", "2", "-i", EXAMPLE]) == 0
+    out = capsys.readouterr().out
+    assert "median" in out
+    assert "71503" in out
+
+
+def test_main_bench_variants(capsys):
+    argv = ["bench", "-d", "17", "-w", "0", "-r", "1", "--variants", "-i", EXAMPLE]
+    assert main(argv) == 0
+    out = capsys.readouterr().out
+    assert "speed-up" in out
+    assert "bucket" in out and "heap" in out
+
+
+def test_main_generate(capsys, tmp_path):
+    template = str(tmp_path / "{year}" / "{day:02}.txt")
+    assert main(["generate", "-d", "6", "-d", "17", "-s", "2", "-o", template]) == 0
+    assert capsys.readouterr().out.split() == [
+        str(tmp_path / "2023" / "06.txt"),
+        str(tmp_path / "2023" / "17.txt"),
+    ]
+
+    assert main(["run", "-d", "6", "-d", "17", "-i", template]) == 0
+    assert "ERROR" not in capsys.readouterr().out
+
+
+def test_main_bench_scaling(capsys, tmp_path):
+    argv = ["bench", "-d", "1", "-w", "0", "-r", "1", "--scaling", "1,2"]
+    assert main(argv + ["--csv", str(tmp_path / "scaling.csv")]) == 0
+    out = capsys.readouterr().out
+    assert "slope" in out and "2023/01" in out
+    assert (tmp_path / "scaling.csv").exists()
+
+    assert main(argv + ["--threshold", "-100"]) == 1
+    assert "STEEP" in capsys.readouterr().out
+
+
+def test_main_compare(capsys):
+    assert main(["compare", "HEAD"]) == 1
+
+    assert main(["bench", "-d", "6", "-w", "0", "-r", "1", "-s", "-i", EXAMPLE]) == 0
+    capsys.readouterr()
+
+    assert main(["compare", "HEAD", "HEAD"]) == 0
+    out = capsys.readouterr().out
+    assert "2023/06" in out
+    assert "SLOWER" not in out
+
+
+def test_main_run_profile(capsys, tmp_path):
+    argv = ["run", "-d", "6", "-p", "1", "--profile", str(tmp_path), "--top", "3"]
+    assert main(argv + ["-i", EXAMPLE]) == 0
+    out = capsys.readouterr().out
+    assert "2023/06 part1" in out
+    assert "cumulative" in out
+
+
+def test_main_diff(capsys):
+    assert main(["diff", "-d", "6", "-n", "5"]) == 0
+    assert "ok on 5 inputs" in capsys.readouterr().out
+    assert main(["diff", "-y", "1999"]) == 1
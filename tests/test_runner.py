@@ -0,0 +1,228 @@
+from pathlib import Path
+
+import pytest
+from aoc import runner
+from aoc.runner import (
+    Day,
+    Result,
+    RunOptions,
+    discover,
+    format_table,
+    load_timings,
+    run_day,
+    run_days,
+    save_timings,
+    schedule,
+)
+from aoc.utils import progress
+
+EXAMPLE = str(Path(__file__).parent / "y{year}" / "d{day:02}" / "data" / "ex01.txt")
+
+
+def test_day_str():
+    assert str(Day(2023, 1)) == "2023/01"
+
+
+def test_day_module():
+    assert Day(2023, 1).module == "aoc.y2023.d01.solution"
+
+
+def test_day_input_default():
+    path = Day(2023, 1).input()
+    assert path.parts[-4:] == ("y2023", "d01", "data", "data.txt")
+
+
+def test_day_input_template():
+    assert Day(2023, 7).input("in/{year}/{day:02}.txt") == Path("in/2023/07.txt")
+
+
+def test_discover_all():
+    days = discover()
+    assert Day(2023, 1) in days
+    assert Day(2023, 21) in days
+    assert days == sorted(days)
+    assert all(day.year != 0 for day in days)
+
+
+def test_discover_filtered():
+    assert discover([2023], [1, 2]) == [Day(2023, 1), Day(2023, 2)]
+    assert discover([1999]) == []
+
+
+@pytest.mark.parametrize(
+    "day, part1, part2",
+    [
+        (Day(2023, 1), 142, 142),
+        (Day(2023, 6), 288, 71503),
+        (Day(2023, 7), 6440, 5905),
+    ],
+)
+def test_run_day(day, part1, part2):
+    result = run_day(day, RunOptions(EXAMPLE))
+    assert result.error is None
+    assert result.answers == {"part1": part1, "part2": part2}
+    assert set(result.times) == {"parse", "part1", "part2"}
+
+
+def test_run_day_memory():
+    result = run_day(Day(2023, 6), RunOptions(EXAMPLE, memory=True))
+    assert set(result.peaks) == {"parse", "part1", "part2"}
+    assert result.maxrss > 0
+
+
+def test_run_day_profile(tmp_path):
+    result = run_day(Day(2023, 6), RunOptions(EXAMPLE, parts=(1,), profile=tmp_path))
+    assert result.profiles == {
+        "parse": tmp_path / "y2023-d06-parse.pstats",
+        "part1": tmp_path / "y2023-d06-part1.pstats",
+    }
+    assert all(path.exists() for path in result.profiles.values())
+
+
+def test_run_day_parts():
+    result = run_day(Day(2023, 6), RunOptions(EXAMPLE, parts=(2,)))
+    assert result.answers == {"part2": 71503}
+
+
+def test_run_day_counters(monkeypatch):
+    monkeypatch.setattr(progress, "ENABLED", True)
+    monkeypatch.setattr(progress, "COUNTERS", {})
+    result = run_day(Day(2023, 9), RunOptions(EXAMPLE))
+    assert result.error is None
+    assert [c.count for c in result.counters["part1"]] == [3]
+    assert set(result.counters) == {"part1", "part2"}
+
+
+def test_run_day_isolated():
+    result = run_day(Day(2023, 6), RunOptions(EXAMPLE, timeout=60))
+    assert result.error is None
+    assert result.answers == {"part1": 288, "part2": 71503}
+    assert set(result.times) == {"parse", "part1", "part2"}
+
+
+def test_run_day_timeout(tmp_path):
+    # ZZZ can't be reached, so d08 walks the AAA-BBB loop forever
+    path = tmp_path / "2023" / "08.txt"
+    path.parent.mkdir()
+    path.write_text("LR\n\nAAA = (BBB, BBB)\nBBB = (AAA, AAA)\nZZZ = (ZZZ, ZZZ)\n")
+
+    options = RunOptions(str(tmp_path / "{year}" / "{day:02}.txt"), timeout=0.5)
+    result = run_day(Day(2023, 8), options)
+    assert result.error == (
+        "TIMEOUT: part1 took longer than 0.5s; TIMEOUT: part2 took longer than 0.5s"
+    )
+    assert result.answers == {}
+
+
+@pytest.mark.parametrize(
+    "error, oom",
+    [
+        ("MemoryError: ", True),
+        ("_ArrayMemoryError: Unable to allocate 8.00 GiB", True),
+        ("ImportError: libfoo.so: failed to map segment from shared object", True),
+        ("ModuleNotFoundError: No module named 'foo'", False),
+        ("ValueError: not enough values to unpack", False),
+    ],
+)
+def test_run_day_oom(monkeypatch, error, oom):
+    monkeypatch.setattr(
+        runner, "isolated", lambda *args, **kwargs: Result(Day(2023, 6), error=error)
+    )
+    result = run_day(Day(2023, 6), RunOptions(EXAMPLE, parts=(1,), max_memory=2**20))
+    assert result.error.startswith("OOM: part1 needed more than 1.0 MiB") == oom
+
+
+def test_run_day_missing_input(tmp_path):
+    result = run_day(Day(2023, 6), RunOptions(str(tmp_path / "missing.txt")))
+    assert result.error.startswith("FileNotFoundError")
+    assert result.answers == {}
+
+
+def test_run_day_cache():
+    options = RunOptions(EXAMPLE, cache=True)
+    first = run_day(Day(2023, 6), options)
+    second = run_day(Day(2023, 6), options)
+    assert first.cached == set()
+    assert second.cached == {"parse"}
+    assert second.answers == first.answers == {"part1": 288, "part2": 71503}
+    table = format_table([second]).splitlines()
+    assert table[1].split("|")[2].strip().endswith("*")
+    assert table[-1] == "* loaded from cache"
+
+
+def test_run_day_memo():
+    options = RunOptions(EXAMPLE, parts=(1,), memo=True)
+    first = run_day(Day(2023, 6), options)
+    assert first.cached == set()
+
+    second = run_day(Day(2023, 6), options)
+    assert second.cached == {"parse", "part1"}
+    assert second.answers == {"part1": 288}
+    assert second.times == first.times
+
+    # part 2 isn't stored yet, so it's solved (and the input parsed) as usual
+    third = run_day(Day(2023, 6), RunOptions(EXAMPLE, memo=True))
+    assert third.cached == {"part1"}
+    assert third.answers == {"part1": 288, "part2": 71503}
+
+    forced = run_day(Day(2023, 6), RunOptions(EXAMPLE, memo=True, force=True))
+    assert forced.cached == set()
+
+
+def test_timings_roundtrip():
+    assert load_timings() == {}
+    save_timings([Result(Day(2023, 1), times={"parse": 1.0, "part1": 2.0})])
+    save_timings(
+        [Result(Day(2023, 2), times={"parse": 3.0}), Result(Day(2023, 3), error="x")]
+    )
+    assert load_timings() == {
+        "2023/01": {"parse": 1.0, "part1": 2.0},
+        "2023/02": {"parse": 3.0},
+    }
+
+    # a run of some parts keeps the times of the others
+    save_timings([Result(Day(2023, 1), times={"parse": 0.5, "part2": 4.0})])
+    assert load_timings()["2023/01"] == {"parse": 0.5, "part1": 2.0, "part2": 4.0}
+
+
+def test_schedule():
+    days = [Day(2023, 1), Day(2023, 2), Day(2023, 3), Day(2023, 4)]
+    timings = {
+        "2023/01": {"part1": 1.0},
+        "2023/02": {"parse": 1.0, "part1": 4.0},
+        "2023/03": {"part1": 2.0},
+    }
+    assert schedule(days, timings) == [
+        Day(2023, 4),
+        Day(2023, 2),
+        Day(2023, 3),
+        Day(2023, 1),
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_days(jobs):
+    days = [Day(2023, 7), Day(2023, 1), Day(2023, 6)]
+    results = run_days(days, RunOptions(EXAMPLE), jobs=jobs)
+    assert [r.day for r in results] == sorted(days)
+    assert [r.answers["part1"] for r in results] == [142, 288, 6440]
+    assert set(load_timings()) == {"2023/01", "2023/06", "2023/07"}
+
+
+def test_run_days_variant():
+    # a variant's times would mislead the schedule, which runs the default
+    results = run_days([Day(2023, 6)], RunOptions(EXAMPLE, impl="slow"))
+    assert results[0].answers["part2"] == 71503
+    assert load_timings() == {}
+
+
+def test_format_table():
+    results = [
+        Result(Day(2023, 6), {"part1": 288}, {"parse": 0.5, "part1": 1.0}),
+        Result(Day(2023, 7), error="ValueError: oops"),
+    ]
+    table = format_table(results).splitlines()
+    assert table[0].startswith("| day")
+    assert "2023/06" in table[1] and "288" in table[1]
+    assert "ERROR: ValueError: oops" in table[3]
+    assert table[-1].startswith("| total") and "0:00:01.500000" in table[-1]
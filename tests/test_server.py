@@ -0,0 +1,72 @@
+import threading
+from pathlib import Path
+
+import pytest
+from aoc.runner import Day
+from aoc.server import SOLUTIONS, Server, jsonable, pool, preload, request, solve
+
+EXAMPLE = Path(__file__).parent / "y2023" / "d{day:02}" / "data" / "ex01.txt"
+
+
+def example(day: int) -> Path:
+    return Path(str(EXAMPLE).format(day=day))
+
+
+def test_preload():
+    solutions = preload([Day(2023, 6)])
+    assert SOLUTIONS[Day(2023, 6)] is solutions[Day(2023, 6)]
+
+
+def test_solve_path():
+    response = solve({"year": 2023, "day": 6, "path": str(example(6))})
+    assert response["error"] is None
+    assert response["answers"] == {"part1": 288, "part2": 71503}
+    assert set(response["times"]) == {"parse", "part1", "part2"}
+
+
+def test_solve_inline():
+    text = example(11).read_text()
+    response = solve({"year": 2023, "day": 11, "part": 1, "input": text})
+    assert response["answers"] == {"part1": 374}
+
+
+def test_solve_mutating():
+    request = {"year": 2023, "day": 21, "part": [2, 1], "path": str(example(21))}
+    assert solve(request)["answers"]["part1"] == 42
+
+
+def test_solve_impl():
+    request = {"year": 2023, "day": 6, "impl": "slow", "path": str(example(6))}
+    assert solve(request)["answers"] == {"part1": 288, "part2": 71503}
+
+
+def test_solve_error():
+    response = solve({"year": 2023, "day": 6, "path": "missing.txt"})
+    assert response["error"].startswith("FileNotFoundError")
+    assert solve({"day": 6})["error"] == "KeyError: 'year'"
+
+
+def test_jsonable():
+    np = pytest.importorskip("numpy")
+    assert jsonable(np.int64(3)) == 3
+    assert isinstance(jsonable(np.int64(3)), int)
+    assert jsonable(None) is None
+    assert jsonable((1, 2)) == "(1, 2)"
+
+
+@pytest.mark.parametrize("jobs", [0, 1])
+def test_server(tmp_path, jobs):
+    address = tmp_path / "serve.sock"
+    with pool(jobs) as executor, Server(address, executor) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            response = request(
+                address, {"year": 2023, "day": 6, "path": str(example(6))}
+            )
+            assert response["answers"] == {"part1": 288, "part2": 71503}
+            response = request(address, ["not", "an", "object"])
+            assert response["error"] == "ValueError: a request must be a JSON object"
+        finally:
+            server.shutdown()
+            thread.join()
@@ -0,0 +1,88 @@
+import types
+from pathlib import Path
+
+import pytest
+from aoc.runner import Day, RunOptions, discover, run_day
+from aoc.solution import Solution
+
+EXAMPLE = str(Path(__file__).parent / "y{year}" / "d{day:02}" / "data" / "ex01.txt")
+
+
+@pytest.mark.parametrize("day", discover(), ids=str)
+def test_every_day_declares_a_solution(day):
+    solution = day.load().SOLUTION
+    assert isinstance(solution, Solution)
+    assert (solution.year, solution.day) == (day.year, day.day)
+    assert set(solution.parts) == {1, 2}
+
+
+def test_solution_kwargs():
+    solution = Day(2023, 11).solution()
+    assert solution.kwargs(1) == {}
+    assert solution.kwargs(2) == {"mult": 1000000}
+    assert solution.kwargs(2, mult=10) == {"mult": 10}
+
+
+def test_solution_solve():
+    solution = Day(2023, 11).solution()
+    data = solution.parse(Path(EXAMPLE.format(year=2023, day=11)))
+    assert solution.solve(1, data) == 374
+    assert solution.solve(2, data, mult=10) == 1030
+
+
+def test_solution_variants():
+    solution = Day(2023, 17).solution()
+    assert solution.variant == "bucket"
+    assert solution.kwargs(1) == {"queue": "bucket"}
+    assert solution.using("heap").variant == "heap"
+    assert solution.using("heap").kwargs(2) == {"queue": "heap"}
+    assert solution.using(None) == solution
+    # naming the default variant is the same as not naming one
+    assert solution.using("bucket") == solution
+
+    with pytest.raises(ValueError, match="no variant 'slow'"):
+        solution.using("slow")
+
+    # a day without variants has just the one implementation
+    assert Day(2023, 11).solution().using("heap").kwargs(2) == {"mult": 1000000}
+    assert Day(2023, 11).solution().using("heap").impl is None
+
+
+def test_solution_of_undeclared_module():
+    module = types.ModuleType("aoc.y2023.d99.solution")
+    module.parse = lambda path: path
+    module.solve_part1 = lambda data: 1
+
+    solution = Solution.of(module)
+    assert (solution.year, solution.day) == (2023, 99)
+    assert solution.parts == {1: module.solve_part1}
+    assert not solution.mutates
+
+
+def test_solution_main(capsys):
+    solution = Day(2023, 6).solution()
+    assert solution.main([EXAMPLE.format(year=2023, day=6)]) == 0
+
+    out = capsys.readouterr().out
+    assert "part1 |" in out and "288 |" in out
+    assert "part2 |" in out and "71503 |" in out
+
+
+def test_run_day_mutating_solver():
+    # d21's solve_part2 flips its garden to infinite, which must not leak into part 1
+    options = RunOptions(template=EXAMPLE, parts=(2, 1))
+    result = run_day(Day(2023, 21), options)
+    assert result.error is None
+    assert result.answers["part1"] == 42
+
+
+def test_run_day_variant():
+    options = RunOptions(template=EXAMPLE, impl="slow", memo=True)
+    result = run_day(Day(2023, 6), options)
+    assert result.error is None
+    assert result.answers == {"part1": 288, "part2": 71503}
+    # the stored answers are the default variant's, so they're neither used nor saved
+    assert not result.cached
+
+    result = run_day(Day(2023, 6), RunOptions(template=EXAMPLE, impl="medium"))
+    assert result.error.startswith("ValueError: no variant 'medium'")
@@ -0,0 +1,100 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from aoc.utils.cache import ParseCache, dependencies, source_hash
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache(tmp_path / "parse")
+
+
+def test_dependencies():
+    module = sys.modules[ParseCache.__module__]
+    names = [m.__name__ for m in dependencies(module)]
+    assert names == [
+        "aoc.utils.cache",
+        "aoc.utils.hashing",
+        "aoc.utils.lazy",
+        "aoc.utils.state",
+    ]
+
+
+def test_source_hash():
+    module = sys.modules[ParseCache.__module__]
+    assert source_hash(module) == source_hash(module)
+    assert len(source_hash(module)) == 16
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"a": [1, 2, 3]},
+        np.arange(12).reshape(3, 4),
+        [np.zeros(2), np.ones(3)],
+        (np.zeros(2), np.ones(3)),
+    ],
+)
+def test_roundtrip(cache, value):
+    path = cache.put("key", value)
+    assert path.suffix == (".pickle" if isinstance(value, dict) else ".npz")
+
+    loaded = cache.get("key")
+    assert type(loaded) is type(value)
+    if isinstance(value, dict):
+        assert loaded == value
+    else:
+        np.testing.assert_equal(loaded, value)
+
+
+def test_miss(cache):
+    with pytest.raises(KeyError):
+        cache.get("key")
+
+
+def test_corrupt_entry(cache):
+    (cache.root / "key.pickle").write_bytes(b"not a pickle")
+    with pytest.raises(KeyError):
+        cache.get("key")
+    assert cache.entries() == []
+
+
+def test_evict(tmp_path):
+    cache = ParseCache(tmp_path, max_bytes=2500)
+    a = cache.put("a", np.zeros(100))
+    b = cache.put("b", np.zeros(100))
+    # "b" was used less recently than "a"
+    os.utime(a, (2, 2))
+    os.utime(b, (1, 1))
+    cache.put("c", np.zeros(100))
+    assert sorted(p.stem for p in cache.entries()) == ["a", "c"]
+
+
+def test_evict_removed(tmp_path, monkeypatch):
+    cache = ParseCache(tmp_path, max_bytes=1500)
+    a = cache.put("a", np.zeros(100))
+    os.utime(a, (1, 1))
+    # an entry listed but then removed by another process is skipped
+    entries = cache.entries
+    monkeypatch.setattr(cache, "entries", lambda: [tmp_path / "gone.npz", *entries()])
+    cache.put("b", np.zeros(100))
+    assert sorted(p.stem for p in entries()) == ["b"]
+
+
+def test_parse(cache, tmp_path):
+    calls = []
+
+    def parse(path):
+        calls.append(path)
+        return path.read_text().split()
+
+    path = tmp_path / "input.txt"
+    path.write_text("a b")
+    assert cache.parse(parse, path) == (["a", "b"], False)
+    assert cache.parse(parse, path) == (["a", "b"], True)
+
+    path.write_text("c")
+    assert cache.parse(parse, path) == (["c"], False)
+    assert len(calls) == 2
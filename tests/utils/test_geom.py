@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from aoc.utils import geom
+from aoc.utils.geom import Vec2d
+
+
+def test_vec2d():
+    v = Vec2d(1, 2)
+    assert (v.y, v.x) == (1, 2)
+    assert Vec2d() == Vec2d(0, 0)
+    assert v + Vec2d(3, 4) == Vec2d(4, 6)
+    assert v - Vec2d(3, 4) == Vec2d(-2, -2)
+    assert v * 3 == 3 * v == Vec2d(3, 6)
+    assert -v == Vec2d(-1, -2)
+    assert Vec2d(7, -1) % Vec2d(5, 5) == Vec2d(2, 4)
+    assert Vec2d(1, 0).det(Vec2d(0, 1)) == -1
+    assert Vec2d(-3, 4).manhattan() == 7
+
+
+def test_vec2d_types():
+    # results are vectors, not the tuples that tuple operators would make
+    for result in (Vec2d(1, 2) + Vec2d(), Vec2d(1, 2) * 2, -Vec2d(1, 2)):
+        assert type(result) is Vec2d
+
+    assert not hasattr(Vec2d(), "__dict__")
+    assert {Vec2d(1, 2): "a"}[Vec2d(1, 2)] == "a"
+    assert sorted([Vec2d(1, 0), Vec2d(0, 5)]) == [Vec2d(0, 5), Vec2d(1, 0)]
+
+
+def test_arrays():
+    points = geom.as_array([Vec2d(1, 2), Vec2d(3, 4)])
+    assert points.shape == (2, 2) and points.dtype == np.int64
+    assert geom.as_vecs(points) == [Vec2d(1, 2), Vec2d(3, 4)]
+    assert geom.as_array([]).shape == (0, 2)
+
+
+def test_neighbours():
+    points = geom.as_array([(0, 0), (5, 5)])
+    moved = geom.neighbours(points)
+    assert moved.shape == (8, 2)
+    assert moved[:4].tolist() == [[-1, 0], [0, 1], [1, 0], [0, -1]]
+    assert moved[4:].tolist() == [[4, 5], [5, 6], [6, 5], [5, 4]]
+
+
+def test_wrap():
+    points = geom.as_array([(-1, 0), (5, 12)])
+    assert geom.wrap(points, (5, 10)).tolist() == [[4, 0], [0, 2]]
+
+
+@pytest.mark.parametrize("point", [(0, 0), (-1, -1), (3, -7), (-(2**31), 2**31 - 1)])
+def test_pack(point):
+    points = geom.as_array([point])
+    assert geom.unpack(geom.pack(points)).tolist() == [list(point)]
+
+
+def test_unique():
+    points = geom.as_array([(1, 1), (0, 5), (1, 1), (-2, 3), (0, 5)])
+    assert geom.unique(points).tolist() == [[-2, 3], [0, 5], [1, 1]]
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+from aoc.utils.graph import SearchStats, astar, bfs, dial, dijkstra
+
+# A 5x5 grid of random weights, where a state is y * 5 + x and entering a cell costs
+# its weight.
+SIZE = 5
+WEIGHTS = [random.Random(0).randint(1, 9) for _ in range(SIZE * SIZE)]
+TARGET = SIZE * SIZE - 1
+
+
+def neighbours(state):
+    y, x = divmod(state, SIZE)
+    for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+        if 0 <= ny < SIZE and 0 <= nx < SIZE:
+            yield ny * SIZE + nx
+
+
+def edges(state):
+    return ((n, WEIGHTS[n]) for n in neighbours(state))
+
+
+def is_target(state):
+    return state == TARGET
+
+
+def manhattan(state):
+    y, x = divmod(state, SIZE)
+    return (SIZE - 1 - y) + (SIZE - 1 - x)
+
+
+def brute_force():
+    # Bellman-Ford, to check the engines against
+    best = [float("inf")] * (SIZE * SIZE)
+    best[0] = 0
+    for _ in range(SIZE * SIZE):
+        for state in range(SIZE * SIZE):
+            for n, w in edges(state):
+                best[n] = min(best[n], best[state] + w)
+    return best[TARGET]
+
+
+@pytest.mark.parametrize(
+    "search",
+    [
+        lambda stats: dijkstra((0,), edges, is_target, stats),
+        lambda stats: dial((0,), edges, is_target, 9, stats),
+        lambda stats: astar((0,), edges, is_target, manhattan, stats),
+    ],
+)
+def test_search(search):
+    stats = SearchStats()
+    assert search(stats) == brute_force()
+    assert 0 < stats.expanded <= stats.pushed
+
+
+def test_astar_expands_less():
+    plain, guided = SearchStats(), SearchStats()
+    dijkstra((0,), edges, is_target, plain)
+    astar((0,), edges, is_target, manhattan, guided)
+    assert guided.expanded <= plain.expanded
+
+
+def test_search_unreachable():
+    def nowhere(state):
+        return ()
+
+    assert dijkstra((0,), nowhere, is_target) is None
+    assert dial((0,), nowhere, is_target, 9) is None
+    assert astar((0,), nowhere, is_target, manhattan) is None
+
+
+def test_search_sources():
+    # any source may be the nearest
+    assert dijkstra((0, TARGET), edges, is_target) == 0
+    assert dial((0, TARGET), edges, is_target, 9) == 0
+
+
+def test_dial_weights():
+    assert dial((0,), lambda s: [(s + 1, 0)], lambda s: s == 3, 1) == 0
+
+    with pytest.raises(ValueError):
+        dial((0,), edges, is_target, 5)
+
+
+def test_dial_shared_stats():
+    # a stats object that has counted other searches must not keep this one going
+    stats = SearchStats()
+    for _ in range(2):
+        assert (
+            dial((0,), lambda s: [(1, 1)] if s == 0 else [], lambda s: s == 2, 1, stats)
+            is None
+        )
+    assert stats.pushed == 4
+
+
+def test_bfs():
+    stats = SearchStats()
+    dist = bfs((0,), neighbours, SIZE * SIZE, stats)
+    assert dist.tolist() == [y + x for y in range(SIZE) for x in range(SIZE)]
+    assert stats.expanded == stats.pushed == SIZE * SIZE
+
+
+def test_bfs_sources():
+    dist = bfs((0, TARGET), neighbours, SIZE * SIZE)
+    assert dist[0] == dist[TARGET] == 0
+    assert dist.max() == SIZE - 1
+
+    # states that can't be reached stay at -1
+    dist = bfs((0,), lambda s: [1] if s == 0 else [], 3)
+    assert dist.tolist() == [0, 1, -1]
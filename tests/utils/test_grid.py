@@ -0,0 +1,112 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+from aoc.utils.grid import Grid, shift
+
+TEXT = "#..\n.S.\n..#\n.#.\n"
+
+
+@pytest.fixture
+def grid():
+    return Grid.parse(TEXT)
+
+
+def test_parse(grid):
+    assert grid.cells.dtype == np.uint8
+    assert grid.shape == (4, 3)
+    assert len(grid) == 4 and len(grid[0]) == 3
+    assert str(grid) == TEXT.strip()
+
+    assert Grid.parse(TEXT.encode()) == grid
+    assert Grid.parse(TEXT.replace("\n", "\r\n")) == grid
+    assert Grid.parse("abc").shape == (1, 3)
+
+
+def test_parse_ragged():
+    with pytest.raises(ValueError):
+        Grid.parse("ab\nc\n")
+    with pytest.raises(ValueError):
+        Grid.parse("abc\nde\nfg\n")
+
+
+def test_parse_many():
+    grids = Grid.parse_many("ab\ncd\n\n#\n")
+    assert [g.shape for g in grids] == [(2, 2), (1, 1)]
+
+
+def test_read(tmp_path, grid):
+    path = tmp_path / "grid.txt"
+    path.write_text(TEXT)
+    assert Grid.read(path) == grid
+
+
+def test_indexing(grid):
+    assert grid[1, 1] == ord("S")
+    assert (0, 0) in grid
+    assert (4, 0) not in grid and (0, -1) not in grid
+
+    assert grid.get((0, 0)) == ord("#")
+    assert grid.get((-1, 0)) is None
+    assert grid.get((9, 9), 0) == 0
+
+    assert grid.wrap((5, 4)) == grid.get((1, 1))
+    assert grid.wrap((-4, -3)) == grid.get((0, 0))
+
+    grid[1, 1] = "."
+    assert grid.find_one("S") is None
+
+
+def test_find(grid):
+    assert grid.find("#").tolist() == [[0, 0], [2, 2], [3, 1]]
+    assert grid.find_one("S") == (1, 1)
+    assert grid.mask(".").sum() == 8
+
+
+def test_neighbours(grid):
+    assert list(grid.neighbours((0, 0))) == [(0, 1), (1, 0)]
+    assert len(list(grid.neighbours((1, 1), diagonal=True))) == 8
+
+
+def test_count_neighbours(grid):
+    counts = grid.count_neighbours("#")
+    assert counts[1, 1] == 0
+    assert counts[2, 1] == 2
+
+    counts = grid.count_neighbours("#", diagonal=True)
+    assert counts[1, 1] == 2
+
+
+@pytest.mark.parametrize("dy, dx", [(0, 0), (1, 0), (-2, 1), (0, -1), (9, 0)])
+def test_shift(dy, dx):
+    cells = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    out = shift(cells, dy, dx, fill=255)
+
+    for y in range(3):
+        for x in range(4):
+            src = (y - dy, x - dx)
+            exp = cells[src] if 0 <= src[0] < 3 and 0 <= src[1] < 4 else 255
+            assert out[y, x] == exp
+
+
+def test_views(grid):
+    assert str(grid.transpose()) == "#...\n.S.#\n..#."
+    assert str(grid.fliplr()).startswith("..#")
+    assert str(grid.flipud()).startswith(".#.")
+    assert grid.rot90(4) == grid
+
+    # views share cells with the grid
+    view = grid.rot90()
+    assert np.shares_memory(view.cells, grid.cells)
+    view[0, 0] = "X"
+    assert grid[0, 2] == ord("X")
+
+
+def test_copy(grid):
+    for other in (grid.copy(), copy.deepcopy(grid), pickle.loads(pickle.dumps(grid))):
+        assert other == grid
+        other[0, 0] = "."
+        assert grid[0, 0] == ord("#")
+
+    assert grid.key() == grid.copy().key()
@@ -0,0 +1,13 @@
+from aoc.utils.hashing import hash_bytes, hash_file
+
+
+def test_hash_bytes():
+    assert hash_bytes(b"abc") == hash_bytes(b"abc")
+    assert hash_bytes(b"abc") != hash_bytes(b"abd")
+    assert len(hash_bytes(b"")) == 16
+
+
+def test_hash_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"abc")
+    assert hash_file(path) == hash_bytes(b"abc")
@@ -0,0 +1,45 @@
+from aoc.utils.importtime import (
+    ImportTime,
+    import_times,
+    parse_importtime,
+    summarize_import_times,
+    total_us,
+)
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:        10 |         10 |     _struct
+import time:        20 |         30 |   struct
+import time:        50 |         80 | aoc
+import time:         5 |          5 |   json
+import time:        40 |         45 | aoc.y2023.d01.solution
+"""
+
+
+def test_parse_importtime():
+    times = parse_importtime(OUTPUT, "aoc.y2023.d01.solution")
+    assert times == [
+        ImportTime("_struct", 10, 10, 2),
+        ImportTime("struct", 20, 30, 1),
+        ImportTime("aoc", 50, 80, 0),
+        ImportTime("json", 5, 5, 1),
+        ImportTime("aoc.y2023.d01.solution", 40, 45, 0),
+    ]
+    assert total_us(times) == 125
+
+
+def test_summarize_import_times():
+    times = parse_importtime(OUTPUT, "aoc.y2023.d01.solution")
+    lines = summarize_import_times(times, top=2).splitlines()
+    assert lines[0] == "125 us"
+    assert lines[2].endswith("  aoc")
+    assert lines[3].endswith("  aoc.y2023.d01.solution")
+    assert len(lines) == 4
+
+
+def test_import_times():
+    times = import_times("aoc.utils.state")
+    assert times[-1].name == "aoc.utils.state"
+    assert times[-1].depth == 0
+    assert total_us(times) > 0
@@ -0,0 +1,125 @@
+import random
+
+import pytest
+from aoc.utils.intervals import Interval, IntervalSet
+
+
+def test_interval_init():
+    i = Interval(100, 200)
+    assert (i.lo, i.hi, i.last) == (100, 200, 199)
+    assert len(i) == 100
+    assert Interval.closed(100, 200) == Interval(100, 201)
+
+    # every empty interval is the same
+    assert Interval(200, 100) == Interval(5, 5) == Interval(0, 0)
+    assert not Interval(200, 100)
+    assert len(Interval(200, 100)) == 0
+
+
+def test_interval_eq():
+    assert Interval(100, 200) == Interval(100, 200)
+    assert Interval(100, 200) != Interval(200, 300)
+    assert Interval(100, 200) != Interval(0, 0)
+    assert hash(Interval(100, 200)) == hash(Interval(100, 200))
+
+
+def test_interval_contains():
+    assert 100 in Interval(100, 200)
+    assert 199 in Interval(100, 200)
+    assert 200 not in Interval(100, 200)
+
+
+def test_interval_subset():
+    assert Interval(0, 0) <= Interval(0, 0)
+    assert Interval(0, 0) <= Interval(100, 400)
+    assert Interval(200, 300) <= Interval(100, 400)
+    assert Interval(100, 400) <= Interval(100, 400)
+    assert not Interval(300, 600) <= Interval(100, 400)
+    assert not Interval(500, 600) <= Interval(100, 400)
+
+
+def test_interval_and():
+    assert Interval(100, 200) & Interval(150, 400) == Interval(150, 200)
+    assert Interval(100, 500) & Interval(100, 400) == Interval(100, 400)
+    assert not Interval(100, 200) & Interval(200, 300)
+    assert not Interval(0, 0) & Interval(100, 400)
+
+
+def test_interval_or():
+    assert Interval(100, 200) | Interval(150, 400) == IntervalSet([Interval(100, 400)])
+    # adjacent intervals coalesce
+    assert Interval(100, 200) | Interval(200, 300) == IntervalSet([Interval(100, 300)])
+    assert list(Interval(100, 200) | Interval(300, 400)) == [
+        Interval(100, 200),
+        Interval(300, 400),
+    ]
+
+
+def test_interval_sub():
+    assert Interval(100, 400) - Interval(0, 0) == IntervalSet([Interval(100, 400)])
+    assert Interval(100, 400) - Interval(100, 200) == IntervalSet([Interval(200, 400)])
+    assert Interval(100, 400) - Interval(300, 400) == IntervalSet([Interval(100, 300)])
+    assert Interval(100, 400) - Interval(0, 500) == IntervalSet()
+    assert list(Interval(100, 400) - Interval(200, 300)) == [
+        Interval(100, 200),
+        Interval(300, 400),
+    ]
+
+
+def test_interval_shift():
+    assert Interval(100, 200).shift(-50) == Interval(50, 150)
+
+
+def test_interval_split():
+    assert Interval(10, 20).split([0, 10, 12, 15, 20, 30]) == [
+        Interval(10, 12),
+        Interval(12, 15),
+        Interval(15, 20),
+    ]
+    assert Interval(10, 20).split([]) == [Interval(10, 20)]
+    assert Interval(0, 0).split([1, 2]) == []
+
+
+def test_set_coalesce():
+    s = IntervalSet([Interval(5, 8), Interval(0, 2), Interval(2, 4), Interval(6, 7)])
+    assert list(s) == [Interval(0, 4), Interval(5, 8)]
+    assert s.size == 7
+    assert s.lo == 0
+    assert 3 in s and 4 not in s and 7 in s and 8 not in s
+    assert not IntervalSet([Interval(3, 3)])
+
+
+def test_set_split():
+    s = IntervalSet([Interval(0, 4), Interval(5, 8)])
+    assert s.split([2, 6]) == [
+        Interval(0, 2),
+        Interval(2, 4),
+        Interval(5, 6),
+        Interval(6, 8),
+    ]
+
+
+def random_set(rng):
+    return IntervalSet(
+        Interval(lo, lo + rng.randint(0, 10))
+        for lo in (rng.randint(0, 100) for _ in range(rng.randint(0, 6)))
+    )
+
+
+def members(s):
+    return {v for span in s for v in range(span.lo, span.hi)}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_set_algebra(seed):
+    # check against the same operations on sets of integers
+    rng = random.Random(seed)
+    lhs, rhs = random_set(rng), random_set(rng)
+
+    assert members(lhs | rhs) == members(lhs) | members(rhs)
+    assert members(lhs & rhs) == members(lhs) & members(rhs)
+    assert members(lhs - rhs) == members(lhs) - members(rhs)
+
+    # the result is always coalesced
+    for s in (lhs | rhs, lhs & rhs, lhs - rhs):
+        assert all(a.hi < b.lo for a, b in zip(s.spans, s.spans[1:]))
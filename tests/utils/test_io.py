@@ -0,0 +1,74 @@
+import mmap
+
+import pytest
+from aoc.utils import io
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"ab,c\n\nd,ef\n")
+    return path
+
+
+def test_mapped(path):
+    with io.mapped(path) as buf:
+        assert isinstance(buf, mmap.mmap)
+        assert buf[:4] == b"ab,c"
+    assert buf.closed
+
+
+def test_mapped_view_alive(path):
+    # a view that outlives the context keeps the map open rather than failing
+    with io.mapped(path) as buf:
+        view = memoryview(buf)[:2]
+    assert bytes(view) == b"ab"
+
+
+def test_mapped_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    with io.mapped(path) as buf:
+        assert list(io.lines(buf)) == []
+
+
+@pytest.mark.parametrize(
+    "buf", [b"ab,c\n\nd,ef", b"ab,c\n\nd,ef\n", b"ab,c\r\n\r\nd,ef\r\n"]
+)
+def test_lines(buf):
+    lines = list(io.lines(buf))
+    assert all(isinstance(line, memoryview) for line in lines)
+    assert [bytes(line) for line in lines] == [b"ab,c", b"", b"d,ef"]
+
+
+def test_split(path):
+    with io.mapped(path) as buf:
+        items = [bytes(item) for item in io.split(buf, b",")]
+        blocks = [bytes(item) for item in io.split(buf, b"\n\n")]
+        assert io.count(buf, b",") == len(items)
+
+    assert items == b"ab,c\n\nd,ef\n".split(b",")
+    assert blocks == [b"ab,c", b"d,ef\n"]
+
+
+@pytest.mark.parametrize("data", [b"", b",", b"a", b"a,,b,", b"a,b,c"])
+def test_split_like_bytes(data):
+    assert [bytes(item) for item in io.split(data, b",")] == data.split(b",")
+    assert io.count(data, b",") == len(data.split(b","))
+
+
+def test_split_bounds():
+    data = b"a,b,c\n"
+    assert [bytes(item) for item in io.split(data, b",", 2, 5)] == [b"b", b"c"]
+    assert io.count(data, b",", 2, 5) == 2
+
+
+def test_frombuffer(path):
+    with io.mapped(path) as buf:
+        array = io.frombuffer(buf)
+        assert array.shape == (11,)
+        assert not array.flags.writeable
+        assert (array == ord(",")).sum() == 2
+        del array
+
+    assert io.frombuffer(b"").shape == (0,)
@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+
+import pytest
+from aoc.utils.isolation import describe_exit, isolated
+
+
+def test_isolated():
+    # the child is a different process, but sees what the parent had
+    parent = os.getpid()
+    assert isolated(lambda: (os.getpid() != parent, parent)) == (True, parent)
+
+
+def test_isolated_raises():
+    with pytest.raises(ZeroDivisionError):
+        isolated(divmod, 1, 0)
+
+
+def test_isolated_timeout():
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        isolated(time.sleep, 10, timeout=0.2)
+    assert time.perf_counter() - start < 5
+
+
+@pytest.mark.skipif(sys.platform == "darwin", reason="macOS doesn't enforce RLIMIT_AS")
+def test_isolated_memory():
+    # far beyond the limit, but well within what the test process itself maps
+    with pytest.raises(MemoryError):
+        isolated(bytearray, 2**34, memory=2**33)
+
+
+def test_isolated_crash():
+    with pytest.raises(ChildProcessError, match="SIGKILL"):
+        isolated(lambda: os.kill(os.getpid(), 9))
+
+
+def test_describe_exit():
+    assert describe_exit(-9) == "SIGKILL"
+    assert describe_exit(1) == "exit code 1"
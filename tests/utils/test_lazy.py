@@ -0,0 +1,26 @@
+import sys
+
+import pytest
+from aoc.utils.lazy import lazy_import, module_name
+
+
+def test_lazy_import(monkeypatch, capsys):
+    # importing `this` prints the Zen of Python, so it shows when the module runs
+    monkeypatch.delitem(sys.modules, "this", raising=False)
+
+    this = lazy_import("this")
+    assert sys.modules["this"] is this
+    assert module_name(this) == "this"
+    assert capsys.readouterr().out == ""
+
+    assert this.s
+    assert "Beautiful is better than ugly." in capsys.readouterr().out
+
+
+def test_lazy_import_loaded():
+    assert lazy_import("sys") is sys
+
+
+def test_lazy_import_missing():
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("no_such_module")
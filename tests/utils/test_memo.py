@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from aoc.utils.memo import AnswerStore, Memo, encode
+
+
+@pytest.fixture
+def store(tmp_path):
+    with AnswerStore(tmp_path / "answers.sqlite") as store:
+        yield store
+
+
+def test_encode():
+    assert encode(42) == "42"
+    assert encode(np.int64(42)) == "42"
+    assert encode("abc") == '"abc"'
+    assert encode(object()) is None
+
+
+def test_roundtrip(store):
+    assert store.get("key") == {}
+
+    assert store.put("key", "parse", None, 0.5)
+    assert store.put("key", "part1", np.int64(288), 1.0)
+    assert store.put("key", "part2", 71503, 2.0)
+    assert store.get("key") == {
+        "parse": Memo(None, 0.5),
+        "part1": Memo(288, 1.0),
+        "part2": Memo(71503, 2.0),
+    }
+    assert store.get("other") == {}
+
+
+def test_replace(store):
+    store.put("key", "part1", 1, 1.0)
+    store.put("key", "part1", 2, 3.0)
+    assert store.get("key") == {"part1": Memo(2, 3.0)}
+
+
+def test_unencodable(store):
+    assert not store.put("key", "part1", object(), 1.0)
+    assert store.get("key") == {}
+
+
+def test_clear(store):
+    store.put("key", "part1", 1, 1.0)
+    store.clear()
+    assert store.get("key") == {}
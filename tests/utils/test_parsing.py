@@ -0,0 +1,70 @@
+import random
+import re
+import warnings
+
+import numpy as np
+import pytest
+from aoc.utils.parsing import hexes, int_table, ints, ints_by_line
+
+
+def test_ints():
+    text = "Game 12: 3 blue, -4 red; x-5 y--6 7-8 - 9-"
+    assert ints(text, array=False) == [12, 3, -4, -5, -6, 7, -8, 9]
+    assert ints(text, negative=False, array=False) == [12, 3, 4, 5, 6, 7, 8, 9]
+
+    values = ints(text.encode())
+    assert values.dtype == np.int64
+    assert values.tolist() == [12, 3, -4, -5, -6, 7, -8, 9]
+
+
+@pytest.mark.parametrize("text", ["", "\n", "no numbers", "-", "- -"])
+def test_ints_none(text):
+    assert ints(text).shape == (0,)
+    assert ints(text, array=False) == []
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_ints_like_regex(seed):
+    rng = random.Random(seed)
+    text = "".join(rng.choice("0123456789-- \n:,ab") for _ in range(500))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert ints(text, array=False) == list(map(int, re.findall(r"-?\d+", text)))
+
+
+def test_ints_large():
+    assert ints("9223372036854775807 -9223372036854775808", array=False) == [
+        2**63 - 1,
+        -(2**63),
+    ]
+
+
+def test_ints_overflow():
+    text = "-99999999999999999999 18446744073709551616 7"
+    assert ints(text, array=False) == [-99999999999999999999, 2**64, 7]
+    assert ints(text).tolist() == [-99999999999999999999, 2**64, 7]
+
+    table = int_table("1 -99999999999999999999\n18446744073709551616 2\n")
+    assert table.tolist() == [[1, -99999999999999999999], [2**64, 2]]
+
+
+def test_ints_by_line():
+    rows = ints_by_line("1 2 3\n\n-4 x 5\n6\n")
+    assert [row.tolist() for row in rows] == [[1, 2, 3], [], [-4, 5], [6]]
+    assert ints_by_line("") == []
+
+
+def test_int_table():
+    table = int_table("0 3 6 9\n1 -3 6 10\n")
+    assert table.shape == (2, 4)
+    assert table[1].tolist() == [1, -3, 6, 10]
+
+    with pytest.raises(ValueError):
+        int_table("1 2\n3\n")
+
+
+def test_hexes():
+    text = "R 6 (#70c710)\nD 5 (#0dc571) add 0xFF"
+    assert hexes(text, array=False) == [0x70C710, 0x0DC571, 0xFF]
+    assert hexes(text).dtype == np.int64
+    assert hexes("D 5").shape == (0,)
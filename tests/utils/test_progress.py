@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+from aoc.utils import progress, reporting
+from aoc.utils.progress import Counter, counted, enable, since, snapshot
+from aoc.utils.reporting import measure, report
+
+
+@pytest.fixture
+def counting(monkeypatch):
+    monkeypatch.setattr(progress, "ENABLED", False)
+    monkeypatch.setattr(progress, "COUNTERS", {})
+    enable()
+    return progress.COUNTERS
+
+
+def total(n):
+    return sum(counted(range(n), "total"))
+
+
+def test_counted_disabled(monkeypatch):
+    monkeypatch.setattr(progress, "ENABLED", False)
+    data = [1, 2, 3]
+    # the loop gets the iterable itself, so there's nothing to slow it down
+    assert counted(data, "data") is data
+
+
+def test_counted(counting):
+    assert total(10) == 45
+    assert total(5) == 10
+    assert counting["total"].count == 15
+    assert counting["total"].loops == 2
+    assert counting["total"].seconds > 0
+
+
+def test_counted_break(counting):
+    for i in counted(range(100), "search"):
+        if i == 3:
+            break
+    assert (counting["search"].count, counting["search"].loops) == (4, 1)
+
+
+def test_since(counting):
+    total(3)
+    before = snapshot()
+    total(4)
+    counters = since(before)
+    assert [(c.name, c.count, c.loops) for c in counters] == [("total", 4, 1)]
+    assert since(snapshot()) == []
+
+
+def test_counter_str():
+    counter = Counter("rows", 2000, 0.5, 2)
+    assert counter.rate == 4000
+    assert str(counter) == "rows | 2000 iterations in 2 loop(s) | 0.500000s | 4,000/s"
+    assert Counter("rows").rate == 0
+
+
+def test_measure_counters(counting):
+    assert measure(total, 10).counters[0].count == 10
+    assert measure(total, 10, memory=True).counters[0].count == 10
+
+    enable(False)
+    assert measure(total, 10).counters == []
+
+
+def test_report_counters(caplog, counting):
+    with caplog.at_level(logging.INFO, logger=reporting.__name__):
+        assert report(total)(7) == 21
+    assert "total | total | 7 iterations in 1 loop(s)" in caplog.text
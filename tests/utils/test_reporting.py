@@ -0,0 +1,149 @@
+import logging
+import os
+import subprocess
+import sys
+import tracemalloc
+from time import process_time
+
+import pytest
+from aoc.utils import reporting
+from aoc.utils.reporting import (
+    OPTIONS,
+    configure,
+    measure,
+    profile_top,
+    report,
+    summarize_profile,
+)
+
+
+@pytest.fixture
+def options():
+    saved = vars(OPTIONS).copy()
+    yield OPTIONS
+    configure(**saved)
+
+
+def allocate(n):
+    return len(bytearray(n))
+
+
+def spin(seconds):
+    end = process_time() + seconds
+    while process_time() < end:
+        pass
+
+
+def test_measure():
+    m = measure(allocate, 10)
+    assert m.name == "allocate"
+    assert m.result == 10
+    assert m.seconds >= 0
+    assert m.peak is None
+    assert m.usage is None
+
+
+def test_measure_memory():
+    m = measure(allocate, 2**20, memory=True)
+    assert m.result == 2**20
+    assert m.peak >= 2**20
+    assert m.current < m.peak
+    assert m.usage.utime >= 0
+    assert m.usage.maxrss > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_measure_memory_nested():
+    tracemalloc.start()
+    try:
+        m = measure(allocate, 10, memory=True)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    assert m.peak is None
+    assert m.usage is not None
+
+
+def test_configure(options):
+    configure(memory=True)
+    assert options.memory
+    with pytest.raises(TypeError):
+        configure(colour=True)
+
+
+def test_profile_top(caplog, monkeypatch, options):
+    monkeypatch.setenv(reporting.PROFILE_TOP_ENV, "5")
+    assert profile_top() == 5
+    configure(top=3)
+    assert profile_top() == 3
+
+    configure(top=None)
+    monkeypatch.setenv(reporting.PROFILE_TOP_ENV, "many")
+    with caplog.at_level(logging.WARNING, logger=reporting.__name__):
+        assert profile_top() == 20
+    assert "AOC_PROFILE_TOP should be an integer" in caplog.text
+
+
+def test_import_with_bad_profile_top():
+    env = {**os.environ, reporting.PROFILE_TOP_ENV: "many"}
+    argv = [sys.executable, "-c", "import aoc.utils.reporting"]
+    assert subprocess.run(argv, env=env).returncode == 0
+
+
+def test_report(caplog, options):
+    solve = report(allocate)
+    with caplog.at_level(logging.INFO, logger=reporting.__name__):
+        assert solve(10) == 10
+    assert "allocate" in caplog.text
+    assert "peak" not in caplog.text
+
+
+def test_report_memory(caplog, options):
+    configure(memory=True)
+    solve = report(allocate)
+    with caplog.at_level(logging.INFO, logger=reporting.__name__):
+        assert solve(2**20) == 2**20
+    assert "peak 1.0 MiB" in caplog.text
+    assert "maxrss" in caplog.text
+
+
+def test_measure_profile(tmp_path):
+    path = tmp_path / "sub" / "allocate.pstats"
+    m = measure(allocate, 10, profile=path)
+    assert m.result == 10
+    assert m.profile == path
+    assert path.exists()
+    assert "allocate" in summarize_profile(path, top=5)
+
+
+def test_measure_profile_nested(tmp_path):
+    outer = tmp_path / "outer.pstats"
+    inner = tmp_path / "inner.pstats"
+    m = measure(lambda: measure(allocate, 10, profile=inner), profile=outer)
+    assert m.profile == outer
+    assert m.result.profile is None
+    assert not inner.exists()
+
+
+def test_report_profile(caplog, options, tmp_path):
+    configure(profile=tmp_path, top=3)
+    solve = report(allocate)
+    with caplog.at_level(logging.INFO, logger=reporting.__name__):
+        assert solve(10) == 10
+    path = tmp_path / f"{__name__}.allocate.pstats"
+    assert path.exists()
+    assert "cumulative" in caplog.text
+
+
+def test_measure_profile_sampling(tmp_path):
+    path = tmp_path / "spin.collapsed"
+    m = measure(spin, 0.05, profile=path, profiler="sampling")
+    assert m.profile == path
+    assert "spin" in path.read_text()
+    assert "samples" in summarize_profile(path)
+
+
+def test_measure_profile_unknown(tmp_path):
+    with pytest.raises(ValueError):
+        measure(allocate, 10, profile=tmp_path / "x", profiler="nope")
@@ -0,0 +1,78 @@
+import signal
+import threading
+from time import process_time
+
+import pytest
+from aoc.utils.sampling import Sampler, summarize_collapsed
+
+
+def spin(seconds):
+    end = process_time() + seconds
+    while process_time() < end:
+        pass
+
+
+def busy(seconds):
+    spin(seconds)
+
+
+def test_sampler():
+    with Sampler(interval=0.001) as sampler:
+        busy(0.05)
+
+    assert sampler.samples > 0
+    assert signal.getsignal(signal.SIGPROF) is signal.SIG_DFL
+    assert any(
+        stack.endswith(f"{__name__}:busy;{__name__}:spin") for stack in sampler.stacks
+    )
+    assert not any("Sampler._sample" in stack for stack in sampler.stacks)
+
+
+def test_sampler_collapsed(tmp_path):
+    sampler = Sampler()
+    sampler.stacks.update({"a;b": 2, "a;c": 1})
+    assert sampler.collapsed() == "a;b 2\na;c 1\n"
+
+    path = tmp_path / "sub" / "out.collapsed"
+    sampler.write(path)
+    assert path.read_text() == sampler.collapsed()
+
+
+def test_sampler_other_thread():
+    started = threading.Event()
+    stop = threading.Event()
+
+    def work():
+        started.set()
+        while not stop.is_set():
+            pass
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    started.wait()
+    try:
+        with Sampler(interval=0.001, thread=thread.ident) as sampler:
+            spin(0.05)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert sampler.samples > 0
+    assert all("work" in stack for stack in sampler.stacks)
+
+
+def test_summarize_collapsed(tmp_path):
+    path = tmp_path / "out.collapsed"
+    path.write_text("main;f;g 3\nmain;f;f 1\nmain;h 2\n")
+
+    lines = summarize_collapsed(path, top=2).splitlines()
+    assert lines[0] == "6 samples"
+    assert lines[2].split() == ["6", "0", "main"]
+    assert lines[3].split() == ["4", "1", "f"]
+
+
+@pytest.mark.parametrize("interval", [0.001, 0.005])
+def test_sampler_interval(interval):
+    sampler = Sampler(interval=interval)
+    assert sampler.interval == interval
+    assert sampler.samples == 0
@@ -0,0 +1,8 @@
+from aoc.utils.state import state_path
+
+
+def test_state_path(state_dir):
+    path = state_path("a", "b.txt")
+    assert path == state_dir / "a" / "b.txt"
+    assert path.parent.is_dir()
+    assert not path.exists()
@@ -27,3 +27,9 @@ def test_solve_part1_ex01(ex01_data):
 
 def test_solve_part2_ex01(ex01_data):
     assert solve_part2(ex01_data) == 30
+
+
+def test_parse_repeats(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("Card 1: 5 5 7 | 5 8 5\nCard 2: 1 2 3 | 4 5 6\n")
+    assert parse(path) == [(1, 1), (2, 0)]
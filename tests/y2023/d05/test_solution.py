@@ -27,3 +27,9 @@ def test_solve_part1_ex01(ex01_data):
 
 def test_solve_part2_ex01(ex01_data):
     assert solve_part2(ex01_data) == 46
+
+
+# guards the interval splitting keeps part 2 from enumerating the seeds
+@pytest.mark.perf(part=2, scale=50, max_seconds=0.1, max_mib=1)
+def test_perf_part2(perf):
+    assert perf.answer == 297036
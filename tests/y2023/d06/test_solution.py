@@ -1,7 +1,7 @@
 from pathlib import Path
 
 import pytest
-from aoc.y2023.d06.solution import parse, solve_part1, solve_part2
+from aoc.y2023.d06.solution import parse, solve_part1, solve_part2, wins_slow
 
 DATA = Path(__file__).parent / "data"
 
@@ -27,3 +27,14 @@ def test_solve_part1_ex01(ex01_data):
 
 def test_solve_part2_ex01(ex01_data):
     assert solve_part2(ex01_data) == 71503
+
+
+def test_solve_slow_ex01(ex01_data):
+    assert solve_part1(ex01_data, wins=wins_slow) == 288
+    assert solve_part2(ex01_data, wins=wins_slow) == 71503
+
+
+# guards the quadratic roots of wins_fast, rather than trying every hold time
+@pytest.mark.perf(part=2, scale=100, max_seconds=0.01, max_mib=1)
+def test_perf_part2(perf):
+    assert perf.answer == 6287033120437623
@@ -1,7 +1,7 @@
 from pathlib import Path
 
-import numpy.typing as typing
 import pytest
+from aoc.utils.grid import Grid
 from aoc.y2023.d11.solution import parse, solve_part1, solve_part2
 
 DATA = Path(__file__).parent / "data"
@@ -26,7 +26,7 @@ def example_data(example_path):
 @pytest.mark.example_path("ex01.txt")
 def test_parse_ex01(example_path):
     data = parse(example_path)
-    assert isinstance(data, typing.ArrayLike)
+    assert isinstance(data, Grid)
     assert data.shape == (10, 10)
 
 
@@ -48,3 +48,9 @@ def test_solve_part2_ex01_m10(example_data):
 @pytest.mark.example_path("ex01.txt")
 def test_solve_part2_ex01_m100(example_data):
     assert solve_part2(example_data, 100) == 8410
+
+
+# guards expanding by the prefix sums of empty rows and columns, not the image
+@pytest.mark.perf(part=2, scale=10, max_seconds=0.1, max_mib=50)
+def test_perf_part2(perf):
+    assert perf.answer == 2322495850023
@@ -25,10 +25,8 @@ def example_data(example_path):
 @pytest.mark.example_path("ex01.txt")
 def test_parse_ex01(example_path):
     costs = parse(example_path)
-    assert len(costs) == 13 * 13
-    assert min(costs) == (0, 0)
-    assert max(costs) == (12, 12)
-    assert all([1 <= s <= 9 for s in costs.values()])
+    assert costs.shape == (13, 13)
+    assert all([ord("1") <= s <= ord("9") for s in costs.cells.flat])
 
 
 @pytest.mark.example_path("ex01.txt")
@@ -44,3 +42,15 @@ def test_solve_part2_ex01(example_data):
 @pytest.mark.example_path("ex02.txt")
 def test_solve_part2_ex02(example_data):
     assert solve_part2(example_data) == 71
+
+
+# guards Dial's buckets, rather than a heap, for the small edge weights
+@pytest.mark.perf(part=1, scale=8, max_seconds=2.0, max_mib=10)
+def test_perf_part1(perf):
+    assert perf.answer == 679
+
+
+@pytest.mark.example_path("ex01.txt")
+def test_solve_heap_ex01(example_data):
+    assert solve_part1(example_data, queue="heap") == 102
+    assert solve_part2(example_data, queue="heap") == 94
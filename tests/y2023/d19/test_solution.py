@@ -2,11 +2,11 @@ import sys
 from pathlib import Path
 
 import pytest
+from aoc.utils.intervals import Interval, IntervalSet
 from aoc.y2023.d19.solution import (
     Condition,
     Part,
     Parts,
-    PartsBlock,
     Rule,
     Workflow,
     parse,
@@ -60,86 +60,26 @@ def test_parts():
     assert len(p) == 5
 
 
-def test_block_init_empty():
-    b = PartsBlock()
-    assert b.lower is None
-    assert b.upper is None
-
-
-def test_block_init_value():
-    b = PartsBlock(100, 200)
-    assert b.lower == 100
-    assert b.upper == 200
-
-
-def test_block_init_error():
-    with pytest.raises(AssertionError):
-        _ = PartsBlock(200, 100)
-
-
-def test_block_eq():
-    assert PartsBlock() == PartsBlock()
-    assert PartsBlock(100, 200) == PartsBlock(100, 200)
-    assert PartsBlock(100, 200) != PartsBlock(200, 300)
-    assert PartsBlock(100, 200) != PartsBlock()
-    assert PartsBlock() != PartsBlock(100, 200)
-
-
-def test_block_lt():
-    assert PartsBlock() < PartsBlock()
-    assert PartsBlock() < PartsBlock(100, 400)
-    assert PartsBlock(200, 300) < PartsBlock(100, 400)
-    assert PartsBlock(100, 300) < PartsBlock(100, 400)
-    assert PartsBlock(200, 400) < PartsBlock(100, 400)
-    assert not PartsBlock(300, 600) < PartsBlock(100, 400)
-    assert not PartsBlock(400, 600) < PartsBlock(100, 400)
-    assert not PartsBlock(500, 600) < PartsBlock(100, 400)
-
-
-def test_block_and():
-    assert PartsBlock() & PartsBlock() == PartsBlock()
-    assert PartsBlock() & PartsBlock(100, 400) == PartsBlock(100, 400)
-    assert PartsBlock(100, 200) & PartsBlock(100, 400) == PartsBlock(100, 400)
-    assert PartsBlock(100, 400) & PartsBlock(100, 400) == PartsBlock(100, 400)
-    assert PartsBlock(100, 500) & PartsBlock(100, 400) == PartsBlock(100, 500)
-    assert PartsBlock(400, 500) & PartsBlock(100, 400) == PartsBlock(100, 500)
-
-
-def test_block_or():
-    assert PartsBlock() | PartsBlock() == PartsBlock()
-    assert PartsBlock() | PartsBlock(100, 400) == PartsBlock()
-    assert PartsBlock(100, 200) | PartsBlock(100, 400) == PartsBlock(100, 200)
-    assert PartsBlock(100, 400) | PartsBlock(100, 400) == PartsBlock(100, 400)
-    assert PartsBlock(100, 500) | PartsBlock(100, 400) == PartsBlock(100, 400)
-    assert PartsBlock(400, 500) | PartsBlock(100, 400) == PartsBlock(400, 400)
-
-
-def test_block_sub():
-    assert PartsBlock() - PartsBlock() == PartsBlock()
-    assert PartsBlock() - PartsBlock(100, 400) == PartsBlock()
-    assert PartsBlock(100, 400) - PartsBlock() == PartsBlock(100, 400)
-    assert PartsBlock(100, 400) - PartsBlock(100, 199) == PartsBlock(200, 400)
-    assert PartsBlock(100, 400) - PartsBlock(300, 400) == PartsBlock(100, 299)
-
-
 @pytest.mark.parametrize(
     "input, value",
     [
-        ("x<100", ("x", PartsBlock(1, 99))),
-        ("m<100", ("m", PartsBlock(1, 99))),
-        ("m>100", ("m", PartsBlock(101, sys.maxsize))),
-        ("m>200", ("m", PartsBlock(201, sys.maxsize))),
+        ("x<100", ("x", Interval.closed(1, 99))),
+        ("m<100", ("m", Interval.closed(1, 99))),
+        ("m>100", ("m", Interval.closed(101, sys.maxsize))),
+        ("m>200", ("m", Interval.closed(201, sys.maxsize))),
     ],
 )
 def test_condition(input, value):
     c = Condition.parse(input)
     assert c.key == value[0]
     assert c.block == value[1]
+    assert not c.block & c.rest
+    assert c.block | c.rest == IntervalSet([Condition.BLOCK])
 
 
 @pytest.fixture
 def default_blocks():
-    return dict({c: PartsBlock(1, 4000) for c in "xmas"})
+    return dict({c: Interval.closed(1, 4000) for c in "xmas"})
 
 
 def test_condition_combo_empty(default_blocks):
@@ -151,7 +91,7 @@ def test_condition_combo_empty(default_blocks):
 def test_condition_combo_disjoint(default_blocks):
     c = Condition.parse("x>4000")
     lhs, rhs = c.combo(default_blocks)
-    assert lhs["x"].isempty()
+    assert not lhs["x"]
     assert rhs["x"] == default_blocks["x"]
 
 
@@ -159,23 +99,23 @@ def test_condition_combo_cover(default_blocks):
     c = Condition.parse("x>0")
     lhs, rhs = c.combo(default_blocks)
     assert lhs["x"] == default_blocks["x"]
-    assert rhs["x"].isempty()
+    assert not rhs["x"]
 
 
 def test_condition_combo_split(default_blocks):
     c = Condition.parse("x>1000")
     lhs, rhs = c.combo(default_blocks)
-    assert lhs["x"] == PartsBlock(1001, 4000)
-    assert rhs["x"] == PartsBlock(1, 1000)
+    assert lhs["x"] == Interval.closed(1001, 4000)
+    assert rhs["x"] == Interval.closed(1, 1000)
 
 
 @pytest.mark.parametrize(
     "input, value",
     [
-        ("x<100:A", ("x", PartsBlock(1, 99), "A")),
-        ("x<100:R", ("x", PartsBlock(1, 99), "R")),
-        ("x<100:foo", ("x", PartsBlock(1, 99), "foo")),
-        ("x<100:bar", ("x", PartsBlock(1, 99), "bar")),
+        ("x<100:A", ("x", Interval.closed(1, 99), "A")),
+        ("x<100:R", ("x", Interval.closed(1, 99), "R")),
+        ("x<100:foo", ("x", Interval.closed(1, 99), "foo")),
+        ("x<100:bar", ("x", Interval.closed(1, 99), "bar")),
     ],
 )
 def test_rule(input, value):
@@ -189,8 +129,8 @@ def test_rule_combo(default_blocks):
     r = Rule.parse("x<100:A")
     key, lhs, rhs = r.combo(default_blocks)
     assert key == "A"
-    assert lhs["x"] == PartsBlock(1, 99)
-    assert rhs["x"] == PartsBlock(100, 4000)
+    assert lhs["x"] == Interval.closed(1, 99)
+    assert rhs["x"] == Interval.closed(100, 4000)
 
 
 @pytest.mark.parametrize(
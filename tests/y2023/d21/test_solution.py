@@ -184,3 +184,9 @@ def test_solve_part2_ex01(example_data, steps, plots):
 
     example_data.infinite = True
     assert solve_part1(example_data, steps) == plots
+
+
+# guards extrapolating the quadratic, rather than stepping 26501365 times
+@pytest.mark.perf(part=2, scale=2, max_seconds=0.25, max_mib=5)
+def test_perf_part2(perf):
+    assert perf.answer == 629063993930929